@@ -0,0 +1,80 @@
+import argparse
+import logging
+import sys
+import warnings
+from pathlib import Path
+
+# Adiciona o diretório atual ao PYTHONPATH usando Path
+current_dir = Path(__file__).resolve().parent
+sys.path.append(str(current_dir))
+
+from src.data.backfill import backfill_history
+from src.data.snapshot_cache import DEFAULT_CACHE_DIR
+
+warnings.filterwarnings("ignore")
+
+
+def parse_args():
+    """Lê os argumentos da linha de comando."""
+    parser = argparse.ArgumentParser(
+        description="Ingere em paralelo as exportações antigas do SAM no histórico."
+    )
+    parser.add_argument(
+        "directories",
+        nargs="*",
+        default=[str(current_dir / "downloads")],
+        help="Diretórios com os arquivos xlsx (padrão: downloads)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Processos (padrão: nº de CPUs)"
+    )
+    parser.add_argument(
+        "--store-dir",
+        default=DEFAULT_CACHE_DIR,
+        help="Diretório dos bancos de histórico",
+    )
+    parser.add_argument(
+        "--cache-dir", default=DEFAULT_CACHE_DIR, help="Diretório do cache colunar"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Não grava no cache colunar"
+    )
+    parser.add_argument(
+        "--pattern",
+        action="append",
+        dest="patterns",
+        help="Padrão do FileManager (pode repetir; padrão: todos)",
+    )
+    return parser.parse_args()
+
+
+def print_progress(done, total, info):
+    """Mostra o andamento do backfill em uma linha por arquivo."""
+    if info["error"]:
+        status = f"ERRO: {info['error']}"
+    else:
+        status = f"{info['seconds']:.1f}s"
+    print(f"[{done}/{total}] {info['file']} - {status}", flush=True)
+
+
+def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
+
+    summary = backfill_history(
+        args.directories,
+        store_dir=args.store_dir,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        workers=args.workers,
+        pattern_keys=args.patterns,
+        progress=print_progress,
+    )
+    print(
+        f"\nConcluído: {summary['ingested']} de {summary['total']} exportações "
+        f"gravadas, {summary['errors']} erros, {summary['elapsed']:.1f}s"
+    )
+    return 1 if summary["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
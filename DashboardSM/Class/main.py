@@ -36,6 +36,7 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(current_dir)
 
 # Imports dos módulos locais
+from src.dashboard.dashboard_state import is_reloader_parent
 from src.dashboard.ssa_dashboard import SSADashboard
 from src.data.data_loader import DataLoader
 from src.data.ssa_data import SSAData
@@ -102,6 +103,10 @@ def load_configuration():
         "HOST": "0.0.0.0",
         "LOG_LEVEL": "INFO",
         "AUTO_RELOAD_INTERVAL": 5 * 60 * 1000,  # 5 minutos em milissegundos
+        "RESULT_CACHE_MB": 64,  # Cache das saídas dos gráficos por filtro
+        "CLIENTSIDE_COUNTS": False,  # Cards e contagens recalculados no navegador
+        # Colunas de baixa cardinalidade como Categorical (menos memória)
+        "COMPACT": os.environ.get("SSA_COMPACT", "0") == "1",
     }
     return config
 
@@ -125,12 +130,26 @@ def initialize_dashboard(config):
 
         # Carrega os dados
         logger.info("Iniciando carregamento dos dados...")
-        loader = DataLoader(config["DATA_FILE_PATH"])
+        loader = DataLoader(config["DATA_FILE_PATH"], compact=config["COMPACT"])
         df = loader.load_data()
         logger.info(f"Dados carregados com sucesso. Total de SSAs: {len(df)}")
 
         # Cria e configura o dashboard
-        dashboard = SSADashboard(df)
+        dashboard = SSADashboard(
+            df,
+            source_path=config["DATA_FILE_PATH"],
+            cache_max_bytes=config["RESULT_CACHE_MB"] * 1024 * 1024,
+            clientside_counts=config["CLIENTSIDE_COUNTS"],
+        )
+
+        # Recarrega em segundo plano quando surgir uma exportação nova (no
+        # modo debug, só no processo filho do reloader do Werkzeug)
+        if not is_reloader_parent(config["DEBUG"]):
+            dashboard.start_watcher(
+                file_manager,
+                interval=config["AUTO_RELOAD_INTERVAL"] / 1000,
+                loader=loader,
+            )
 
         return dashboard
 
@@ -29,6 +29,7 @@ current_dir = Path(__file__).resolve().parent
 sys.path.append(str(current_dir))
 
 # Imports dos módulos locais
+from src.dashboard.dashboard_state import is_reloader_parent
 from src.dashboard.ssa_dashboard import SSADashboard
 from src.data.data_loader import DataLoader
 from src.utils.file_manager import FileManager
@@ -37,6 +38,9 @@ from src.utils.log_manager import LogManager
 # Configurações globais
 warnings.filterwarnings("ignore")
 
+# SSA_COMPACT=1 carrega as colunas de baixa cardinalidade como Categorical
+COMPACT = os.environ.get("SSA_COMPACT", "0") == "1"
+
 def setup_logging():
     """Configura o sistema de logging."""
     log_dir = Path("logs")
@@ -94,12 +98,17 @@ def main():
         """)
 
         print("\nIniciando carregamento dos dados...")
-        loader = DataLoader(DATA_FILE_PATH)
+        loader = DataLoader(DATA_FILE_PATH, compact=COMPACT)
         df = loader.load_data()
         print(f"Dados carregados com sucesso. Total de SSAs: {len(df)}")
         
         print("\nIniciando dashboard...")
-        app = SSADashboard(df)
+        app = SSADashboard(df, source_path=str(DATA_FILE_PATH))
+        debug = True
+        # Com debug o reloader do Werkzeug executa este script duas vezes;
+        # o watcher fica só no processo que atende as requisições
+        if not is_reloader_parent(debug):
+            app.start_watcher(file_manager, loader=loader)
         
         port = get_available_port(8080)
         
@@ -110,7 +119,7 @@ Data: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}
 Pressione CTRL+C para encerrar.
         """)
         
-        app.run_server(debug=True, port=port)
+        app.run_server(debug=debug, port=port)
         
     except Exception as e:
         logging.error(f"Erro ao iniciar aplicação: {str(e)}")
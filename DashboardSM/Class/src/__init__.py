@@ -5,6 +5,7 @@ Módulo principal do Dashboard SSA.
 from .dashboard.ssa_dashboard import SSADashboard
 from .data.data_loader import DataLoader
 from .data.ssa_data import SSAData
+from .data.ssa_table import SSATable
 from .data.ssa_columns import SSAColumns
 from .utils.log_manager import LogManager
 from .utils.date_utils import diagnose_dates
@@ -15,6 +16,7 @@ __all__ = [
     "SSADashboard",
     "DataLoader",
     "SSAData",
+    "SSATable",
     "SSAColumns",
     "LogManager",
     "diagnose_dates",
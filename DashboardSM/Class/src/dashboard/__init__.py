@@ -5,5 +5,19 @@ Módulo do dashboard do SSA.
 from .ssa_dashboard import SSADashboard
 from .ssa_visualizer import SSAVisualizer
 from .kpi_calculator import KPICalculator
+from .dashboard_state import (
+    DashboardState,
+    DatasetWatcher,
+    SharedDatasetWatcher,
+    is_reloader_parent,
+)
 
-__all__ = ["SSADashboard", "SSAVisualizer", "KPICalculator"]
+__all__ = [
+    "SSADashboard",
+    "SSAVisualizer",
+    "KPICalculator",
+    "DashboardState",
+    "DatasetWatcher",
+    "SharedDatasetWatcher",
+    "is_reloader_parent",
+]
@@ -0,0 +1,113 @@
+# src/dashboard/chart_groups.py
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .filter_index import group_positions
+from ..data.ssa_columns import SSAColumns
+
+# Tipo de gráfico -> coluna das categorias (eixo x)
+CHART_COLUMNS = {
+    "resp_prog": SSAColumns.RESPONSAVEL_PROGRAMACAO,
+    "resp_exec": SSAColumns.RESPONSAVEL_EXECUCAO,
+    "state": SSAColumns.SITUACAO,
+    "week_programmed": SSAColumns.SEMANA_PROGRAMADA,
+    "week_registration": SSAColumns.SEMANA_CADASTRO,
+}
+
+# Gráficos de semana: a categoria é comparada como texto e, nas barras
+# empilhadas, também pela prioridade (nome da série)
+WEEK_CHARTS = {"week_programmed", "week_registration"}
+
+
+class ChartGroups:
+    """
+    Números das SSAs de cada barra dos gráficos, para um DataFrame filtrado.
+
+    Cada agrupamento (por responsável, estado, semana ou semana e
+    prioridade) é calculado uma única vez, em uma passada sobre o
+    DataFrame, e reaproveitado por todos os gráficos do callback.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Args:
+            df: DataFrame (já filtrado) usado pelos gráficos
+        """
+        self.df = df
+        self._numbers: Optional[np.ndarray] = None
+        self._groups: Dict[Tuple[int, ...], Dict] = {}
+
+    def _grouped(self, columns: Tuple[int, ...]) -> Dict:
+        if columns not in self._groups:
+            self._groups[columns] = group_positions(
+                *(self.df.iloc[:, column] for column in columns)
+            )
+        return self._groups[columns]
+
+    def _positions(
+        self, chart_type: str, category, trace_name=None
+    ) -> Optional[np.ndarray]:
+        """Posições das linhas de uma barra, ou None sem detalhamento."""
+        column = CHART_COLUMNS.get(chart_type)
+        if column is None:
+            return None
+
+        if chart_type in WEEK_CHARTS:
+            category = str(category)
+            if trace_name:
+                columns = (column, SSAColumns.GRAU_PRIORIDADE_EMISSAO)
+                category = (category, trace_name)
+            else:
+                columns = (column,)
+        else:
+            columns = (column,)
+
+        positions = self._grouped(columns).get(category)
+        if positions is None:
+            return np.empty(0, dtype=np.intp)
+        return positions
+
+    def _ssa_numbers(self) -> np.ndarray:
+        if self._numbers is None:
+            self._numbers = self.df.iloc[:, SSAColumns.NUMERO_SSA].to_numpy()
+        return self._numbers
+
+    def ssas(self, chart_type: str, category, trace_name=None) -> Optional[List]:
+        """
+        Lista as SSAs de uma barra, na ordem do DataFrame.
+
+        Args:
+            chart_type: Tipo do gráfico (ver CHART_COLUMNS)
+            category: Valor da barra no eixo x
+            trace_name: Nome da série (prioridade, nos gráficos de semana)
+
+        Returns:
+            Números das SSAs, ou None se o tipo de gráfico não tiver detalhamento
+        """
+        positions = self._positions(chart_type, category, trace_name)
+        if positions is None:
+            return None
+        return self._ssa_numbers()[positions].tolist()
+
+    def preview(
+        self, chart_type: str, category, trace_name=None, size: int = 5
+    ) -> Optional[Tuple[int, List]]:
+        """
+        Conta as SSAs de uma barra e lista só as primeiras, para o hover.
+
+        Args:
+            chart_type: Tipo do gráfico (ver CHART_COLUMNS)
+            category: Valor da barra no eixo x
+            trace_name: Nome da série (prioridade, nos gráficos de semana)
+            size: Quantidade de SSAs listadas
+
+        Returns:
+            Tupla (total de SSAs, primeiros números), ou None se o tipo de
+            gráfico não tiver detalhamento
+        """
+        positions = self._positions(chart_type, category, trace_name)
+        if positions is None:
+            return None
+        return len(positions), self._ssa_numbers()[positions[:size]].tolist()
@@ -0,0 +1,153 @@
+# src/dashboard/clientside_counts.py
+from typing import Dict
+
+from .filter_index import FILTER_COLUMNS
+from .ssa_cube import SSACube
+
+# Dimensões da tabela enviada ao navegador: os quatro filtros e o estado
+COUNT_DIMENSIONS = list(FILTER_COLUMNS) + ["situacao"]
+
+# Gráficos recalculados no navegador: tipo do gráfico -> dimensão contada
+CLIENTSIDE_CHARTS = {
+    "resp_prog": "resp_prog",
+    "resp_exec": "resp_exec",
+    "state": "situacao",
+}
+
+# Saídas que deixam de ser calculadas no servidor no modo clientside
+CLIENTSIDE_OUTPUTS = {"cards", *CLIENTSIDE_CHARTS}
+
+
+def count_table(cube: SSACube, version: int) -> Dict:
+    """
+    Monta a tabela de contagens enviada ao navegador.
+
+    Cada célula é uma combinação de responsáveis, setores e estado com a
+    quantidade de SSAs e a posição da primeira delas (para desempatar as
+    barras na ordem de aparição). O formato é colunar para ficar pequeno
+    no JSON.
+
+    Args:
+        cube: SSACube da versão dos dados
+        version: Versão dos dados (vai nas chaves das barras)
+
+    Returns:
+        Dict serializável com values, codes, count e first por célula
+    """
+    codes, counts, first_rows = cube.marginal(COUNT_DIMENSIONS)
+    return {
+        "version": version,
+        "values": {dim: list(cube.values[dim]) for dim in COUNT_DIMENSIONS},
+        "codes": {
+            dim: codes[:, index].tolist() for index, dim in enumerate(COUNT_DIMENSIONS)
+        },
+        "count": counts.tolist(),
+        "first": first_rows.tolist(),
+    }
+
+
+# Seleção das células pelos filtros (trecho comum às funções abaixo).
+# Valores que não estão na tabela recebem o código -2, que não casa com
+# nenhuma célula (-1 é o código de valor vazio).
+_SELECT_CELLS = """
+    var filters = [respProg, respExec, setorEmissor, setorExecutor];
+    var dims = ["resp_prog", "resp_exec", "setor_emissor", "setor_executor"];
+    var wanted = dims.map(function (dim, i) {
+        if (!filters[i]) { return null; }
+        var code = table.values[dim].indexOf(filters[i]);
+        return code < 0 ? -2 : code;
+    });
+    function selected(cell) {
+        for (var i = 0; i < dims.length; i++) {
+            if (wanted[i] !== null && table.codes[dims[i]][cell] !== wanted[i]) {
+                return false;
+            }
+        }
+        return true;
+    }
+"""
+
+_CHART_FUNCTION = (
+    """
+function (respProg, respExec, setorEmissor, setorExecutor, table, figure) {
+    if (!table || !figure) { return window.dash_clientside.no_update; }
+"""
+    + _SELECT_CELLS
+    + """
+    var codes = table.codes["__DIMENSION__"];
+    var totals = {}, first = {};
+    for (var cell = 0; cell < table.count.length; cell++) {
+        var code = codes[cell];
+        if (code < 0 || !selected(cell)) { continue; }
+        totals[code] = (totals[code] || 0) + table.count[cell];
+        first[code] = code in first
+            ? Math.min(first[code], table.first[cell]) : table.first[cell];
+    }
+    var order = Object.keys(totals).map(Number).sort(function (a, b) {
+        return totals[b] - totals[a] || first[a] - first[b];
+    });
+    var x = order.map(function (code) { return table.values["__DIMENSION__"][code]; });
+    var y = order.map(function (code) { return totals[code]; });
+    var base = (figure.data && figure.data[0]) || {type: "bar"};
+    var trace = Object.assign({}, base, {
+        x: x,
+        y: y,
+        text: y,
+        hovertext: x.map(function (cat, i) {
+            return "<b>" + cat + "</b><br>Total SSAs: " + y[i]
+                + "<br>Clique para ver as SSAs";
+        }),
+        customdata: x.map(function (cat) {
+            return ["__CHART__", cat, null, table.version];
+        })
+    });
+    return Object.assign({}, figure, {data: [trace]});
+}
+"""
+)
+
+CARDS_FUNCTION = (
+    """
+function (respProg, respExec, setorEmissor, setorExecutor, table) {
+    var noUpdate = window.dash_clientside.no_update;
+    if (!table) { return [noUpdate, noUpdate, noUpdate]; }
+"""
+    + _SELECT_CELLS
+    + """
+    var codes = table.codes["situacao"];
+    var total = 0, byState = {};
+    for (var cell = 0; cell < table.count.length; cell++) {
+        if (!selected(cell)) { continue; }
+        total += table.count[cell];
+        if (codes[cell] >= 0) {
+            var state = table.values["situacao"][codes[cell]];
+            byState[state] = (byState[state] || 0) + table.count[cell];
+        }
+    }
+    var outputs = window.dash_clientside.callback_context.outputs_list[0];
+    var counts = outputs.map(function (output) {
+        return output.id.state === "TOTAL" ? total : (byState[output.id.state] || 0);
+    });
+    var percentages = counts.map(function (value) {
+        return "(" + (total > 0 ? value / total * 100 : 0).toFixed(1) + "%)";
+    });
+    return [counts.map(String), percentages, {display: "block"}];
+}
+"""
+)
+
+
+def chart_function(chart_type: str) -> str:
+    """
+    Código JavaScript do callback clientside de um gráfico de contagem.
+
+    Args:
+        chart_type: Tipo do gráfico (ver CLIENTSIDE_CHARTS)
+
+    Returns:
+        Função que recebe os filtros, a tabela de contagens e a figura atual
+        e devolve a figura com as barras recalculadas
+    """
+    return _CHART_FUNCTION.replace(
+        "__DIMENSION__", CLIENTSIDE_CHARTS[chart_type]
+    ).replace("__CHART__", chart_type)
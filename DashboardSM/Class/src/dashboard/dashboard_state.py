@@ -0,0 +1,278 @@
+# src/dashboard/dashboard_state.py
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+from .chart_groups import ChartGroups
+from .filter_index import FILTER_COLUMNS, FilterIndex
+from .kpi_calculator import KPICalculator
+from .ssa_cube import SSACube
+from .ssa_visualizer import SSAVisualizer
+from ..data.data_loader import DataLoader
+from ..data.iso_weeks import SSAWeeks
+from ..data.shared_dataset import SharedDataset
+from ..data.snapshot_diff import SnapshotDiff
+from ..utils.file_manager import FileManager
+
+
+# Visões filtradas mantidas por versão dos dados
+MAX_FILTERED_VIEWS = 16
+
+
+@dataclass(frozen=True)
+class FilteredView:
+    """DataFrame filtrado e os objetos derivados dele, compartilhados pelos callbacks."""
+
+    filters: Tuple
+    df: pd.DataFrame
+    visualizer: SSAVisualizer
+    groups: ChartGroups
+    # Saída do dashboard -> Future do cálculo em andamento (SSADashboard)
+    outputs: Dict = field(default_factory=dict, repr=False, compare=False)
+    lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    @property
+    def where(self) -> Dict:
+        """Filtros da visão como dimensões do SSACube."""
+        return dict(zip(FILTER_COLUMNS, self.filters))
+
+
+@dataclass(frozen=True)
+class DashboardState:
+    """
+    Conjunto imutável de dados servido pelo dashboard em uma versão.
+
+    Os callbacks leem o estado uma única vez no início e usam essa mesma
+    referência até o fim, então uma troca de versão no meio de uma
+    requisição não mistura dados antigos e novos.
+    """
+
+    version: int
+    df: pd.DataFrame
+    visualizer: SSAVisualizer
+    kpi_calc: KPICalculator
+    loaded_at: datetime
+    source_path: Optional[str] = None
+    diff: Optional[SnapshotDiff] = None
+    aggregates: Dict = field(default_factory=dict)
+    filter_index: Optional[FilterIndex] = None
+    cube: Optional[SSACube] = None
+    weeks: Optional[SSAWeeks] = None
+    _views: "OrderedDict[Tuple, FilteredView]" = field(
+        default_factory=OrderedDict, repr=False, compare=False
+    )
+    _views_lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    @property
+    def week_analyzer(self):
+        return self.visualizer.week_analyzer
+
+    def filtered_view(
+        self, resp_prog=None, resp_exec=None, setor_emissor=None, setor_executor=None
+    ) -> FilteredView:
+        """
+        Retorna a visão dos dados para os filtros selecionados.
+
+        A visão é calculada uma vez por combinação de filtros e reaproveitada
+        por todos os callbacks (gráficos, cards, tabela e modal) dessa
+        versão; as menos usadas são descartadas após MAX_FILTERED_VIEWS.
+        """
+        filters = (resp_prog, resp_exec, setor_emissor, setor_executor)
+        with self._views_lock:
+            view = self._views.get(filters)
+            if view is not None:
+                self._views.move_to_end(filters)
+                return view
+
+            positions = self.filter_index.positions(
+                resp_prog=resp_prog,
+                resp_exec=resp_exec,
+                setor_emissor=setor_emissor,
+                setor_executor=setor_executor,
+            )
+            if positions is None:
+                df, weeks = self.df, self.weeks
+            else:
+                df = self.df.take(positions)
+                weeks = self.weeks.take(positions) if self.weeks else None
+            view = FilteredView(
+                filters=filters,
+                df=df,
+                visualizer=SSAVisualizer(df, weeks),
+                groups=ChartGroups(df),
+            )
+            self._views[filters] = view
+            if len(self._views) > MAX_FILTERED_VIEWS:
+                self._views.popitem(last=False)
+            return view
+
+
+def is_reloader_parent(debug: bool) -> bool:
+    """
+    Indica se este é o processo que só vigia o código no modo debug.
+
+    Com debug=True o run_server do Dash usa o reloader do Werkzeug: o
+    script roda duas vezes, e só o processo filho (WERKZEUG_RUN_MAIN=true)
+    atende as requisições. Threads em segundo plano, como o DatasetWatcher,
+    devem ser iniciadas só nele.
+    """
+    return debug and os.environ.get("WERKZEUG_RUN_MAIN") != "true"
+
+
+class DatasetWatcher(threading.Thread):
+    """
+    Thread que acompanha a pasta de downloads e recarrega os dados.
+
+    A cada intervalo consulta FileManager.get_latest_file; quando surge um
+    arquivo novo (ou o atual muda), carrega os dados com o DataLoader fora
+    do caminho das requisições e entrega o resultado para on_load.
+    """
+
+    def __init__(
+        self,
+        file_manager: FileManager,
+        on_load: Callable[[pd.DataFrame, str, Optional[SnapshotDiff]], None],
+        pattern_key: str = "ssa_pendentes",
+        interval: float = 300.0,
+        current_path: Optional[str] = None,
+        loader: Optional[DataLoader] = None,
+        loader_kwargs: Optional[Dict] = None,
+    ):
+        """
+        Args:
+            file_manager: FileManager apontando para a pasta de downloads
+            on_load: Função chamada com (df, caminho, diff) a cada nova carga
+            pattern_key: Padrão de arquivo do FileManager
+            interval: Intervalo entre verificações, em segundos
+            current_path: Arquivo já carregado pelo dashboard
+            loader: DataLoader que carregou os dados atuais (permite recarga
+                incremental desde a primeira troca)
+            loader_kwargs: Argumentos extras para o DataLoader
+        """
+        super().__init__(name="DatasetWatcher", daemon=True)
+        self.file_manager = file_manager
+        self.on_load = on_load
+        self.pattern_key = pattern_key
+        self.interval = interval
+        self.loader_kwargs = loader_kwargs or {}
+        self.loader = loader
+        if current_path is None and loader is not None:
+            current_path = loader.excel_path
+        self._signature = self._file_signature(current_path) if current_path else None
+        self._stop_event = threading.Event()
+
+    @staticmethod
+    def _file_signature(file_path: str):
+        """Identifica uma versão do arquivo pelo caminho, tamanho e mtime."""
+        stats = os.stat(file_path)
+        return (os.path.abspath(file_path), stats.st_size, stats.st_mtime)
+
+    def check_once(self) -> bool:
+        """
+        Verifica se há um arquivo novo e, se houver, carrega os dados.
+
+        Returns:
+            True se uma nova versão foi entregue para on_load
+        """
+        try:
+            latest = self.file_manager.get_latest_file(self.pattern_key)
+            signature = self._file_signature(latest)
+            if signature == self._signature:
+                return False
+
+            logging.info(f"Nova exportação detectada: {os.path.basename(latest)}")
+            if self.loader is None:
+                self.loader = DataLoader(latest, **self.loader_kwargs)
+                self.loader.load_data()
+                diff = None
+            else:
+                diff = self.loader.reload(latest)
+
+            self.on_load(self.loader.df, latest, diff)
+            self._signature = signature
+            return True
+
+        except Exception as e:
+            # Mantém a versão atual; nova tentativa no próximo intervalo
+            logging.error(f"Erro ao recarregar dados: {str(e)}")
+            return False
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.check_once()
+
+    def stop(self):
+        """Interrompe a thread ao final do intervalo corrente."""
+        self._stop_event.set()
+
+
+class SharedDatasetWatcher(threading.Thread):
+    """
+    Thread que acompanha o SharedDataset publicado pelo processo carregador.
+
+    Usada pelos workers no modo multi-worker: em vez de ler o xlsx, cada
+    worker consulta o manifesto a cada intervalo e, quando a versão muda,
+    mapeia o novo arquivo e o entrega para on_load com o número da versão
+    publicada (igual em todos os workers).
+    """
+
+    def __init__(
+        self,
+        shared: SharedDataset,
+        on_load: Callable[[pd.DataFrame, Optional[str], int], None],
+        interval: float = 30.0,
+        current_version: Optional[int] = None,
+    ):
+        """
+        Args:
+            shared: SharedDataset apontando para o diretório compartilhado
+            on_load: Função chamada com (df, arquivo de origem, versão)
+            interval: Intervalo entre verificações, em segundos
+            current_version: Versão já carregada pelo worker
+        """
+        super().__init__(name="SharedDatasetWatcher", daemon=True)
+        self.shared = shared
+        self.on_load = on_load
+        self.interval = interval
+        self.version = current_version
+        self._stop_event = threading.Event()
+
+    def check_once(self) -> bool:
+        """
+        Verifica se há uma versão nova publicada e, se houver, carrega.
+
+        Returns:
+            True se uma nova versão foi entregue para on_load
+        """
+        try:
+            manifest = self.shared.manifest()
+            if manifest is None or manifest["version"] == self.version:
+                return False
+
+            df = self.shared.load(manifest)
+            self.on_load(df, manifest["source_path"], manifest["version"])
+            self.version = manifest["version"]
+            return True
+
+        except Exception as e:
+            # Mantém a versão atual; nova tentativa no próximo intervalo
+            logging.error(f"Erro ao carregar dataset compartilhado: {str(e)}")
+            return False
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.check_once()
+
+    def stop(self):
+        """Interrompe a thread ao final do intervalo corrente."""
+        self._stop_event.set()
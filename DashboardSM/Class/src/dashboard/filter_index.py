@@ -0,0 +1,134 @@
+# src/dashboard/filter_index.py
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..data.ssa_columns import SSAColumns
+
+# Filtros do dashboard: nome do filtro -> coluna do DataFrame
+FILTER_COLUMNS = {
+    "resp_prog": SSAColumns.RESPONSAVEL_PROGRAMACAO,
+    "resp_exec": SSAColumns.RESPONSAVEL_EXECUCAO,
+    "setor_emissor": SSAColumns.SETOR_EMISSOR,
+    "setor_executor": SSAColumns.SETOR_EXECUTOR,
+}
+
+_NO_ROWS = np.empty(0, dtype=np.intp)
+
+
+def group_positions(*columns: pd.Series) -> Dict:
+    """
+    Agrupa as posições das linhas pelos valores de uma ou mais colunas.
+
+    Equivale a uma máscara de igualdade por valor, mas em uma única
+    passada; linhas com valor vazio em alguma coluna ficam de fora.
+
+    Args:
+        *columns: Colunas do mesmo DataFrame
+
+    Returns:
+        Dict valor -> posições em ordem crescente (com várias colunas, a
+        chave é a tupla de valores)
+    """
+    factorized = [pd.factorize(column, sort=False) for column in columns]
+    if len(factorized) == 1:
+        codes, uniques = factorized[0]
+        key_of = uniques.__getitem__
+    else:
+        # Combina os códigos das colunas em um código único por tupla
+        shape = tuple(max(len(uniques), 1) for _, uniques in factorized)
+        all_codes = [codes for codes, _ in factorized]
+        missing = np.logical_or.reduce([column_codes < 0 for column_codes in all_codes])
+        codes = np.ravel_multi_index(
+            [np.where(missing, 0, column_codes) for column_codes in all_codes], shape
+        )
+        codes[missing] = -1
+
+        def key_of(code):
+            indices = np.unravel_index(code, shape)
+            return tuple(
+                uniques[index] for (_, uniques), index in zip(factorized, indices)
+            )
+
+    # Ordenação estável: as posições de cada valor continuam crescentes
+    order = np.argsort(codes, kind="stable")
+    present, starts = np.unique(codes[order], return_index=True)
+    ends = np.append(starts[1:], len(order))
+    return {
+        key_of(code): order[start:end]
+        for code, start, end in zip(present, starts, ends)
+        if code >= 0
+    }
+
+
+class FilterIndex:
+    """
+    Índice invertido dos filtros do dashboard.
+
+    Para cada valor distinto das colunas filtráveis guarda as posições
+    (ordenadas) das linhas que o contêm. Combinar filtros vira uma
+    interseção de arrays de inteiros seguida de um único take(), sem
+    copiar o DataFrame inteiro nem comparar colunas de texto.
+
+    O índice é montado uma vez por versão dos dados (DashboardState).
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Args:
+            df: DataFrame normalizado pelo DataLoader
+        """
+        self.df = df
+        self.rows: Dict[str, Dict] = {
+            name: group_positions(df.iloc[:, column])
+            for name, column in FILTER_COLUMNS.items()
+        }
+
+    def positions(self, **filters) -> Optional[np.ndarray]:
+        """
+        Calcula as posições das linhas que atendem a todos os filtros.
+
+        Args:
+            **filters: Valores selecionados (resp_prog, resp_exec,
+                setor_emissor, setor_executor); vazios são ignorados
+
+        Returns:
+            Array ordenado de posições, ou None se nenhum filtro estiver ativo
+        """
+        selected = None
+        # Começa pelos filtros mais seletivos para encolher a interseção cedo
+        candidates = sorted(
+            (
+                self.rows[name].get(value, _NO_ROWS)
+                for name, value in filters.items()
+                if value
+            ),
+            key=len,
+        )
+        for rows in candidates:
+            if selected is None:
+                selected = rows
+            else:
+                selected = np.intersect1d(selected, rows, assume_unique=True)
+            if len(selected) == 0:
+                break
+        return selected
+
+    def select(self, **filters) -> pd.DataFrame:
+        """
+        Retorna o DataFrame filtrado.
+
+        Sem filtros ativos devolve o próprio DataFrame da versão, que é
+        compartilhado entre as requisições e não deve ser alterado.
+
+        Args:
+            **filters: Valores selecionados, como em positions()
+
+        Returns:
+            DataFrame com as linhas na ordem original
+        """
+        selected = self.positions(**filters)
+        if selected is None:
+            return self.df
+        return self.df.take(selected)
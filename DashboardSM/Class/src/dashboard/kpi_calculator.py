@@ -1,14 +1,55 @@
 import pandas as pd
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 from ..data.ssa_columns import SSAColumns
+from ..data.categories import value_counts
+from ..data.iso_weeks import SSAWeeks, week_difference
 
 
 class KPICalculator:
     """Calcula KPIs e métricas de performance das SSAs."""
 
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, weeks: Optional[SSAWeeks] = None):
+        """
+        Args:
+            df: DataFrame normalizado pelo DataLoader
+            weeks: Semanas já convertidas da versão (padrão: calculadas de df)
+        """
         self.df = df
+        self.weeks = weeks if weeks is not None else SSAWeeks.from_frame(df)
+        self._indicators: Optional[pd.DataFrame] = None
+
+    @property
+    def indicators(self) -> pd.DataFrame:
+        """
+        Indicadores por SSA, extraídos do DataFrame uma única vez.
+
+        Todas as métricas são agregações destas colunas: prioridade, setor
+        (executor), semana (de cadastro), programada, critica (S3.7),
+        execucao_simples e tempo_resposta (semanas ISO do cadastro à
+        programação, NaN sem programação).
+        """
+        if self._indicators is None:
+            df = self.df
+            priority = df.iloc[:, SSAColumns.GRAU_PRIORIDADE_EMISSAO]
+            self._indicators = pd.DataFrame(
+                {
+                    "prioridade": priority.array,
+                    "setor": df.iloc[:, SSAColumns.SETOR_EXECUTOR].array,
+                    "semana": df.iloc[:, SSAColumns.SEMANA_CADASTRO].array,
+                    "programada": df.iloc[:, SSAColumns.SEMANA_PROGRAMADA]
+                    .notna()
+                    .to_numpy(),
+                    "critica": (priority == "S3.7").to_numpy(),
+                    "execucao_simples": (
+                        df.iloc[:, SSAColumns.EXECUCAO_SIMPLES] == "Sim"
+                    ).to_numpy(),
+                    "tempo_resposta": week_difference(
+                        self.weeks.cadastro, self.weeks.programada
+                    ),
+                }
+            )
+        return self._indicators
 
     def calculate_efficiency_metrics(self) -> Dict:
         """Calcula métricas de eficiência."""
@@ -20,20 +61,13 @@ class KPICalculator:
                 "distribuicao_prioridade": {},
             }
 
+        indicators = self.indicators
         return {
-            "taxa_programacao": len(
-                self.df[self.df.iloc[:, SSAColumns.SEMANA_PROGRAMADA].notna()]
-            )
-            / total_ssas,
-            "taxa_execucao_simples": len(
-                self.df[self.df.iloc[:, SSAColumns.EXECUCAO_SIMPLES] == "Sim"]
-            )
-            / total_ssas,
-            "distribuicao_prioridade": self.df.iloc[
-                :, SSAColumns.GRAU_PRIORIDADE_EMISSAO
-            ]
-            .value_counts(normalize=True)
-            .to_dict(),
+            "taxa_programacao": float(indicators["programada"].mean()),
+            "taxa_execucao_simples": float(indicators["execucao_simples"].mean()),
+            "distribuicao_prioridade": value_counts(
+                self.df.iloc[:, SSAColumns.GRAU_PRIORIDADE_EMISSAO], normalize=True
+            ).to_dict(),
         }
 
     def get_overall_health_score(self) -> float:
@@ -45,93 +79,85 @@ class KPICalculator:
         return round(score * 100, 2)
 
     def calculate_response_times(self) -> Dict[str, float]:
-        """Calcula tempos de resposta médios por prioridade."""
-        response_times = {}
-
-        for priority in self.df.iloc[:, SSAColumns.GRAU_PRIORIDADE_EMISSAO].unique():
-            mask = self.df.iloc[:, SSAColumns.GRAU_PRIORIDADE_EMISSAO] == priority
-            priority_data = self.df[mask]
-
-            if len(priority_data) > 0:
-                # Calcula tempo médio desde emissão até programação
-                mean_time = (
-                    priority_data.iloc[:, SSAColumns.SEMANA_PROGRAMADA].astype(float)
-                    - priority_data.iloc[:, SSAColumns.SEMANA_CADASTRO].astype(float)
-                ).mean()
-
-                response_times[priority] = mean_time if not pd.isna(mean_time) else None
-
-        return response_times
+        """
+        Calcula tempos de resposta médios por prioridade.
+
+        O tempo de resposta é a distância em semanas ISO da semana de
+        cadastro até a semana programada, inclusive entre anos.
+
+        Returns:
+            Dict prioridade -> média em semanas (None sem SSAs programadas)
+        """
+        means = (
+            self.indicators.groupby("prioridade", sort=False, observed=True)[
+                "tempo_resposta"
+            ].mean()
+        )
+        return {
+            priority: None if pd.isna(mean_time) else mean_time
+            for priority, mean_time in means.items()
+        }
 
     def calculate_sector_performance(self) -> pd.DataFrame:
-        """Calcula performance por setor."""
-        sector_metrics = []
-
-        for sector in self.df.iloc[:, SSAColumns.SETOR_EXECUTOR].unique():
-            sector_data = self.df[self.df.iloc[:, SSAColumns.SETOR_EXECUTOR] == sector]
-
-            total_ssas = len(sector_data)
-            if total_ssas == 0:
-                continue
-
-            programmed_ssas = len(
-                sector_data[sector_data.iloc[:, SSAColumns.SEMANA_PROGRAMADA].notna()]
-            )
-            critical_ssas = len(
-                sector_data[
-                    sector_data.iloc[:, SSAColumns.GRAU_PRIORIDADE_EMISSAO] == "S3.7"
-                ]
-            )
-
-            sector_metrics.append(
-                {
-                    "setor": sector,
-                    "total_ssas": total_ssas,
-                    "taxa_programacao": (
-                        (programmed_ssas / total_ssas) if total_ssas > 0 else 0
-                    ),
-                    "ssas_criticas": critical_ssas,
-                    "percentual_criticas": (
-                        (critical_ssas / total_ssas * 100) if total_ssas > 0 else 0
-                    ),
-                }
-            )
-
-        return pd.DataFrame(sector_metrics)
+        """Calcula performance por setor executor (na ordem de aparição)."""
+        grouped = self._group_counts("setor", sort=False)
+        if grouped.empty:
+            return pd.DataFrame()
+        rate = grouped["programadas"] / grouped["total"]
+
+        return pd.DataFrame(
+            {
+                "setor": grouped.index,
+                "total_ssas": grouped["total"].to_numpy(),
+                "taxa_programacao": rate.to_numpy(),
+                "ssas_criticas": grouped["criticas"].to_numpy(),
+                "percentual_criticas": (
+                    grouped["criticas"] / grouped["total"] * 100
+                ).to_numpy(),
+            }
+        )
 
     def calculate_weekly_trends(self) -> pd.DataFrame:
-        """Calcula tendências semanais de SSAs."""
-        weekly_data = []
-
-        for week in sorted(self.df.iloc[:, SSAColumns.SEMANA_CADASTRO].unique()):
-            week_data = self.df[self.df.iloc[:, SSAColumns.SEMANA_CADASTRO] == week]
-
-            total_ssas = len(week_data)
-            if total_ssas == 0:
-                continue
-
-            programmed = len(
-                week_data[week_data.iloc[:, SSAColumns.SEMANA_PROGRAMADA].notna()]
-            )
-            critical = len(
-                week_data[
-                    week_data.iloc[:, SSAColumns.GRAU_PRIORIDADE_EMISSAO] == "S3.7"
-                ]
-            )
-
-            weekly_data.append(
-                {
-                    "semana": week,
-                    "total_ssas": total_ssas,
-                    "programadas": programmed,
-                    "criticas": critical,
-                    "taxa_programacao": (
-                        (programmed / total_ssas) if total_ssas > 0 else 0
-                    ),
-                }
-            )
+        """Calcula tendências semanais de SSAs (por semana de cadastro)."""
+        grouped = self._group_counts("semana", sort=True)
+        if grouped.empty:
+            return pd.DataFrame()
+        rate = grouped["programadas"] / grouped["total"]
+
+        return pd.DataFrame(
+            {
+                "semana": grouped.index,
+                "total_ssas": grouped["total"].to_numpy(),
+                "programadas": grouped["programadas"].to_numpy(),
+                "criticas": grouped["criticas"].to_numpy(),
+                "taxa_programacao": rate.to_numpy(),
+            }
+        )
 
-        return pd.DataFrame(weekly_data)
+    def _group_counts(self, key: str, sort: bool) -> pd.DataFrame:
+        """
+        Conta SSAs, programadas e críticas por grupo em uma única agregação.
+
+        Args:
+            key: Coluna de self.indicators usada no agrupamento
+            sort: Ordena os grupos (False mantém a ordem de aparição)
+
+        Returns:
+            DataFrame indexado pelo grupo com total, programadas e criticas
+        """
+        grouped = self.indicators.groupby(key, sort=sort, observed=True).agg(
+            total=("programada", "size"),
+            programadas=("programada", "sum"),
+            criticas=("critica", "sum"),
+        )
+        # No modo compact a chave é Categorical e no dataset compartilhado é
+        # string[pyarrow]; devolve o tipo dos valores (object para texto)
+        # para que o resultado não dependa de como o DataFrame foi carregado
+        if isinstance(grouped.index, pd.CategoricalIndex):
+            grouped.index = grouped.index.astype(grouped.index.categories.dtype)
+        if isinstance(grouped.index.dtype, pd.StringDtype):
+            grouped.index = grouped.index.astype(object)
+        return grouped
 
     def get_key_metrics_summary(self) -> Dict:
         """Retorna um resumo das métricas principais."""
@@ -0,0 +1,115 @@
+# src/dashboard/result_cache.py
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from plotly.io.json import to_json_plotly
+
+
+class ResultCache:
+    """
+    Cache LRU das saídas dos callbacks do dashboard.
+
+    As saídas são guardadas já serializadas (o mesmo JSON que o Dash
+    enviaria ao navegador, em UTF-8), então um acerto não refaz nenhuma
+    figura e o tamanho de cada entrada é conhecido em bytes. Quando o
+    total passa de max_bytes, as entradas usadas há mais tempo são
+    descartadas.
+
+    A versão dos dados faz parte da chave; na troca de versão o
+    dashboard chama clear() para liberar a memória de uma vez.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            max_bytes: Tamanho máximo do cache, em bytes de JSON UTF-8 (0 desativa)
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Busca uma saída no cache.
+
+        Returns:
+            Saída desserializada (dicts e listas), ou None se não estiver no cache
+        """
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return json.loads(payload)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Indica se a chave está no cache (não conta como acerto nem falta)."""
+        with self._lock:
+            return key in self._entries
+
+    @staticmethod
+    def encode(value: Any) -> bytes:
+        """Serializa uma saída no JSON que o Dash enviaria, em UTF-8."""
+        # Bytes, não caracteres: nomes e descrições têm acentos
+        return to_json_plotly(value).encode("utf-8")
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Guarda uma saída no cache, descartando as mais antigas se necessário.
+
+        Args:
+            key: Chave (filtros selecionados e versão dos dados)
+            value: Saída do callback (figuras, componentes, dicts)
+        """
+        self.put_payload(key, self.encode(value))
+
+    def put_payload(self, key: Hashable, payload: bytes) -> None:
+        """
+        Guarda uma saída já serializada com encode().
+
+        Args:
+            key: Chave (filtros selecionados e versão dos dados)
+            payload: JSON UTF-8 da saída
+        """
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            while self._entries and self._bytes + size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+            self._entries[key] = payload
+            self._bytes += size
+
+    def clear(self) -> None:
+        """Descarta todas as entradas (os contadores são mantidos)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Retorna acertos, faltas, descartes e ocupação do cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
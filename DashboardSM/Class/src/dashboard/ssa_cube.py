@@ -0,0 +1,253 @@
+# src/dashboard/ssa_cube.py
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..data.snapshot_diff import SnapshotDiff
+from ..data.ssa_columns import SSAColumns
+
+# Dimensões do cubo: nome -> coluna do DataFrame
+CUBE_DIMENSIONS = {
+    "situacao": SSAColumns.SITUACAO,
+    "prioridade": SSAColumns.GRAU_PRIORIDADE_EMISSAO,
+    "setor_emissor": SSAColumns.SETOR_EMISSOR,
+    "setor_executor": SSAColumns.SETOR_EXECUTOR,
+    "semana_cadastro": SSAColumns.SEMANA_CADASTRO,
+    "semana_programada": SSAColumns.SEMANA_PROGRAMADA,
+    "resp_prog": SSAColumns.RESPONSAVEL_PROGRAMACAO,
+    "resp_exec": SSAColumns.RESPONSAVEL_EXECUCAO,
+}
+
+# Código das linhas com valor vazio na dimensão
+MISSING = -1
+
+
+class SSACube:
+    """
+    Cubo esparso de contagens de SSAs por estado, prioridade, setores,
+    semanas e responsáveis.
+
+    Cada célula é uma combinação de valores que existe nos dados, com a
+    contagem e as linhas (números de SSA) que a compõem. Contagens por
+    uma dimensão com filtros nas outras são somas sobre as células
+    selecionadas, sem percorrer o DataFrame.
+
+    O cubo é montado uma vez por versão dos dados; com o SnapshotDiff da
+    recarga incremental, updated() codifica só as SSAs novas ou alteradas.
+    """
+
+    def __init__(self, df: Optional[pd.DataFrame] = None):
+        """
+        Args:
+            df: DataFrame normalizado pelo DataLoader
+        """
+        self.dimensions = list(CUBE_DIMENSIONS)
+        self.values: Dict[str, List] = {dim: [] for dim in self.dimensions}
+        self._codes: Dict[str, Dict] = {dim: {} for dim in self.dimensions}
+        self._index_dtypes: Dict[str, object] = {}
+        self._names: Dict[str, object] = {}
+        self._categorical: Dict[str, bool] = {}
+        if df is None:
+            return
+
+        row_codes = np.empty((len(df), len(self.dimensions)), dtype=np.int32)
+        for j, dim in enumerate(self.dimensions):
+            series = df.iloc[:, CUBE_DIMENSIONS[dim]]
+            codes, uniques = pd.factorize(series, sort=False)
+            row_codes[:, j] = codes
+            self.values[dim] = list(uniques)
+            self._codes[dim] = {value: code for code, value in enumerate(uniques)}
+            self._index_dtypes[dim] = self._index_dtype(series)
+            self._names[dim] = series.name
+            self._categorical[dim] = isinstance(series.dtype, pd.CategoricalDtype)
+        self._set_rows(df, row_codes)
+
+    @staticmethod
+    def _index_dtype(series: pd.Series):
+        """dtype do índice que value_counts daria para a coluna."""
+        if isinstance(series.dtype, (pd.CategoricalDtype, pd.StringDtype)):
+            return object
+        if series.dtype == object:
+            return object
+        return series.dtype
+
+    def _set_rows(self, df: pd.DataFrame, row_codes: np.ndarray):
+        """Agrupa as linhas em células a partir dos códigos por dimensão."""
+        self.row_codes = row_codes
+        self.numbers = df.iloc[:, SSAColumns.NUMERO_SSA].to_numpy(dtype=object)
+
+        if len(row_codes):
+            self.cell_codes, row_cell = np.unique(
+                row_codes, axis=0, return_inverse=True
+            )
+            row_cell = row_cell.ravel()
+        else:
+            self.cell_codes = row_codes
+            row_cell = np.empty(0, dtype=np.intp)
+        self.cell_counts = np.bincount(row_cell, minlength=len(self.cell_codes))
+
+        # Linhas de cada célula em ordem crescente (ordenação estável)
+        self._cell_rows = np.argsort(row_cell, kind="stable")
+        self._cell_offsets = np.concatenate(([0], np.cumsum(self.cell_counts)))
+        self.cell_first_row = self._cell_rows[self._cell_offsets[:-1]]
+
+    @property
+    def total(self) -> int:
+        return len(self.row_codes)
+
+    def _code(self, dim: str, value):
+        return self._codes[dim].get(value)
+
+    def cell_mask(self, where: Optional[Dict] = None) -> np.ndarray:
+        """
+        Seleciona as células que atendem aos filtros.
+
+        Args:
+            where: Dimensão -> valor (valores vazios são ignorados)
+
+        Returns:
+            Máscara booleana sobre as células
+        """
+        mask = np.ones(len(self.cell_codes), dtype=bool)
+        for dim, value in (where or {}).items():
+            if not value:
+                continue
+            code = self._code(dim, value)
+            if code is None:
+                return np.zeros(len(self.cell_codes), dtype=bool)
+            mask &= self.cell_codes[:, self.dimensions.index(dim)] == code
+        return mask
+
+    def count(self, where: Optional[Dict] = None) -> int:
+        """Quantidade de SSAs que atendem aos filtros."""
+        return int(self.cell_counts[self.cell_mask(where)].sum())
+
+    def counts(self, dim: str, where: Optional[Dict] = None) -> pd.Series:
+        """
+        Contagem de SSAs por valor de uma dimensão (soma marginal do cubo).
+
+        O resultado é igual ao categories.value_counts da coluna no
+        DataFrame filtrado, inclusive na ordem dos empates: os valores
+        partem da ordem de aparição e são ordenados como o pandas ordena.
+
+        Args:
+            dim: Dimensão contada
+            where: Filtros nas dimensões (como em cell_mask)
+
+        Returns:
+            Series de contagens, em ordem decrescente
+        """
+        mask = self.cell_mask(where)
+        codes = self.cell_codes[mask, self.dimensions.index(dim)]
+        counts = self.cell_counts[mask]
+        first_rows = self.cell_first_row[mask]
+
+        present = codes != MISSING
+        codes, counts, first_rows = codes[present], counts[present], first_rows[present]
+
+        size = len(self.values[dim])
+        totals = np.bincount(codes, weights=counts, minlength=size).astype(np.int64)
+        first = np.full(size, np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(first, codes, first_rows)
+
+        found = np.flatnonzero(totals)
+        order = found[np.argsort(first[found], kind="stable")]
+        values = self.values[dim]
+        index = pd.Index(
+            [values[code] for code in order],
+            dtype=self._index_dtypes.get(dim, object),
+            name=self._names.get(dim),
+        )
+        counts = pd.Series(totals[order], index=index, name="count")
+        if self._categorical.get(dim):
+            return counts.sort_values(ascending=False, kind="stable")
+        return counts.sort_values(ascending=False)
+
+    def marginal(self, dims: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Projeta o cubo em um subconjunto das dimensões.
+
+        Args:
+            dims: Dimensões mantidas
+
+        Returns:
+            Tupla (códigos das células por dimensão, contagens, primeira
+            linha de cada célula)
+        """
+        columns = [self.dimensions.index(dim) for dim in dims]
+        if len(self.cell_codes) == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return np.empty((0, len(dims)), dtype=np.int32), empty, empty
+        codes, cell_of = np.unique(
+            self.cell_codes[:, columns], axis=0, return_inverse=True
+        )
+        cell_of = cell_of.ravel()
+        counts = np.bincount(cell_of, weights=self.cell_counts).astype(np.int64)
+        first_rows = np.full(len(codes), np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(first_rows, cell_of, self.cell_first_row)
+        return codes, counts, first_rows
+
+    def rows(self, where: Optional[Dict] = None) -> np.ndarray:
+        """Posições (crescentes) das linhas das células selecionadas."""
+        cells = np.flatnonzero(self.cell_mask(where))
+        if len(cells) == 0:
+            return np.empty(0, dtype=np.intp)
+        starts = self._cell_offsets[cells]
+        ends = self._cell_offsets[cells + 1]
+        rows = np.concatenate(
+            [self._cell_rows[start:end] for start, end in zip(starts, ends)]
+        )
+        return np.sort(rows)
+
+    def ssas(self, where: Optional[Dict] = None) -> List:
+        """Números das SSAs que atendem aos filtros, na ordem do DataFrame."""
+        return self.numbers[self.rows(where)].tolist()
+
+    def updated(self, df: pd.DataFrame, diff: SnapshotDiff) -> "SSACube":
+        """
+        Monta o cubo da nova versão reaproveitando a codificação das SSAs
+        que não mudaram.
+
+        Args:
+            df: DataFrame da nova versão
+            diff: Diferença entre a versão deste cubo e a nova
+
+        Returns:
+            Novo SSACube (este continua válido para a versão anterior)
+        """
+        cube = SSACube()
+        cube.values = {dim: list(values) for dim, values in self.values.items()}
+        cube._codes = {dim: dict(codes) for dim, codes in self._codes.items()}
+        cube._index_dtypes = dict(self._index_dtypes)
+        cube._names = dict(self._names)
+        cube._categorical = dict(self._categorical)
+
+        numbers = df.iloc[:, SSAColumns.NUMERO_SSA].astype(str).to_numpy()
+        previous = pd.Index(pd.Series(self.numbers, dtype=object).astype(str))
+        positions = previous.get_indexer(numbers)
+        changed = np.asarray(diff.changed, dtype=object)
+        fresh = (positions < 0) | np.isin(numbers, changed)
+
+        row_codes = np.empty((len(df), len(self.dimensions)), dtype=np.int32)
+        kept = np.flatnonzero(~fresh)
+        row_codes[kept] = self.row_codes[positions[kept]]
+
+        new_rows = np.flatnonzero(fresh)
+        for j, dim in enumerate(cube.dimensions):
+            values = df.iloc[new_rows, CUBE_DIMENSIONS[dim]]
+            row_codes[new_rows, j] = [cube._encode(dim, value) for value in values]
+
+        cube._set_rows(df, row_codes)
+        return cube
+
+    def _encode(self, dim: str, value) -> int:
+        """Código de um valor, acrescentando valores novos ao fim."""
+        if pd.isna(value):
+            return MISSING
+        code = self._codes[dim].get(value)
+        if code is None:
+            code = len(self.values[dim])
+            self.values[dim].append(value)
+            self._codes[dim][value] = code
+        return code
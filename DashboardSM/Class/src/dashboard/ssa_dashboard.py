@@ -1,29 +1,124 @@
 # src/dashboard/ssa_dashboard.py
 import dash
-from dash import Dash, dcc, html, Input, Output, State, MATCH, ALL, dash_table
+from dash import Dash, dcc, html, Input, Output, State, MATCH, ALL, Patch, dash_table
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
 import pandas as pd
-import numpy as np
+import hmac
+import json
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from flask import request
+from typing import Optional
+from urllib.parse import quote
+from flask import Response, g, jsonify, redirect, request
+from markupsafe import escape
 from .ssa_visualizer import SSAVisualizer
 from .kpi_calculator import KPICalculator
+from .dashboard_state import DashboardState, DatasetWatcher, SharedDatasetWatcher
+from .chart_groups import CHART_COLUMNS, ChartGroups
+from .clientside_counts import (
+    CARDS_FUNCTION,
+    CLIENTSIDE_CHARTS,
+    CLIENTSIDE_OUTPUTS,
+    chart_function,
+    count_table,
+)
+from .filter_index import FilterIndex
+from .result_cache import ResultCache
+from .ssa_cube import SSACube
+from .table_query import query_table
 from ..data.ssa_columns import SSAColumns
+from ..data.categories import value_counts
+from ..data.iso_weeks import SSAWeeks
 from ..utils.log_manager import LogManager
+from ..utils.metrics import (
+    MetricsRegistry,
+    instrument_callback,
+    record_cache,
+    record_rows,
+    register_dashboard_metrics,
+)
+from ..utils.profiler import (
+    FORMATS,
+    MAX_PROFILE_CALLS,
+    CallbackProfiler,
+    is_profiling,
+)
+
+# Gráficos cujas barras levam chave compacta em vez da lista de SSAs
+BAR_KEY_CHARTS = set(CHART_COLUMNS) | {"weeks_in_state"}
+
+# Componente de cada gráfico -> tipo usado nos builders e nas chaves das barras
+CHART_OUTPUTS = [
+    ("resp-prog-chart", "resp_prog"),
+    ("resp-exec-chart", "resp_exec"),
+    ("programmed-week-chart", "week_programmed"),
+    ("registration-week-chart", "week_registration"),
+    ("detail-state-chart", "state"),
+    ("detail-week-chart", "week_detail"),
+    ("weeks-in-state-chart", "weeks_in_state"),
+]
+OUTPUT_NAMES = ["cards"] + [chart_type for _, chart_type in CHART_OUTPUTS]
+
+# SSAs renderizadas por vez na lista do modal ("Carregar mais" traz outro bloco)
+MODAL_PAGE_SIZE = 100
+
+# Rotas de diagnóstico: só loopback ou com o token de SSA_ADMIN_TOKEN
+ADMIN_ROUTES = ("/cache-stats", "/metrics", "/admin")
+LOOPBACK_ADDRESSES = {"127.0.0.1", "::1"}
+
+SSA_PUBLIC_VIEW_URL = (
+    "https://osprd.itaipu/SAM_SMA/SSAPublicView.aspx?SerialNumber={}&language=pt"
+)
 
 
 class SSADashboard:
     """Dashboard interativo para análise de SSAs."""
 
-    def __init__(self, df: pd.DataFrame):
-        self.df = df
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        source_path: Optional[str] = None,
+        cache_max_bytes: int = 64 * 1024 * 1024,
+        chart_workers: int = 4,
+        clientside_counts: bool = False,
+        version: int = 1,
+        admin_token: Optional[str] = None,
+        metrics_labels: Optional[dict] = None,
+    ):
+        # Modo clientside: cards e gráficos de contagem recalculados no
+        # navegador a partir da tabela de contagens da versão
+        self.clientside_counts = clientside_counts
+        self.output_names = [
+            name
+            for name in OUTPUT_NAMES
+            if not (clientside_counts and name in CLIENTSIDE_OUTPUTS)
+        ]
+        # Troca de dados em execução: os callbacks leem self.state uma vez
+        self._state_lock = threading.Lock()
+        self._state = self.build_state(df, version=version, source_path=source_path)
+        self.watcher: Optional[threading.Thread] = None
+        # Saídas já calculadas por (filtros, versão dos dados)
+        self.result_cache = ResultCache(max_bytes=cache_max_bytes)
+        # Cálculo concorrente das saídas de uma mesma troca de filtro
+        self._executor = ThreadPoolExecutor(
+            max_workers=chart_workers, thread_name_prefix="dashboard-output"
+        )
         self.app = Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
         suppress_callback_exceptions = True  # Evita erros de callback
 
         # Configurar logger
         self.logger = LogManager()
+        # Tempos, linhas, bytes e cache por callback e por rota
+        self.metrics = register_dashboard_metrics(MetricsRegistry(metrics_labels))
+        # Acesso remoto às rotas de diagnóstico (sem token: só loopback)
+        self.admin_token = admin_token or os.environ.get("SSA_ADMIN_TOKEN") or None
+        # Perfil sob demanda de callbacks (SSA_PROFILE_CALLBACKS ou /admin)
+        self.profiler = CallbackProfiler.from_env()
 
         # Configurar servidor Flask subjacente
         server = self.app.server
@@ -31,40 +126,274 @@ class SSADashboard:
         # Adicionar middleware para logging
         @server.before_request
         def log_request_info():
+            g.request_started = time.perf_counter()
             self.logger.log_with_ip("INFO", f"Acesso à rota: {request.path}")
 
-        self.visualizer = SSAVisualizer(df)
-        self.kpi_calc = KPICalculator(df)
-        self.week_analyzer = self.visualizer.week_analyzer
+        @server.before_request
+        def restrict_admin_routes():
+            if self._is_admin_route(request.path) and not self._admin_allowed():
+                self.logger.log_with_ip(
+                    "WARNING", f"Acesso negado à rota: {request.path}"
+                )
+                return Response("Acesso restrito", 403)
+
+        @server.after_request
+        def observe_request(response):
+            started = g.get("request_started")
+            if started is not None:
+                # Rota registrada (não o caminho), para limitar os rótulos
+                route = request.url_rule.rule if request.url_rule else "other"
+                self.metrics.observe(
+                    "dashboard_http_request_seconds",
+                    time.perf_counter() - started,
+                    route=route,
+                )
+                if response.content_length is not None:
+                    self.metrics.observe(
+                        "dashboard_http_response_bytes",
+                        response.content_length,
+                        route=route,
+                    )
+            return response
+
+        # Contadores do cache de resultados, para dimensionar max_bytes
+        @server.route("/cache-stats")
+        def cache_stats():
+            return jsonify(self.result_cache.stats())
+
+        # Métricas no formato texto do Prometheus
+        @server.route("/metrics")
+        def metrics():
+            return Response(
+                self.metrics.render(), mimetype="text/plain; version=0.0.4"
+            )
+
+        @server.route("/admin")
+        def admin():
+            return self._admin_page()
+
+        @server.route("/admin/profile", methods=["POST"])
+        def admin_profile():
+            callback = request.form.get("callback", "")
+            if callback not in self.callback_names:
+                return Response(f"Callback desconhecido: {escape(callback)}", 400)
+            try:
+                count = int(request.form.get("count", 1))
+                self.profiler.arm(callback, count, request.form.get("format", "pstats"))
+            except ValueError as e:
+                return Response(str(escape(e)), 400)
+            token = request.args.get("token")
+            return redirect(f"/admin?token={quote(token)}" if token else "/admin")
+
         self.setup_layout()
         self.setup_callbacks()
+        self._instrument_callbacks()
+
+    @property
+    def state(self) -> DashboardState:
+        """Versão atual dos dados (leitura atômica da referência)."""
+        return self._state
+
+    @property
+    def df(self) -> pd.DataFrame:
+        return self._state.df
+
+    @property
+    def visualizer(self) -> SSAVisualizer:
+        return self._state.visualizer
+
+    @property
+    def kpi_calc(self) -> KPICalculator:
+        return self._state.kpi_calc
+
+    @property
+    def week_analyzer(self):
+        return self._state.week_analyzer
+
+    def build_state(
+        self,
+        df: pd.DataFrame,
+        version: int,
+        source_path: Optional[str] = None,
+        diff=None,
+        previous: Optional[DashboardState] = None,
+    ) -> DashboardState:
+        """
+        Monta uma versão completa dos dados: visualizador, KPIs, cubo de
+        contagens, semanas ISO e agregados usados no layout e nos filtros.
+
+        Com o diff da recarga incremental, o cubo da versão anterior
+        (previous) é atualizado em vez de recalculado.
+        """
+        if previous is not None and previous.cube is not None and diff is not None:
+            cube = previous.cube.updated(df, diff)
+        else:
+            cube = SSACube(df)
+        # Semanas ISO convertidas uma vez para gráficos de semana e KPIs
+        weeks = SSAWeeks.from_frame(df)
+        aggregates = {
+            "stats": self._get_initial_stats(df, cube),
+            "state_counts": cube.counts("situacao").to_dict(),
+            "responsaveis": self._get_responsaveis(df),
+            "setores_emissores": sorted(
+                df.iloc[:, SSAColumns.SETOR_EMISSOR].dropna().unique()
+            ),
+            "setores_executores": sorted(
+                df.iloc[:, SSAColumns.SETOR_EXECUTOR].dropna().unique()
+            ),
+        }
+        if self.clientside_counts:
+            aggregates["count_table"] = count_table(cube, version)
+        return DashboardState(
+            version=version,
+            df=df,
+            visualizer=SSAVisualizer(df, weeks),
+            kpi_calc=KPICalculator(df, weeks),
+            loaded_at=datetime.now(),
+            source_path=source_path,
+            diff=diff,
+            aggregates=aggregates,
+            filter_index=FilterIndex(df),
+            cube=cube,
+            weeks=weeks,
+        )
+
+    def swap_data(
+        self,
+        df: pd.DataFrame,
+        source_path: Optional[str] = None,
+        diff=None,
+        version: Optional[int] = None,
+    ) -> DashboardState:
+        """
+        Publica um novo DataFrame como próxima versão dos dados.
+
+        Todo o processamento é feito antes da troca, que é só a atribuição
+        de uma referência; requisições em andamento terminam com a versão
+        que leram no início.
+
+        Args:
+            df: DataFrame já carregado pelo DataLoader
+            source_path: Arquivo de origem
+            diff: SnapshotDiff em relação à versão anterior, se houver
+            version: Número da versão (padrão: a atual + 1); no modo
+                multi-worker é a versão do SharedDataset, igual em todos os
+                workers
+
+        Returns:
+            DashboardState publicado
+        """
+        with self._state_lock:
+            new_state = self.build_state(
+                df,
+                self._state.version + 1 if version is None else version,
+                source_path=source_path,
+                diff=diff,
+                previous=self._state,
+            )
+            self._state = new_state
+        # Resultados da versão anterior não servem mais
+        self.result_cache.clear()
+
+        summary = f" - {diff.summary()}" if diff is not None else ""
+        logging.info(
+            f"Dados atualizados para a versão {new_state.version} "
+            f"({len(df)} SSAs){summary}"
+        )
+        return new_state
+
+    def start_watcher(
+        self,
+        file_manager,
+        pattern_key: str = "ssa_pendentes",
+        interval: float = 300.0,
+        loader=None,
+        **loader_kwargs,
+    ) -> DatasetWatcher:
+        """
+        Inicia a thread que recarrega os dados quando surge uma nova exportação.
+
+        Args:
+            file_manager: FileManager apontando para a pasta de downloads
+            pattern_key: Padrão de arquivo do FileManager
+            interval: Intervalo entre verificações, em segundos
+            loader: DataLoader que carregou os dados atuais (recarga incremental)
+            **loader_kwargs: Argumentos extras para novos DataLoader
+
+        Returns:
+            DatasetWatcher em execução
+        """
+        if self.watcher is not None:
+            self.watcher.stop()
+        self.watcher = DatasetWatcher(
+            file_manager,
+            on_load=lambda df, path, diff: self.swap_data(df, path, diff),
+            pattern_key=pattern_key,
+            interval=interval,
+            current_path=self._state.source_path,
+            loader=loader,
+            loader_kwargs=loader_kwargs,
+        )
+        self.watcher.start()
+        return self.watcher
+
+    def start_shared_watcher(
+        self, shared, interval: float = 30.0
+    ) -> SharedDatasetWatcher:
+        """
+        Inicia a thread que troca os dados quando o carregador publica uma
+        nova versão do SharedDataset (modo multi-worker).
+
+        Args:
+            shared: SharedDataset lido por este worker
+            interval: Intervalo entre verificações, em segundos
+
+        Returns:
+            SharedDatasetWatcher em execução
+        """
+        if self.watcher is not None:
+            self.watcher.stop()
+        self.watcher = SharedDatasetWatcher(
+            shared,
+            on_load=lambda df, path, version: self.swap_data(
+                df, path, version=version
+            ),
+            interval=interval,
+            current_version=self._state.version,
+        )
+        self.watcher.start()
+        return self.watcher
 
-    def _get_initial_stats(self):
+    def _get_initial_stats(
+        self, df: Optional[pd.DataFrame] = None, cube: Optional[SSACube] = None
+    ):
         """Calcula estatísticas iniciais para o dashboard."""
+        df = self.df if df is None else df
         try:
+            cube = SSACube(df) if cube is None else cube
+
             # Estatísticas básicas
-            total_ssas = len(self.df)
+            total_ssas = len(df)
 
             # Estatísticas de prioridade
-            prioridades = self.df.iloc[
-                :, SSAColumns.GRAU_PRIORIDADE_EMISSAO
-            ].value_counts()
-            ssas_criticas = len(
-                self.df[
-                    self.df.iloc[:, SSAColumns.GRAU_PRIORIDADE_EMISSAO].str.upper()
-                    == "S3.7"
-                ]
+            prioridades = cube.counts("prioridade")
+            ssas_criticas = int(
+                sum(
+                    count
+                    for prioridade, count in prioridades.items()
+                    if isinstance(prioridade, str) and prioridade.upper() == "S3.7"
+                )
             )
             taxa_criticidade = (
                 (ssas_criticas / total_ssas * 100) if total_ssas > 0 else 0
             )
 
             # Estatísticas de setor e estado
-            setores = self.df.iloc[:, SSAColumns.SETOR_EXECUTOR].value_counts()
-            estados = self.df.iloc[:, SSAColumns.SITUACAO].value_counts()
+            setores = cube.counts("setor_executor")
+            estados = cube.counts("situacao")
 
             # Tratamento seguro das datas
-            datas = self.df.iloc[:, SSAColumns.EMITIDA_EM]
+            datas = df.iloc[:, SSAColumns.EMITIDA_EM]
             valid_dates = datas[datas.notna()]
 
             periodo = {}
@@ -92,14 +421,8 @@ class SSADashboard:
 
             # Estatísticas de responsáveis
             responsaveis = {
-                "programacao": self.df.iloc[:, SSAColumns.RESPONSAVEL_PROGRAMACAO]
-                .replace([None, ""], np.nan)
-                .dropna()
-                .nunique(),
-                "execucao": self.df.iloc[:, SSAColumns.RESPONSAVEL_EXECUCAO]
-                .replace([None, ""], np.nan)
-                .dropna()
-                .nunique(),
+                "programacao": len(cube.counts("resp_prog").drop("", errors="ignore")),
+                "execucao": len(cube.counts("resp_exec").drop("", errors="ignore")),
             }
 
             return {
@@ -127,9 +450,10 @@ class SSADashboard:
                 "responsaveis": {"programacao": 0, "execucao": 0},
             }
 
-    def _get_state_counts(self):
+    def _get_state_counts(self, df: Optional[pd.DataFrame] = None):
         """Obtém contagem de SSAs por estado."""
-        return self.df.iloc[:, SSAColumns.SITUACAO].value_counts().to_dict()
+        df = self.df if df is None else df
+        return value_counts(df.iloc[:, SSAColumns.SITUACAO]).to_dict()
 
     def _get_programmed_by_week(self):
         """Obtém SSAs programadas por semana."""
@@ -138,10 +462,11 @@ class SSADashboard:
             return week_info["week_count"]
         return pd.Series()  # Retorna série vazia se não houver dados
 
-    def _get_responsaveis(self):
+    def _get_responsaveis(self, df: Optional[pd.DataFrame] = None):
         """Obtém lista de responsáveis únicos."""
-        prog = self.df.iloc[:, SSAColumns.RESPONSAVEL_PROGRAMACAO].unique()
-        exec_ = self.df.iloc[:, SSAColumns.RESPONSAVEL_EXECUCAO].unique()
+        df = self.df if df is None else df
+        prog = df.iloc[:, SSAColumns.RESPONSAVEL_PROGRAMACAO].unique()
+        exec_ = df.iloc[:, SSAColumns.RESPONSAVEL_EXECUCAO].unique()
         return {
             "programacao": sorted([x for x in prog if pd.notna(x) and x != ""]),
             "execucao": sorted([x for x in exec_ if pd.notna(x) and x != ""]),
@@ -193,6 +518,188 @@ class SSADashboard:
         except Exception as e:
             self.logger.log_with_ip("ERROR", f"Erro ao iniciar servidor: {str(e)}")
 
+    def _get_output(self, name, state, filters):
+        """
+        Returns one dashboard output for the given filters and data version.
+
+        The first output requested for a filtered view starts all of them in
+        the thread pool; the other callbacks of the same filter change find
+        their result in the result cache or in progress instead of
+        recomputing it. Finished futures are not kept in the view.
+
+        Args:
+            name (str): "cards" or a chart type from CHART_OUTPUTS
+            state (DashboardState): Data version read by the callback
+            filters (tuple): resp_prog, resp_exec, setor_emissor, setor_executor
+
+        Returns:
+            dict: Decoded JSON of the output (figure or cards), the same on a
+            result cache hit and on a miss
+        """
+        key = (name, *filters, state.version)
+        cached = self.result_cache.get(key)
+        record_cache(cached is not None)
+        if cached is not None:
+            return cached
+
+        view = state.filtered_view(*filters)
+        record_rows(len(view.df))
+        if is_profiling():
+            # O profiler só enxerga a thread do callback: calcula aqui mesmo
+            return self._compute_output(name, view, state)
+        with view.lock:
+            if name not in view.outputs:
+                for output in self.output_names:
+                    output_key = (output, *filters, state.version)
+                    if output not in view.outputs and (
+                        output == name or output_key not in self.result_cache
+                    ):
+                        view.outputs[output] = self._executor.submit(
+                            self._compute_output, output, view, state
+                        )
+            future = view.outputs[name]
+        return future.result()
+
+    def _compute_output(self, name, view, state):
+        """
+        Builds one output from a filtered view and stores it in the result cache.
+
+        The output is serialized once: the same JSON goes to the result cache
+        and, decoded, back to the callback, so a miss returns the same plain
+        dicts as a hit. Dash callbacks cannot return already-encoded JSON, so
+        Dash still encodes these dicts, which is cheaper than encoding the
+        figure and component objects a second time.
+
+        Returns:
+            dict: Decoded JSON of the output
+        """
+        cacheable = True
+        try:
+            if name == "cards":
+                value = self._create_resp_summary_cards(
+                    view.df, state.cube.counts("situacao", view.where)
+                )
+            else:
+                value = self._build_chart(name, view, state)
+        except Exception as e:
+            # Log error and return an empty output (not cached)
+            self.logger.log_with_ip("ERROR", f"Error updating {name}: {str(e)}")
+            cacheable = False
+            if name == "cards":
+                value = self._create_resp_summary_cards(state.df)
+            else:
+                value = self._create_empty_chart("Error loading data")
+
+        payload = ResultCache.encode(value)
+        if cacheable:
+            self.result_cache.put_payload(
+                (name, *view.filters, state.version), payload
+            )
+        # From now on the output is served by the result cache (within its
+        # byte budget); an error output is dropped and recomputed next time
+        with view.lock:
+            view.outputs.pop(name, None)
+        return json.loads(payload)
+
+    def _build_chart(self, chart_type, view, state):
+        """
+        Creates one chart of the dashboard for a filtered view.
+
+        Count charts are marginal sums of the data version's SSACube.
+
+        Args:
+            chart_type (str): Chart type from CHART_OUTPUTS
+            view (FilteredView): Filtered data shared by the callbacks
+            state (DashboardState): Data version (cube and bar key version)
+
+        Returns:
+            go.Figure: Chart with hover info and compact click keys
+        """
+        version = state.version
+        cube = state.cube
+        df_filtered = view.df
+        visualizer = view.visualizer
+        groups = view.groups
+
+        if chart_type == "resp_prog":
+            fig = self._enhance_bar_chart(
+                self._create_resp_prog_chart(
+                    df_filtered, cube.counts("resp_prog", view.where)
+                ),
+                "resp_prog",
+                "SSAs por Programador",
+                df_filtered,
+                groups,
+                version,
+            )
+        elif chart_type == "resp_exec":
+            fig = self._enhance_bar_chart(
+                self._create_resp_exec_chart(
+                    df_filtered, cube.counts("resp_exec", view.where)
+                ),
+                "resp_exec",
+                "SSAs por Executor",
+                df_filtered,
+                groups,
+                version,
+            )
+        elif chart_type == "week_programmed":
+            fig = self._enhance_bar_chart(
+                visualizer.create_week_chart(use_programmed=True),
+                "week_programmed",
+                "SSAs Programadas",
+                df_filtered,
+                groups,
+                version,
+            )
+        elif chart_type == "week_registration":
+            fig = self._enhance_bar_chart(
+                visualizer.create_week_chart(use_programmed=False),
+                "week_registration",
+                "SSAs Cadastradas",
+                df_filtered,
+                groups,
+                version,
+            )
+        elif chart_type == "state":
+            fig = self._enhance_bar_chart(
+                self._create_detail_state_chart(
+                    df_filtered, cube.counts("situacao", view.where)
+                ),
+                "state",
+                "SSAs por Estado",
+                df_filtered,
+                groups,
+                version,
+            )
+        elif chart_type == "week_detail":
+            fig = self._enhance_bar_chart(
+                visualizer.create_week_chart(),
+                "week_detail",
+                "SSAs por Semana",
+                df_filtered,
+                groups,
+                version,
+            )
+        elif chart_type == "weeks_in_state":
+            # Bars carry compact keys; the modal resolves the SSA lists
+            fig = self._compact_customdata(
+                visualizer.add_weeks_in_state_chart(), chart_type, version
+            )
+        else:
+            raise ValueError(f"Gráfico desconhecido: {chart_type}")
+
+        if fig:
+            # Ensure charts are visible
+            fig.update_layout(
+                showlegend=True,
+                height=400,  # Ensure minimum height
+                margin=dict(l=50, r=20, t=50, b=100),
+                xaxis_visible=True,
+                yaxis_visible=True,
+            )
+        return fig
+
     def _create_hover_text(self, ssas, title):
         """Creates hover text for charts."""
         if len(ssas) == 0:
@@ -208,87 +715,147 @@ class SSADashboard:
             f"<b>Primeiras SSAs:</b><br>{ssa_preview}"
         )
 
-    def _create_ssa_list(self, ssas):
-        """Creates clickable SSA list with copy and link functionality."""
-        if not ssas or len(ssas) == 0:
-            return html.Div("Nenhuma SSA encontrada para este período/categoria.")
+    @staticmethod
+    def _compact_customdata(fig, chart_type, version):
+        """
+        Replaces the SSA lists embedded in the bars with compact keys.
 
-        return html.Div(
-            [
-                html.Button(
-                    f"Copiar todas ({len(ssas)})",
-                    id="copy-all-ssas",
-                    n_clicks=0,
-                    style={
-                        "marginBottom": "10px",
-                        "padding": "5px 10px",
-                        "backgroundColor": "#f8f9fa",
-                        "border": "1px solid #dee2e6",
-                        "borderRadius": "4px",
-                        "cursor": "pointer",
-                    },
-                ),
-                html.Div(
-                    ",".join(str(ssa) for ssa in ssas),
-                    id="all-ssas-data",
-                    style={"display": "none"},
-                ),
-                html.Div(
-                    [
-                        html.Div(
-                            [
-                                html.A(
-                                    str(ssa),
-                                    href=f"https://osprd.itaipu/SAM_SMA/SSAPublicView.aspx?SerialNumber={ssa}&language=pt",
-                                    target="_blank",
-                                    id=f"ssa-link-{ssa}",
-                                    style={
-                                        "textDecoration": "none",
-                                        "color": "inherit",
-                                        "flex": "1",
-                                    },
-                                ),
-                                html.Button(
-                                    "📋",
-                                    id={"type": "copy-button", "index": i},
-                                    **{"data-clipboard": str(ssa)},
-                                    style={
-                                        "cursor": "pointer",
-                                        "border": "none",
-                                        "background": "none",
-                                        "padding": "0 5px",
-                                    },
-                                ),
-                            ],
-                            style={
-                                "padding": "3px 8px",
-                                "margin": "1px 0",
-                                "background": "#f8f9fa",
-                                "borderRadius": "3px",
-                                "display": "flex",
-                                "alignItems": "center",
-                                "width": "200px",
-                                "transition": "background-color 0.2s",
-                            },
-                        )
-                        for i, ssa in enumerate(ssas)
-                        if ssa
-                    ],
-                    style={
-                        "maxHeight": "500px",
-                        "overflowY": "auto",
-                        "padding": "5px",
-                        "display": "flex",
-                        "flexDirection": "column",
-                        "gap": "2px",
-                    },
-                ),
-            ]
+        Each bar carries only [chart_type, category, trace name, data
+        version]; the modal resolves the SSA list server-side when the bar
+        is clicked, so the figure JSON no longer grows with the SSA count.
+        """
+        for trace in fig.data:
+            if isinstance(trace, go.Bar) and trace.customdata is not None:
+                if len(trace.customdata) == 0:
+                    continue
+                trace.customdata = [
+                    [chart_type, cat, trace.name, version] for cat in trace.x
+                ]
+        return fig
+
+    def _resolve_bar_ssas(self, customdata, filters):
+        """
+        Looks up the SSAs of a clicked bar.
+
+        Args:
+            customdata: Bar key from _compact_customdata (or a legacy SSA list)
+            filters (dict): Current dropdown values (resp_prog, resp_exec,
+                setor_emissor, setor_executor)
+
+        Returns:
+            list: SSA numbers, or None if the key belongs to an older data version
+        """
+        if not (
+            isinstance(customdata, list)
+            and len(customdata) == 4
+            and customdata[0] in BAR_KEY_CHARTS
+        ):
+            return customdata or []
+
+        chart_type, category, trace_name, version = customdata
+        state = self.state
+        if version != state.version:
+            return None
+
+        view = state.filtered_view(**filters)
+        record_rows(len(view.df))
+        if chart_type == "weeks_in_state":
+            return view.visualizer.get_interval_ssas(category)
+        return view.groups.ssas(chart_type, category, trace_name) or []
+
+    def _create_ssa_list(self, ssas, start=0, count=MODAL_PAGE_SIZE):
+        """
+        Creates one block of the clickable SSA list shown in the modal.
+
+        Only ssas[start:start + count] is rendered; the modal adds the next
+        blocks on demand ("Carregar mais"), so opening a bar with thousands
+        of SSAs costs the same as opening a small one.
+
+        Args:
+            ssas (list): SSA numbers of the clicked bar
+            start (int): Position of the first SSA in the block
+            count (int): Number of SSAs in the block
+
+        Returns:
+            list: One row (link + copy button) per SSA
+        """
+        if not ssas:
+            return [html.Div("Nenhuma SSA encontrada para este período/categoria.")]
+
+        return [
+            html.Div(
+                [
+                    html.A(
+                        str(ssa),
+                        href=SSA_PUBLIC_VIEW_URL.format(ssa),
+                        target="_blank",
+                        style={
+                            "textDecoration": "none",
+                            "color": "inherit",
+                            "flex": "1",
+                        },
+                    ),
+                    dcc.Clipboard(
+                        content=str(ssa),
+                        title="Copiar",
+                        style={
+                            "cursor": "pointer",
+                            "padding": "0 5px",
+                            "fontSize": "12px",
+                        },
+                    ),
+                ],
+                style={
+                    "padding": "3px 8px",
+                    "margin": "1px 0",
+                    "background": "#f8f9fa",
+                    "borderRadius": "3px",
+                    "display": "flex",
+                    "alignItems": "center",
+                    "width": "200px",
+                    "transition": "background-color 0.2s",
+                },
+            )
+            for ssa in ssas[start : start + count]
+            if ssa
+        ]
+
+    @staticmethod
+    def _load_more_button(shown, total):
+        """Label and style of the "Carregar mais" button of the modal."""
+        remaining = total - shown
+        if remaining <= 0:
+            return "", {"display": "none"}
+        return (
+            f"Carregar mais ({remaining} restantes)",
+            {"display": "block", "marginTop": "10px"},
         )
 
-    def _enhance_bar_chart(self, fig, chart_type, title, df_filtered=None):
-        """Enhances bar chart with hover info and clickable data."""
-        df_to_use = df_filtered if df_filtered is not None else self.df
+    def _enhance_bar_chart(
+        self, fig, chart_type, title, df_filtered=None, groups=None, version=None
+    ):
+        """
+        Enhances bar chart with hover info and clickable data.
+
+        Each bar gets its count, a hover with the first SSAs and the compact
+        key [chart_type, category, trace name, data version]; the full SSA
+        list is only built when the bar is clicked (_resolve_bar_ssas).
+
+        Args:
+            fig (go.Figure): Bar chart to enhance
+            chart_type (str): Chart type used to look up the SSAs of each bar
+            title (str): Chart title
+            df_filtered (pd.DataFrame): Filtered dataframe (defaults to self.df)
+            groups (ChartGroups): SSAs already grouped per bar; pass the same
+                object to every chart built from the same filtered dataframe
+            version (int): Data version of the bar keys (defaults to the
+                current one)
+        """
+        if groups is None:
+            df_to_use = df_filtered if df_filtered is not None else self.df
+            groups = ChartGroups(df_to_use)
+        if version is None:
+            version = self.state.version
 
         try:
             for trace in fig.data:
@@ -297,61 +864,19 @@ class SSADashboard:
                     customdata = []
 
                     for i, cat in enumerate(trace.x):
-                        mask = None
-                        if chart_type == "resp_prog":
-                            mask = (
-                                df_to_use.iloc[:, SSAColumns.RESPONSAVEL_PROGRAMACAO]
-                                == cat
-                            )
-                        elif chart_type == "resp_exec":
-                            mask = (
-                                df_to_use.iloc[:, SSAColumns.RESPONSAVEL_EXECUCAO]
-                                == cat
-                            )
-                        elif chart_type == "state":
-                            mask = df_to_use.iloc[:, SSAColumns.SITUACAO] == cat
-                        elif chart_type == "week_programmed":
-                            mask = df_to_use.iloc[
-                                :, SSAColumns.SEMANA_PROGRAMADA
-                            ] == str(cat)
-                            if (
-                                trace.name
-                            ):  # Se tem nome, é um gráfico empilhado por prioridade
-                                mask = mask & (
-                                    df_to_use.iloc[
-                                        :, SSAColumns.GRAU_PRIORIDADE_EMISSAO
-                                    ]
-                                    == trace.name
-                                )
-                        elif chart_type == "week_registration":
-                            mask = df_to_use.iloc[:, SSAColumns.SEMANA_CADASTRO] == str(
-                                cat
-                            )
-                            if trace.name:
-                                mask = mask & (
-                                    df_to_use.iloc[
-                                        :, SSAColumns.GRAU_PRIORIDADE_EMISSAO
-                                    ]
-                                    == trace.name
-                                )
-                        else:
+                        summary = groups.preview(chart_type, cat, trace.name)
+                        if summary is None:
                             continue
-
-                        if mask is not None:
-                            ssas = (
-                                df_to_use[mask].iloc[:, SSAColumns.NUMERO_SSA].tolist()
-                            )
-                        else:
-                            ssas = []
+                        total, first_ssas = summary
 
                         # Atualiza o valor da barra para refletir os dados filtrados
                         if i < len(trace.y):
-                            trace.y[i] = len(ssas)
+                            trace.y[i] = total
 
                         # Texto do hover
-                        ssa_preview = "<br>".join(ssas[:5])
-                        if len(ssas) > 5:
-                            ssa_preview += f"<br>... (+{len(ssas)-5} SSAs)"
+                        ssa_preview = "<br>".join(first_ssas)
+                        if total > len(first_ssas):
+                            ssa_preview += f"<br>... (+{total - len(first_ssas)} SSAs)"
 
                         title_text = str(cat)
                         if trace.name:
@@ -359,10 +884,10 @@ class SSADashboard:
 
                         hover_text.append(
                             f"<b>{title_text}</b><br>"
-                            f"Total SSAs: {len(ssas)}<br>"
+                            f"Total SSAs: {total}<br>"
                             f"SSAs:<br>{ssa_preview}"
                         )
-                        customdata.append(ssas)
+                        customdata.append([chart_type, cat, trace.name, version])
 
                     trace.update(
                         text=trace.y,  # Atualiza os rótulos das barras
@@ -392,21 +917,24 @@ class SSADashboard:
 
         return fig
 
-    def _create_resp_prog_chart(self, df_filtered):
+    def _create_resp_prog_chart(self, df_filtered, counts=None):
         """
         Creates the bar chart for programming responsibles.
 
         Args:
             df_filtered (pd.DataFrame): Filtered dataframe containing SSA data
+            counts (pd.Series, optional): Precomputed counts per responsible
 
         Returns:
             go.Figure: Plotly figure object with the bar chart
         """
         try:
             # Get counts for each responsible
-            resp_prog_counts = df_filtered.iloc[
-                :, SSAColumns.RESPONSAVEL_PROGRAMACAO
-            ].value_counts()
+            resp_prog_counts = (
+                value_counts(df_filtered.iloc[:, SSAColumns.RESPONSAVEL_PROGRAMACAO])
+                if counts is None
+                else counts
+            )
 
             if resp_prog_counts.empty:
                 return self._create_empty_chart("SSAs por Responsável na Programação")
@@ -445,9 +973,13 @@ class SSADashboard:
             )
             return self._create_empty_chart("SSAs por Responsável na Programação")
 
-    def _create_resp_exec_chart(self, df):
+    def _create_resp_exec_chart(self, df, counts=None):
         """Cria o gráfico de responsáveis na execução."""
-        resp_exec_counts = df.iloc[:, SSAColumns.RESPONSAVEL_EXECUCAO].value_counts()
+        resp_exec_counts = (
+            value_counts(df.iloc[:, SSAColumns.RESPONSAVEL_EXECUCAO])
+            if counts is None
+            else counts
+        )
 
         fig = go.Figure(
             data=[
@@ -472,9 +1004,11 @@ class SSADashboard:
 
         return fig
 
-    def _create_detail_state_chart(self, df):
+    def _create_detail_state_chart(self, df, counts=None):
         """Cria o gráfico de detalhamento por estado."""
-        state_counts = df.iloc[:, SSAColumns.SITUACAO].value_counts()
+        state_counts = (
+            value_counts(df.iloc[:, SSAColumns.SITUACAO]) if counts is None else counts
+        )
 
         # Cores específicas para cada estado
         state_colors = {
@@ -541,294 +1075,20 @@ class SSADashboard:
             for idx, row in df.iterrows()
         ]
 
-    def setup_callbacks(self):
-        """Configure all dashboard callbacks with enhanced features."""
-
-        @self.app.callback(
-            [
-                Output("resp-summary-cards", "children"),
-                Output("resp-prog-chart", "figure"),
-                Output("resp-exec-chart", "figure"),
-                Output("programmed-week-chart", "figure"),
-                Output("registration-week-chart", "figure"),
-                Output("detail-section", "style"),
-                Output("detail-state-chart", "figure"),
-                Output("detail-week-chart", "figure"),
-                Output("ssa-table", "data"),
-                Output("weeks-in-state-chart", "figure"),
-            ],
-            [
-                Input("resp-prog-filter", "value"),
-                Input("resp-exec-filter", "value"),
-                Input("setor-emissor-filter", "value"),
-                Input("setor-executor-filter", "value"),
-            ],
-        )
-        def update_all_charts(resp_prog, resp_exec, setor_emissor, setor_executor):
-            """Update all charts with filter data."""
-            if any([resp_prog, resp_exec, setor_emissor, setor_executor]):
-                self.logger.log_with_ip(
-                    "INFO",
-                    f"Filtros aplicados - Prog: {resp_prog}, Exec: {resp_exec}, "
-                    f"Emissor: {setor_emissor}, Executor: {setor_executor}",
-                )
-
-            df_filtered = self.df.copy()
-
-            # Aplicar filtros
-            if resp_prog:
-                df_filtered = df_filtered[
-                    df_filtered.iloc[:, SSAColumns.RESPONSAVEL_PROGRAMACAO] == resp_prog
-                ]
-            if resp_exec:
-                df_filtered = df_filtered[
-                    df_filtered.iloc[:, SSAColumns.RESPONSAVEL_EXECUCAO] == resp_exec
-                ]
-            if setor_emissor:
-                df_filtered = df_filtered[
-                    df_filtered.iloc[:, SSAColumns.SETOR_EMISSOR] == setor_emissor
-                ]
-            if setor_executor:
-                df_filtered = df_filtered[
-                    df_filtered.iloc[:, SSAColumns.SETOR_EXECUTOR] == setor_executor
-                ]
-
-            # Criar visualizador filtrado
-            filtered_visualizer = SSAVisualizer(df_filtered)
-
-            # Criar os cards de resumo
-            resp_cards = self._create_resp_summary_cards(df_filtered)
-
-            # Gerar gráficos com informações de hover e click
-            fig_prog = self._enhance_bar_chart(
-                self._create_resp_prog_chart(df_filtered),
-                "resp_prog",
-                "SSAs por Programador",
-                df_filtered,
-            )
-
-            fig_exec = self._enhance_bar_chart(
-                self._create_resp_exec_chart(df_filtered),
-                "resp_exec",
-                "SSAs por Executor",
-                df_filtered,
-            )
-
-            # Gráficos de semana com hover e click
-            fig_programmed_week = self._enhance_bar_chart(
-                filtered_visualizer.create_week_chart(use_programmed=True),
-                "week_programmed",
-                "SSAs Programadas",
-                df_filtered,
-            )
-
-            fig_registration_week = self._enhance_bar_chart(
-                filtered_visualizer.create_week_chart(use_programmed=False),
-                "week_registration",
-                "SSAs Cadastradas",
-                df_filtered,
-            )
-
-            detail_style = (
-                {"display": "block"}
-                if any([resp_prog, resp_exec, setor_emissor, setor_executor])
-                else {"display": "none"}
-            )
-
-            fig_detail_state = self._enhance_bar_chart(
-                self._create_detail_state_chart(df_filtered),
-                "state",
-                "SSAs por Estado",
-                df_filtered,
-            )
-
-            fig_detail_week = self._enhance_bar_chart(
-                filtered_visualizer.create_week_chart(),
-                "week_detail",
-                "SSAs por Semana",
-                df_filtered,
-            )
-
-            table_data = self._prepare_table_data(df_filtered)
-            weeks_fig = filtered_visualizer.add_weeks_in_state_chart()
-
-            return (
-                resp_cards,
-                fig_prog,
-                fig_exec,
-                fig_programmed_week,
-                fig_registration_week,
-                detail_style,
-                fig_detail_state,
-                fig_detail_week,
-                table_data,
-                weeks_fig,
-            )
-
-        @self.app.callback(
-            [
-                Output("ssa-modal", "is_open"),
-                Output("ssa-modal-body", "children"),
-                Output("ssa-modal-title", "children"),
-            ],
-            [
-                Input("weeks-in-state-chart", "clickData"),
-                Input("resp-prog-chart", "clickData"),
-                Input("resp-exec-chart", "clickData"),
-                Input("programmed-week-chart", "clickData"),
-                Input("registration-week-chart", "clickData"),
-                Input("detail-state-chart", "clickData"),
-                Input("detail-week-chart", "clickData"),
-                Input("close-modal", "n_clicks"),
-            ],
-            [State("ssa-modal", "is_open")],
-        )
-        def toggle_modal(
-            weeks_click,
-            prog_click,
-            exec_click,
-            prog_week_click,
-            reg_week_click,
-            detail_state_click,
-            detail_week_click,
-            close_clicks,
-            is_open,
-        ):
-            """Handle modal opening/closing and content."""
-            ctx = dash.callback_context
-            if not ctx.triggered:
-                return False, "", ""
-
-            trigger_id = ctx.triggered[0]["prop_id"].split(".")[0]
-
-            if trigger_id == "close-modal":
-                return False, "", ""
-
-            try:
-                click_mapping = {
-                    "weeks-in-state-chart": (weeks_click, "SSAs no intervalo"),
-                    "resp-prog-chart": (prog_click, "SSAs do programador"),
-                    "resp-exec-chart": (exec_click, "SSAs do executor"),
-                    "programmed-week-chart": (
-                        prog_week_click,
-                        "SSAs programadas na semana",
-                    ),
-                    "registration-week-chart": (
-                        reg_week_click,
-                        "SSAs cadastradas na semana",
-                    ),
-                    "detail-state-chart": (detail_state_click, "SSAs no estado"),
-                    "detail-week-chart": (
-                        detail_week_click,
-                        "SSAs na semana (detalhe)",
-                    ),
-                }
-
-                if trigger_id in click_mapping:
-                    click_data, title_prefix = click_mapping[trigger_id]
-                    if (
-                        not click_data
-                        or "points" not in click_data
-                        or not click_data["points"]
-                    ):
-                        return False, "", ""
-
-                    point_data = click_data["points"][0]
-                    label = point_data.get("x", "")
-                    ssas = point_data.get("customdata", [])
-
-                    if isinstance(ssas, (list, tuple)):
-                        ssas = [str(ssa).strip() for ssa in ssas if ssa]
-                    else:
-                        ssas = []
-
-                    if ssas:
-                        self.logger.log_with_ip(
-                            "INFO", f"Visualização de SSAs: {title_prefix} {label}"
-                        )
-
-                    ssa_list = self._create_ssa_list(ssas)
-                    title = f"{title_prefix} {label} ({len(ssas)} SSAs)"
-
-                    return True, ssa_list, title
-
-            except Exception as e:
-                self.logger.log_with_ip("ERROR", f"Erro no modal: {str(e)}")
-                return False, "", ""
-
-            return False, "", ""
-
-        # Callback para copiar SSAs
-        self.app.clientside_callback(
-            """
-            function(n_clicks) {
-                if (!n_clicks) return null;
-                
-                const allSSAs = document.getElementById('all-ssas-data').textContent;
-                navigator.clipboard.writeText(allSSAs).then(function() {
-                    const btn = document.getElementById('copy-all-ssas');
-                    btn.textContent = "Copiado!";
-                    btn.style.backgroundColor = '#d4edda';
-                    setTimeout(() => {
-                        btn.textContent = `Copiar todas (${allSSAs.split(',').length})`;
-                        btn.style.backgroundColor = '#f8f9fa';
-                    }, 1500);
-                });
-                return true;
-            }
-            """,
-            Output("copy-all-ssas", "data-copied"),
-            Input("copy-all-ssas", "n_clicks"),
-        )
-
-        self.app.clientside_callback(
-            """
-            function(n_clicks, id) {
-                if (!n_clicks) return null;
-                
-                const button = document.getElementById(id);
-                const ssa = button.getAttribute('data-clipboard');
-                
-                navigator.clipboard.writeText(ssa).then(function() {
-                    const originalText = button.textContent;
-                    button.textContent = "✓";
-                    button.style.backgroundColor = '#d4edda';
-                    setTimeout(() => {
-                        button.textContent = originalText;
-                        button.style.backgroundColor = 'transparent';
-                    }, 1500);
-                });
-                
-                return true;
-            }
-            """,
-            Output({"type": "copy-button", "index": MATCH}, "data-copied"),
-            Input({"type": "copy-button", "index": MATCH}, "n_clicks"),
-            State({"type": "copy-button", "index": MATCH}, "id"),
-        )
-
-        # Callback para atualização automática
-        @self.app.callback(
-            Output("state-data", "data"), Input("interval-component", "n_intervals")
-        )
-        def update_data(n):
-            """Update data periodically."""
-            if n:  # Só atualiza após o primeiro intervalo
-                self.logger.log_with_ip("INFO", "Atualização automática dos dados")
-            return {}
-
-    def _create_resp_summary_cards(self, df_filtered):
+    def _create_resp_summary_cards(self, df_filtered, state_counts=None):
         """
         Creates summary cards for filtered dashboard data showing state distribution.
 
         Args:
             df_filtered (pd.DataFrame): Filtered DataFrame containing SSA data
+            state_counts (pd.Series, optional): Precomputed counts per state
 
         Returns:
             dbc.Row: Bootstrap row containing state summary cards
         """
         # Get state counts from filtered DataFrame
-        state_counts = df_filtered.iloc[:, SSAColumns.SITUACAO].value_counts()
+        if state_counts is None:
+            state_counts = value_counts(df_filtered.iloc[:, SSAColumns.SITUACAO])
         total_count = len(df_filtered)
 
         # Calculate percentages
@@ -929,6 +1189,10 @@ class SSADashboard:
                                                 ),
                                                 html.H3(
                                                     str(value),
+                                                    id={
+                                                        "type": "summary-count",
+                                                        "state": state,
+                                                    },
                                                     className="mb-0",
                                                     style={
                                                         "fontWeight": "bold",
@@ -937,6 +1201,10 @@ class SSADashboard:
                                                 ),
                                                 html.Small(
                                                     f"({get_percentage(value):.1f}%)",
+                                                    id={
+                                                        "type": "summary-percentage",
+                                                        "state": state,
+                                                    },
                                                     style={"color": "#6c757d"},
                                                 ),
                                             ],
@@ -1014,16 +1282,51 @@ class SSADashboard:
             },
         }
 
+    @staticmethod
+    def _dropdown_options(values):
+        """Converte uma lista de valores em opções de dcc.Dropdown."""
+        return [{"label": value, "value": value} for value in values]
+
+    def _clientside_initial(self, name, state):
+        """
+        Initial value of an output recomputed in the browser.
+
+        In clientside mode the cards and count charts are not filled by a
+        server callback, so the page ships them for the unfiltered view;
+        the clientside callbacks update them from the count table.
+
+        Returns:
+            dict: Keyword arguments for the component (empty in server mode)
+        """
+        if name not in CLIENTSIDE_OUTPUTS or not self.clientside_counts:
+            return {}
+        prop = "children" if name == "cards" else "figure"
+        view = state.filtered_view()
+        if name == "cards":
+            value = self._create_resp_summary_cards(
+                view.df, state.cube.counts("situacao", view.where)
+            )
+        else:
+            value = self._build_chart(name, view, state)
+        return {prop: value}
+
     def setup_layout(self):
         """
-        Define o layout completo do dashboard.
+        Define o layout do dashboard como função, para que cada carregamento
+        de página use a versão de dados vigente.
+        """
+        self.app.layout = self._build_layout
+
+    def _build_layout(self):
+        """
+        Monta o layout completo do dashboard.
         Remove o ribbon de estatísticas inicial e mantém apenas o ribbon de estados.
         Inclui todos os gráficos, tabelas e funcionalidades adicionais.
         """
-        stats = self._get_initial_stats()
-        state_counts = self._get_state_counts()
+        state = self.state
+        aggregates = state.aggregates
 
-        self.app.layout = dbc.Container(
+        return dbc.Container(
             [
                 # Header
                 dbc.Row(
@@ -1037,7 +1340,7 @@ class SSADashboard:
                                             className="text-primary mb-0",
                                         ),
                                         html.Small(
-                                            f"Atualizado em: {datetime.now().strftime('%d/%m/%Y %H:%M')}",
+                                            f"Atualizado em: {state.loaded_at.strftime('%d/%m/%Y %H:%M')}",
                                             className="text-muted",
                                         ),
                                     ]
@@ -1058,12 +1361,9 @@ class SSADashboard:
                                 ),
                                 dcc.Dropdown(
                                     id="resp-prog-filter",
-                                    options=[
-                                        {"label": resp, "value": resp}
-                                        for resp in self._get_responsaveis()[
-                                            "programacao"
-                                        ]
-                                    ],
+                                    options=self._dropdown_options(
+                                        aggregates["responsaveis"]["programacao"]
+                                    ),
                                     placeholder="Selecione um responsável...",
                                     className="mb-2",
                                     clearable=True,
@@ -1078,10 +1378,9 @@ class SSADashboard:
                                 ),
                                 dcc.Dropdown(
                                     id="resp-exec-filter",
-                                    options=[
-                                        {"label": resp, "value": resp}
-                                        for resp in self._get_responsaveis()["execucao"]
-                                    ],
+                                    options=self._dropdown_options(
+                                        aggregates["responsaveis"]["execucao"]
+                                    ),
                                     placeholder="Selecione um responsável...",
                                     className="mb-2",
                                     clearable=True,
@@ -1094,14 +1393,9 @@ class SSADashboard:
                                 html.Label("Setor Emissor:", className="fw-bold"),
                                 dcc.Dropdown(
                                     id="setor-emissor-filter",
-                                    options=[
-                                        {"label": setor, "value": setor}
-                                        for setor in sorted(
-                                            self.df.iloc[
-                                                :, SSAColumns.SETOR_EMISSOR
-                                            ].unique()
-                                        )
-                                    ],
+                                    options=self._dropdown_options(
+                                        aggregates["setores_emissores"]
+                                    ),
                                     placeholder="Selecione um setor emissor...",
                                     className="mb-2",
                                     clearable=True,
@@ -1114,14 +1408,9 @@ class SSADashboard:
                                 html.Label("Setor Executor:", className="fw-bold"),
                                 dcc.Dropdown(
                                     id="setor-executor-filter",
-                                    options=[
-                                        {"label": setor, "value": setor}
-                                        for setor in sorted(
-                                            self.df.iloc[
-                                                :, SSAColumns.SETOR_EXECUTOR
-                                            ].unique()
-                                        )
-                                    ],
+                                    options=self._dropdown_options(
+                                        aggregates["setores_executores"]
+                                    ),
                                     placeholder="Selecione um setor executor...",
                                     className="mb-2",
                                     clearable=True,
@@ -1140,7 +1429,17 @@ class SSADashboard:
                 ),
                 # Cards de resumo do usuário (apenas ribbon de estados)
                 dbc.Row(
-                    [dbc.Col([html.Div(id="resp-summary-cards")], width=12)],
+                    [
+                        dbc.Col(
+                            [
+                                html.Div(
+                                    id="resp-summary-cards",
+                                    **self._clientside_initial("cards", state),
+                                )
+                            ],
+                            width=12,
+                        )
+                    ],
                     className="mb-4",
                 ),
                 # Gráficos principais
@@ -1160,6 +1459,7 @@ class SSADashboard:
                                                     dcc.Graph(
                                                         id="resp-prog-chart",
                                                         config=self._get_chart_config(),
+                                                        **self._clientside_initial("resp_prog", state),
                                                     ),
                                                     color="primary",
                                                 )
@@ -1185,6 +1485,7 @@ class SSADashboard:
                                                     dcc.Graph(
                                                         id="resp-exec-chart",
                                                         config=self._get_chart_config(),
+                                                        **self._clientside_initial("resp_exec", state),
                                                     ),
                                                     color="primary",
                                                 )
@@ -1323,6 +1624,7 @@ class SSADashboard:
                                                             dcc.Graph(
                                                                 id="detail-state-chart",
                                                                 config=self._get_chart_config(),
+                                                                **self._clientside_initial("state", state),
                                                             ),
                                                             color="primary",
                                                         )
@@ -1480,11 +1782,17 @@ class SSADashboard:
                                                         "lineHeight": "12px",
                                                         "padding": "5px",
                                                     },
+                                                    # Paginação, ordenação e filtro no servidor:
+                                                    # só a página visível vai ao navegador
+                                                    page_action="custom",
                                                     page_size=30,
                                                     page_current=0,
-                                                    sort_action="native",
+                                                    page_count=1,
+                                                    sort_action="custom",
                                                     sort_mode="multi",
-                                                    filter_action="native",
+                                                    sort_by=[],
+                                                    filter_action="custom",
+                                                    filter_query="",
                                                     tooltip_data=[],
                                                     tooltip_duration=None,
                                                     style_as_list_view=True,
@@ -1506,7 +1814,48 @@ class SSADashboard:
                             [dbc.ModalTitle(id="ssa-modal-title")],
                             close_button=True,
                         ),
-                        dbc.ModalBody([html.Div(id="ssa-modal-body")]),
+                        dbc.ModalBody(
+                            [
+                                # Barra clicada (chave compacta e filtros) e SSAs já exibidas
+                                dcc.Store(id="ssa-modal-list"),
+                                html.Div(
+                                    dcc.Clipboard(
+                                        id="ssa-modal-copy-all",
+                                        children="Copiar todas",
+                                        title="Copiar todas as SSAs",
+                                        style={
+                                            "display": "inline-block",
+                                            "padding": "5px 10px",
+                                            "backgroundColor": "#f8f9fa",
+                                            "border": "1px solid #dee2e6",
+                                            "borderRadius": "4px",
+                                            "cursor": "pointer",
+                                        },
+                                    ),
+                                    id="ssa-modal-toolbar",
+                                    style={"display": "none", "marginBottom": "10px"},
+                                ),
+                                html.Div(
+                                    id="ssa-modal-body",
+                                    style={
+                                        "maxHeight": "500px",
+                                        "overflowY": "auto",
+                                        "padding": "5px",
+                                        "display": "flex",
+                                        "flexDirection": "column",
+                                        "gap": "2px",
+                                    },
+                                ),
+                                dbc.Button(
+                                    "Carregar mais",
+                                    id="ssa-modal-more",
+                                    n_clicks=0,
+                                    color="light",
+                                    size="sm",
+                                    style={"display": "none"},
+                                ),
+                            ]
+                        ),
                         dbc.ModalFooter(
                             [
                                 html.Small(
@@ -1526,8 +1875,12 @@ class SSADashboard:
                     size="lg",
                     is_open=False,
                 ),
-                # Store para dados de estado
-                dcc.Store(id="state-data"),
+                # Store com a versão dos dados exibida nesta página
+                dcc.Store(id="state-data", data={"version": state.version}),
+                # Tabela de contagens do modo clientside (uma por versão)
+                dcc.Store(
+                    id="count-table", data=aggregates.get("count_table")
+                ),
                 # Intervalo para atualização automática
                 dcc.Interval(
                     id="interval-component",
@@ -1562,183 +1915,145 @@ class SSADashboard:
         Gerencia atualizações de gráficos, interações modais e atualização de dados.
         """
 
+        filter_inputs = [
+            Input("resp-prog-filter", "value"),
+            Input("resp-exec-filter", "value"),
+            Input("setor-emissor-filter", "value"),
+            Input("setor-executor-filter", "value"),
+            Input("state-data", "data"),
+        ]
+
+        if self.clientside_counts:
+            self._setup_clientside_callbacks()
+        else:
+
+            @self.app.callback(
+                [
+                    Output("resp-summary-cards", "children"),
+                    Output("detail-section", "style"),
+                ],
+                filter_inputs,
+            )
+            def update_summary_cards(
+                resp_prog, resp_exec, setor_emissor, setor_executor, state_data=None
+            ):
+                """
+                Updates the summary cards for the selected filters.
+
+                Args:
+                    resp_prog (str): Selected programming responsible
+                    resp_exec (str): Selected execution responsible
+                    setor_emissor (str): Selected issuing sector
+                    setor_executor (str): Selected executing sector
+                    state_data (dict): Data version shown in the page (refreshes outputs)
+
+                Returns:
+                    tuple: Summary cards and the detail section style
+                """
+                filters = (resp_prog, resp_exec, setor_emissor, setor_executor)
+                if any(filters):
+                    self.logger.log_with_ip(
+                        "INFO",
+                        f"Filters applied - Prog: {resp_prog}, Exec: {resp_exec}, "
+                        f"Issuer: {setor_emissor}, Executor: {setor_executor}",
+                    )
+                cards = self._get_output("cards", self.state, filters)
+                # Always show details after filter application
+                return cards, {"display": "block"}
+
+        def register_chart_callback(component_id, chart_type):
+            def update_chart(
+                resp_prog, resp_exec, setor_emissor, setor_executor, state_data=None
+            ):
+                """Updates one chart; the figures are computed concurrently."""
+                filters = (resp_prog, resp_exec, setor_emissor, setor_executor)
+                return self._get_output(chart_type, self.state, filters)
+
+            # Named before registering: the name labels the callback metrics
+            update_chart.__name__ = f"update_{chart_type}_chart"
+            return self.app.callback(Output(component_id, "figure"), filter_inputs)(
+                update_chart
+            )
+
+        for component_id, chart_type in CHART_OUTPUTS:
+            if self.clientside_counts and chart_type in CLIENTSIDE_CHARTS:
+                continue
+            register_chart_callback(component_id, chart_type)
+
         @self.app.callback(
             [
-                Output("resp-summary-cards", "children"),
-                Output("resp-prog-chart", "figure"),
-                Output("resp-exec-chart", "figure"),
-                Output("programmed-week-chart", "figure"),
-                Output("registration-week-chart", "figure"),
-                Output("detail-section", "style"),
-                Output("detail-state-chart", "figure"),
-                Output("detail-week-chart", "figure"),
                 Output("ssa-table", "data"),
-                Output("weeks-in-state-chart", "figure"),
+                Output("ssa-table", "page_count"),
+                Output("ssa-table", "page_current"),
             ],
             [
                 Input("resp-prog-filter", "value"),
                 Input("resp-exec-filter", "value"),
                 Input("setor-emissor-filter", "value"),
                 Input("setor-executor-filter", "value"),
+                Input("state-data", "data"),
+                Input("ssa-table", "page_current"),
+                Input("ssa-table", "page_size"),
+                Input("ssa-table", "sort_by"),
+                Input("ssa-table", "filter_query"),
             ],
         )
-        def update_all_charts(resp_prog, resp_exec, setor_emissor, setor_executor):
+        def update_table(
+            resp_prog,
+            resp_exec,
+            setor_emissor,
+            setor_executor,
+            state_data,
+            page_current,
+            page_size,
+            sort_by,
+            filter_query,
+        ):
             """
-            Updates all dashboard components based on filter selections.
-            
-            Args:
-                resp_prog (str): Selected programming responsible
-                resp_exec (str): Selected execution responsible
-                setor_emissor (str): Selected issuing sector
-                setor_executor (str): Selected executing sector
-            
+            Serves one page of the SSA table, filtered and sorted server-side.
+
             Returns:
-                tuple: Updated values for all dashboard components
+                tuple: Page rows, page count and the (possibly reset) page index
             """
+            state = self.state
             try:
-                # Log filter applications
-                if any([resp_prog, resp_exec, setor_emissor, setor_executor]):
-                    self.logger.log_with_ip(
-                        "INFO",
-                        f"Filters applied - Prog: {resp_prog}, Exec: {resp_exec}, "
-                        f"Issuer: {setor_emissor}, Executor: {setor_executor}",
-                    )
-
-                # Create filtered DataFrame
-                df_filtered = self.df.copy()
-
-                # Apply filters safely with proper error handling
-                if resp_prog:
-                    df_filtered = df_filtered[
-                        df_filtered.iloc[:, SSAColumns.RESPONSAVEL_PROGRAMACAO] == resp_prog
-                    ]
-                if resp_exec:
-                    df_filtered = df_filtered[
-                        df_filtered.iloc[:, SSAColumns.RESPONSAVEL_EXECUCAO] == resp_exec
-                    ]
-                if setor_emissor:
-                    df_filtered = df_filtered[
-                        df_filtered.iloc[:, SSAColumns.SETOR_EMISSOR] == setor_emissor
-                    ]
-                if setor_executor:
-                    df_filtered = df_filtered[
-                        df_filtered.iloc[:, SSAColumns.SETOR_EXECUTOR] == setor_executor
-                    ]
-
-                # Create filtered visualizer
-                filtered_visualizer = SSAVisualizer(df_filtered)
-
-                # Generate summary cards with filtered data
-                resp_cards = self._create_resp_summary_cards(df_filtered)
-
-                # Create main charts with hover and click info
-                fig_prog = self._create_resp_prog_chart(df_filtered)
-                fig_exec = self._create_resp_exec_chart(df_filtered)
-
-                # Ensure charts are properly enhanced with interactive features
-                fig_prog = self._enhance_bar_chart(
-                    fig_prog, "resp_prog", "SSAs por Programador", df_filtered
+                df_filtered = state.filtered_view(
+                    resp_prog, resp_exec, setor_emissor, setor_executor
+                ).df
+                record_rows(len(df_filtered))
+
+                # New filters or data: back to the first page
+                triggered = [t["prop_id"] for t in dash.callback_context.triggered]
+                if not any(t.startswith("ssa-table.page_current") for t in triggered):
+                    page_current = 0
+
+                page_size = page_size or 30
+                page_df, total = query_table(
+                    df_filtered, page_current, page_size, sort_by, filter_query
                 )
-                fig_exec = self._enhance_bar_chart(
-                    fig_exec, "resp_exec", "SSAs por Executor", df_filtered
-                )
-
-                # Create week charts with proper data handling
-                fig_programmed_week = filtered_visualizer.create_week_chart(use_programmed=True)
-                fig_registration_week = filtered_visualizer.create_week_chart(use_programmed=False)
-
-                # Enhance week charts with interactive features
-                fig_programmed_week = self._enhance_bar_chart(
-                    fig_programmed_week,
-                    "week_programmed",
-                    "SSAs Programadas",
-                    df_filtered,
-                )
-                fig_registration_week = self._enhance_bar_chart(
-                    fig_registration_week,
-                    "week_registration",
-                    "SSAs Cadastradas",
-                    df_filtered,
-                )
-
-                # Update detail section visibility
-                detail_style = {"display": "block"}  # Always show details after filter application
-
-                # Create and enhance detail charts
-                fig_detail_state = self._enhance_bar_chart(
-                    self._create_detail_state_chart(df_filtered),
-                    "state",
-                    "SSAs por Estado",
-                    df_filtered,
-                )
-                fig_detail_week = self._enhance_bar_chart(
-                    filtered_visualizer.create_week_chart(),
-                    "week_detail",
-                    "SSAs por Semana",
-                    df_filtered,
-                )
-
-                # Prepare table data
-                table_data = self._prepare_table_data(df_filtered)
-
-                # Create weeks in state chart
-                weeks_fig = filtered_visualizer.add_weeks_in_state_chart()
-
-                # Update all chart layouts to ensure visibility
-                charts = [
-                    fig_prog,
-                    fig_exec,
-                    fig_programmed_week,
-                    fig_registration_week,
-                    fig_detail_state,
-                    fig_detail_week,
-                    weeks_fig,
-                ]
+                page_count = max(-(-total // page_size), 1)
+                if page_current >= page_count:
+                    page_current = page_count - 1
+                    page_df, total = query_table(
+                        df_filtered, page_current, page_size, sort_by, filter_query
+                    )
 
-                for fig in charts:
-                    if fig:
-                        fig.update_layout(
-                            showlegend=True,
-                            height=400,  # Ensure minimum height
-                            margin=dict(l=50, r=20, t=50, b=100),
-                            xaxis_visible=True,
-                            yaxis_visible=True,
-                        )
-
-                return (
-                    resp_cards,
-                    fig_prog,
-                    fig_exec,
-                    fig_programmed_week,
-                    fig_registration_week,
-                    detail_style,
-                    fig_detail_state,
-                    fig_detail_week,
-                    table_data,
-                    weeks_fig,
-                )
+                return self._prepare_table_data(page_df), page_count, page_current
 
             except Exception as e:
-                # Log error and return empty charts
-                self.logger.log_with_ip("ERROR", f"Error updating charts: {str(e)}")
-                empty_fig = self._create_empty_chart("Error loading data")
-                return (
-                    self._create_resp_summary_cards(self.df),
-                    empty_fig,
-                    empty_fig,
-                    empty_fig,
-                    empty_fig,
-                    {"display": "none"},
-                    empty_fig,
-                    empty_fig,
-                    [],
-                    empty_fig,
-                )
+                self.logger.log_with_ip("ERROR", f"Error updating table: {str(e)}")
+                return [], 1, 0
+
         @self.app.callback(
             [
                 Output("ssa-modal", "is_open"),
                 Output("ssa-modal-body", "children"),
                 Output("ssa-modal-title", "children"),
+                Output("ssa-modal-list", "data"),
+                Output("ssa-modal-toolbar", "style"),
+                Output("ssa-modal-copy-all", "children"),
+                Output("ssa-modal-more", "children"),
+                Output("ssa-modal-more", "style"),
             ],
             [
                 Input("weeks-in-state-chart", "clickData"),
@@ -1750,7 +2065,13 @@ class SSADashboard:
                 Input("detail-week-chart", "clickData"),
                 Input("close-modal", "n_clicks"),
             ],
-            [State("ssa-modal", "is_open")],
+            [
+                State("ssa-modal", "is_open"),
+                State("resp-prog-filter", "value"),
+                State("resp-exec-filter", "value"),
+                State("setor-emissor-filter", "value"),
+                State("setor-executor-filter", "value"),
+            ],
         )
         def toggle_modal(
             weeks_click,
@@ -1762,16 +2083,23 @@ class SSADashboard:
             detail_week_click,
             close_clicks,
             is_open,
+            resp_prog=None,
+            resp_exec=None,
+            setor_emissor=None,
+            setor_executor=None,
         ):
             """Handle modal opening/closing and content."""
+            hidden = {"display": "none"}
+            closed = (False, "", "", None, hidden, "", "", hidden)
+
             ctx = dash.callback_context
             if not ctx.triggered:
-                return False, "", ""
+                return closed
 
             trigger_id = ctx.triggered[0]["prop_id"].split(".")[0]
 
             if trigger_id == "close-modal":
-                return False, "", ""
+                return closed
 
             click_mapping = {
                 "weeks-in-state-chart": (weeks_click, "SSAs no intervalo"),
@@ -1792,63 +2120,351 @@ class SSADashboard:
             if trigger_id in click_mapping:
                 click_data, title_prefix = click_mapping[trigger_id]
                 if click_data is None:
-                    return False, "", ""
+                    return closed
 
                 point_data = click_data["points"][0]
                 label = point_data["x"]
-                ssas = point_data.get("customdata", [])
+                bar = {
+                    "customdata": point_data.get("customdata", []),
+                    "filters": {
+                        "resp_prog": resp_prog,
+                        "resp_exec": resp_exec,
+                        "setor_emissor": setor_emissor,
+                        "setor_executor": setor_executor,
+                    },
+                }
+                ssas = self._resolve_bar_ssas(bar["customdata"], bar["filters"])
+                if ssas is None:
+                    return (
+                        True,
+                        html.Div(
+                            "Os dados foram atualizados. "
+                            "Clique novamente na barra para ver as SSAs."
+                        ),
+                        f"{title_prefix} {label}",
+                        None,
+                        hidden,
+                        "",
+                        "",
+                        hidden,
+                    )
 
                 if ssas:
                     self.logger.log_with_ip(
                         "INFO", f"Visualização de SSAs: {title_prefix} {label}"
                     )
 
+                # Only the first block is rendered; the rest loads on demand
                 ssa_list = self._create_ssa_list(ssas)
                 title = f"{title_prefix} {label} ({len(ssas)} SSAs)"
+                bar["shown"] = min(len(ssas), MODAL_PAGE_SIZE)
+                bar["total"] = len(ssas)
+                more_label, more_style = self._load_more_button(
+                    bar["shown"], bar["total"]
+                )
+                toolbar_style = (
+                    {"display": "block", "marginBottom": "10px"} if ssas else hidden
+                )
+
+                return (
+                    True,
+                    ssa_list,
+                    title,
+                    bar,
+                    toolbar_style,
+                    f"Copiar todas ({len(ssas)})",
+                    more_label,
+                    more_style,
+                )
 
-                return True, ssa_list, title
+            return closed
 
-            return False, "", ""
+        @self.app.callback(
+            [
+                Output("ssa-modal-body", "children", allow_duplicate=True),
+                Output("ssa-modal-list", "data", allow_duplicate=True),
+                Output("ssa-modal-more", "children", allow_duplicate=True),
+                Output("ssa-modal-more", "style", allow_duplicate=True),
+            ],
+            Input("ssa-modal-more", "n_clicks"),
+            State("ssa-modal-list", "data"),
+            prevent_initial_call=True,
+        )
+        def load_more_ssas(n_clicks, bar):
+            """Appends the next block of SSAs to the modal list."""
+            if not n_clicks or not bar:
+                return (dash.no_update,) * 4
 
-        # Callback para copiar SSAs
-        self.app.clientside_callback(
-            """
-                function(n_clicks, value) {
-                    if (!n_clicks) return null;
-                    
-                    const textToCopy = value;
-                    if (!textToCopy) return null;
-                    
-                    navigator.clipboard.writeText(textToCopy).then(function() {
-                        // Visual feedback
-                        const el = document.querySelector(`[data-value="${textToCopy}"]`);
-                        if (el) {
-                            el.style.backgroundColor = '#d4edda';
-                            setTimeout(() => {
-                                el.style.backgroundColor = '#f8f9fa';
-                            }, 500);
-                        }
-                    }).catch(function(err) {
-                        console.error('Erro ao copiar:', err);
-                    });
-                    
-                    return true;
-                }
-                """,
-            Output({"type": "ssa-number", "index": MATCH}, "data-copied"),
-            Input({"type": "ssa-number", "index": MATCH}, "n_clicks"),
-            State({"type": "ssa-number", "index": MATCH, "value": ALL}, "value"),
+            ssas = self._resolve_bar_ssas(bar["customdata"], bar["filters"])
+            if ssas is None:
+                return (
+                    [html.Div("Os dados foram atualizados. Clique novamente na barra.")],
+                    None,
+                    "",
+                    {"display": "none"},
+                )
+
+            start = bar["shown"]
+            rows = self._create_ssa_list(ssas, start=start)
+            bar = {**bar, "shown": min(len(ssas), start + MODAL_PAGE_SIZE)}
+            more_label, more_style = self._load_more_button(bar["shown"], len(ssas))
+
+            # Sends only the new rows; the ones already shown stay in the page
+            patched = Patch()
+            patched.extend(rows)
+            return patched, bar, more_label, more_style
+
+        @self.app.callback(
+            Output("ssa-modal-copy-all", "content"),
+            Input("ssa-modal-copy-all", "n_clicks"),
+            State("ssa-modal-list", "data"),
+            prevent_initial_call=True,
         )
+        def copy_all_ssas(n_clicks, bar):
+            """Builds the "Copiar todas" text only when the button is clicked."""
+            if not bar:
+                return dash.no_update
+            ssas = self._resolve_bar_ssas(bar["customdata"], bar["filters"]) or []
+            return ",".join(str(ssa) for ssa in ssas)
 
         # Callback para atualização automática
         @self.app.callback(
-            Output("state-data", "data"), Input("interval-component", "n_intervals")
+            [
+                Output("state-data", "data"),
+                Output("resp-prog-filter", "options"),
+                Output("resp-exec-filter", "options"),
+                Output("setor-emissor-filter", "options"),
+                Output("setor-executor-filter", "options"),
+            ],
+            Input("interval-component", "n_intervals"),
+            State("state-data", "data"),
         )
-        def update_data(n):
-            """Update data periodically."""
-            if n:  # Só atualiza após o primeiro intervalo
-                self.logger.log_with_ip("INFO", "Atualização automática dos dados")
-            return {}
+        def update_data(n, state_data):
+            """
+            Publica na página a versão de dados vigente.
+
+            O carregamento é feito pelo DatasetWatcher em segundo plano; aqui
+            só se compara a versão exibida com a atual, sem nunca esperar por
+            uma carga. Quando muda, os filtros e gráficos são atualizados.
+            """
+            state = self.state
+            if state_data and state_data.get("version") == state.version:
+                return (dash.no_update,) * 5
+
+            if n:  # Só registra após o primeiro intervalo
+                self.logger.log_with_ip(
+                    "INFO", f"Atualização automática dos dados (versão {state.version})"
+                )
+            aggregates = state.aggregates
+            return (
+                {"version": state.version},
+                self._dropdown_options(aggregates["responsaveis"]["programacao"]),
+                self._dropdown_options(aggregates["responsaveis"]["execucao"]),
+                self._dropdown_options(aggregates["setores_emissores"]),
+                self._dropdown_options(aggregates["setores_executores"]),
+            )
+
+    def _setup_clientside_callbacks(self):
+        """
+        Registers the callbacks of the clientside mode.
+
+        The count table of the data version reaches the "count-table" store
+        once per page and version; filter changes then recompute the summary
+        cards and the count charts in the browser. Drill-downs, the table and
+        the other charts still go to the server.
+        """
+        inputs = [
+            Input("resp-prog-filter", "value"),
+            Input("resp-exec-filter", "value"),
+            Input("setor-emissor-filter", "value"),
+            Input("setor-executor-filter", "value"),
+            Input("count-table", "data"),
+        ]
+
+        self.app.clientside_callback(
+            CARDS_FUNCTION,
+            [
+                Output({"type": "summary-count", "state": ALL}, "children"),
+                Output({"type": "summary-percentage", "state": ALL}, "children"),
+                Output("detail-section", "style"),
+            ],
+            inputs,
+        )
+
+        for component_id, chart_type in CHART_OUTPUTS:
+            if chart_type in CLIENTSIDE_CHARTS:
+                self.app.clientside_callback(
+                    chart_function(chart_type),
+                    Output(component_id, "figure"),
+                    inputs,
+                    State(component_id, "figure"),
+                )
+
+        @self.app.callback(
+            Output("count-table", "data"),
+            Input("state-data", "data"),
+            State("count-table", "data"),
+        )
+        def update_count_table(state_data, table):
+            """Sends the count table when the page shows a new data version."""
+            state = self.state
+            if table and table.get("version") == state.version:
+                return dash.no_update
+            return state.aggregates["count_table"]
+
+    def _instrument_callbacks(self):
+        """
+        Wraps every server callback registered in the Dash app with the
+        metrics of src/utils/metrics.py (time, rows, response bytes, cache)
+        and the on-demand profiler of src/utils/profiler.py.
+        """
+        self.callback_names = []
+        for entry in self.app.callback_map.values():
+            func = entry.get("callback")
+            if func is None:  # Callback clientside: roda no navegador
+                continue
+            name = func.__name__
+            self.callback_names.append(name)
+            profiled = self.profiler.wrap(func, name, lambda: self.state.version)
+            entry["callback"] = instrument_callback(profiled, name, self.metrics)
+
+    def _admin_page(self) -> str:
+        """
+        Renders the /admin page: per-callback and per-route summaries of the
+        metrics histograms, the result cache counters and the profiling form.
+
+        Returns:
+            str: HTML page
+        """
+
+        def table(title, metric, label, bytes_metric, extra=None):
+            seconds = self.metrics.histograms(metric)
+            sizes = self.metrics.histograms(bytes_metric)
+            header = ["Chamadas", "Média (ms)", "p50 (ms)", "p95 (ms)", "Média (KB)"]
+            header += list(extra or {})
+            rows = []
+            for labels, hist in sorted(seconds.items()):
+                name = dict(labels)[label]
+                size = sizes.get(labels)
+                mean_kb = size.sum / size.count / 1024 if size and size.count else None
+                cells = [
+                    hist.count,
+                    f"{hist.sum / hist.count * 1000:.1f}",
+                    f"≤ {hist.quantile(0.5) * 1000:g}",
+                    f"≤ {hist.quantile(0.95) * 1000:g}",
+                    "-" if mean_kb is None else f"{mean_kb:.1f}",
+                ]
+                cells += [column(labels) for column in (extra or {}).values()]
+                rows.append(
+                    f"<tr><td>{escape(name)}</td>"
+                    + "".join(f"<td>{cell}</td>" for cell in cells)
+                    + "</tr>"
+                )
+            head = "".join(f"<th>{column}</th>" for column in [label] + header)
+            return (
+                f"<h2>{title}</h2><table><tr>{head}</tr>{''.join(rows)}</table>"
+            )
+
+        row_hists = self.metrics.histograms("dashboard_callback_rows")
+        lookups = self.metrics.counters("dashboard_cache_lookups_total")
+
+        def mean_rows(labels):
+            hist = row_hists.get(labels)
+            return f"{hist.sum / hist.count:.0f}" if hist and hist.count else "-"
+
+        def hit_rate(labels):
+            hits = lookups.get(labels + (("result", "hit"),), 0)
+            misses = lookups.get(labels + (("result", "miss"),), 0)
+            return f"{hits / (hits + misses):.0%}" if hits + misses else "-"
+
+        cache = self.result_cache.stats()
+        cache["hit_rate"] = f"{cache['hit_rate']:.0%}"
+
+        # Acesso remoto com ?token=: os links da página levam o mesmo token
+        token = request.args.get("token")
+        query = f"?token={escape(quote(token))}" if token else ""
+
+        # Formulário para perfilar as próximas chamadas de um callback
+        options = "".join(
+            f"<option>{escape(name)}</option>" for name in sorted(self.callback_names)
+        )
+        formats = "".join(f"<option>{fmt}</option>" for fmt in FORMATS)
+        pending = "".join(
+            f"<li>{escape(name)}: {count} chamada(s) ({fmt})</li>"
+            for name, (count, fmt) in sorted(self.profiler.pending().items())
+        )
+        recent = "".join(
+            f"<li>{escape(path.name)}</li>" for path in self.profiler.recent()
+        )
+        profiling = (
+            "<h2>Profiling</h2>"
+            f"<form method='post' action='/admin/profile{query}'>"
+            f"<select name='callback'>{options}</select> "
+            "<input name='count' type='number' min='1' "
+            f"max='{MAX_PROFILE_CALLS}' value='1'> "
+            f"<select name='format'>{formats}</select> "
+            "<button type='submit'>Perfilar</button></form>"
+            f"<p>Pendentes:</p><ul>{pending or '<li>nenhum</li>'}</ul>"
+            f"<p>Recentes em {escape(self.profiler.log_dir)}:</p>"
+            f"<ul>{recent or '<li>nenhum</li>'}</ul>"
+        )
+        return (
+            "<html><head><title>Dashboard SSAs - Admin</title><style>"
+            "body{font-family:Arial;margin:20px}"
+            "table{border-collapse:collapse;margin-bottom:20px}"
+            "td,th{border:1px solid #ccc;padding:4px 8px;text-align:right}"
+            "td:first-child,th:first-child{text-align:left}"
+            "</style></head><body>"
+            f"<h1>Dashboard SSAs - versão dos dados {self.state.version}</h1>"
+            + table(
+                "Callbacks",
+                "dashboard_callback_seconds",
+                "callback",
+                "dashboard_callback_response_bytes",
+                {"Linhas (média)": mean_rows, "Acertos de cache": hit_rate},
+            )
+            + table(
+                "Rotas HTTP",
+                "dashboard_http_request_seconds",
+                "route",
+                "dashboard_http_response_bytes",
+            )
+            + "<h2>Cache de resultados</h2><table>"
+            + "".join(
+                f"<tr><td>{key}</td><td>{value}</td></tr>"
+                for key, value in cache.items()
+            )
+            + "</table>"
+            + profiling
+            + f"<p><a href='/metrics{query}'>/metrics</a></p></body></html>"
+        )
+
+    @staticmethod
+    def _is_admin_route(path: str) -> bool:
+        """Indicates whether the path is one of the diagnostic routes."""
+        return any(
+            path == route or path.startswith(route + "/") for route in ADMIN_ROUTES
+        )
+
+    def _admin_allowed(self) -> bool:
+        """
+        Checks access to the diagnostic routes for the current request.
+
+        Loopback clients are always allowed, unless the request came through
+        a proxy (X-Forwarded-For), where the remote address is the proxy's.
+        Other clients need admin_token (SSA_ADMIN_TOKEN) in the X-Admin-Token
+        header or the ``token`` query argument; with no token configured the
+        routes are loopback-only.
+        """
+        if (
+            request.remote_addr in LOOPBACK_ADDRESSES
+            and "X-Forwarded-For" not in request.headers
+        ):
+            return True
+        if not self.admin_token:
+            return False
+        supplied = request.headers.get("X-Admin-Token") or request.args.get("token", "")
+        return hmac.compare_digest(supplied.encode(), self.admin_token.encode())
 
     def _create_empty_chart(self, title: str) -> go.Figure:
         """
@@ -1,17 +1,21 @@
 import pandas as pd
 import plotly.graph_objects as go
-import logging
 from datetime import datetime, date
+from typing import Optional
+from .week_bins import WeekBins
+from ..data.iso_weeks import SSAWeeks
 from ..data.ssa_columns import SSAColumns
+from ..data.categories import value_counts
 from ..utils.log_manager import LogManager
 
 
 class SSAVisualizer:
     """Gera visualizações específicas para SSAs."""
 
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, weeks: Optional[SSAWeeks] = None):
         self.df = df
-        self.week_analyzer = WeekAnalyzer(df)
+        self.week_analyzer = WeekAnalyzer(df, weeks)
+        self._week_bins: Optional[WeekBins] = None
 
     def _get_standard_layout(
         self,
@@ -78,9 +82,9 @@ class SSAVisualizer:
 
     def create_priority_chart(self) -> go.Figure:
         """Cria gráfico de distribuição por prioridade."""
-        priority_counts = self.df.iloc[
-            :, SSAColumns.GRAU_PRIORIDADE_EMISSAO
-        ].value_counts()
+        priority_counts = value_counts(
+            self.df.iloc[:, SSAColumns.GRAU_PRIORIDADE_EMISSAO]
+        )
 
         fig = go.Figure(
             data=[
@@ -119,7 +123,8 @@ class SSAVisualizer:
                 [
                     self.df.iloc[:, SSAColumns.SETOR_EXECUTOR],
                     self.df.iloc[:, SSAColumns.GRAU_PRIORIDADE_EMISSAO],
-                ]
+                ],
+                observed=True,
             )
             .size()
             .unstack(fill_value=0)
@@ -212,77 +217,62 @@ class SSAVisualizer:
         return fig
 
 
+    def week_bins(self) -> WeekBins:
+        """Barras do gráfico de tempo no estado (calculadas uma vez)."""
+        if self._week_bins is None:
+            weeks_in_state = self.week_analyzer.calculate_weeks_in_state()
+            self._week_bins = WeekBins(weeks_in_state.to_numpy())
+        return self._week_bins
+
+    def get_interval_ssas(self, interval, df_filtered=None) -> list:
+        """
+        Lista as SSAs de uma barra do gráfico de tempo no estado.
+
+        Args:
+            interval: Rótulo da barra ('3 semanas' ou '0-9 semanas')
+            df_filtered: DataFrame alinhado a self.df (padrão: self.df)
+
+        Returns:
+            Números das SSAs no intervalo
+        """
+        df_to_use = df_filtered if df_filtered is not None else self.df
+        positions = self.week_bins().positions(interval)
+        return df_to_use.iloc[positions, SSAColumns.NUMERO_SSA].tolist()
+
     def add_weeks_in_state_chart(self, df_filtered=None) -> go.Figure:
         """Cria gráfico mostrando distribuição de SSAs por tempo no estado."""
         df_to_use = df_filtered if df_filtered is not None else self.df
-        weeks_in_state = self.week_analyzer.calculate_weeks_in_state()
-        valid_weeks = weeks_in_state.dropna()
-
-        if valid_weeks.empty:
+        bins = self.week_bins()
+        if len(bins) == 0:
             return self._create_empty_chart()
 
-        value_counts = valid_weeks.value_counts().sort_index()
-        max_weeks = value_counts.index.max()
-
-        if max_weeks > 50:
-            bins = list(range(0, int(max_weeks) + 10, 10))
-            labels = [f"{bins[i]}-{bins[i+1]-1} semanas" for i in range(len(bins) - 1)]
-            binned_data = pd.cut(value_counts.index, bins=bins, labels=labels, right=False)
-            value_counts = value_counts.groupby(binned_data).sum()
-        else:
-            value_counts.index = [f"{int(x)} semanas" for x in value_counts.index]
+        numbers = df_to_use.iloc[:, SSAColumns.NUMERO_SSA].to_numpy()
+        ssas_by_interval = [numbers[rows].tolist() for rows in bins.members]
 
         hover_text = []
-        ssas_by_interval = {}
-
-        for interval in value_counts.index:
-            if pd.isna(interval) or str(interval).strip() == "":
-                continue
-
-            try:
-                if isinstance(interval, str) and "-" in interval:
-                    start, end = map(lambda x: int(x.split()[0]), interval.split("-"))
-                    mask = (weeks_in_state >= start) & (weeks_in_state <= end)
-                else:
-                    weeks = int(interval.split()[0])
-                    mask = weeks_in_state == weeks
-
-                ssas = df_to_use[mask].iloc[:, SSAColumns.NUMERO_SSA].tolist()
-                ssas_by_interval[str(interval)] = ssas
-
-                ssa_preview = "<br>".join(ssas[:5])
-                if len(ssas) > 5:
-                    ssa_preview += f"<br>... (+{len(ssas)-5} SSAs)"
-
-                hover_text.append(
-                    f"<b>{interval}</b><br>"
-                    f"<b>Total SSAs:</b> {len(ssas)}<br>"
-                    f"<b>SSAs:</b><br>{ssa_preview}"
-                )
-
-            except Exception as e:
-                logging.warning(f"Erro ao processar intervalo {interval}: {str(e)}")
-                continue
-
-        valid_indices = [
-            i for i in range(len(hover_text)) if str(value_counts.index[i]).strip() != ""
-        ]
-
-        if not valid_indices:
-            return self._create_empty_chart()
+        for interval, ssas in zip(bins.labels, ssas_by_interval):
+            ssa_preview = "<br>".join(ssas[:5])
+            if len(ssas) > 5:
+                ssa_preview += f"<br>... (+{len(ssas)-5} SSAs)"
+
+            hover_text.append(
+                f"<b>{interval}</b><br>"
+                f"<b>Total SSAs:</b> {len(ssas)}<br>"
+                f"<b>SSAs:</b><br>{ssa_preview}"
+            )
 
         fig = go.Figure(
             [
                 go.Bar(
-                    x=[value_counts.index[i] for i in valid_indices],
-                    y=[value_counts.values[i] for i in valid_indices],
-                    text=[value_counts.values[i] for i in valid_indices],
+                    x=bins.labels,
+                    y=bins.counts.tolist(),
+                    text=bins.counts.tolist(),
                     textposition="auto",
                     name="SSAs por Semana",
                     marker_color="rgb(64, 83, 177)",
-                    hovertext=[hover_text[i] for i in valid_indices],
+                    hovertext=hover_text,
                     hoverinfo="text",
-                    customdata=[list(ssas_by_interval.values())[i] for i in valid_indices],
+                    customdata=ssas_by_interval,
                     hoverlabel=dict(bgcolor="white", font_size=12, font_family="Arial"),
                     showlegend=False,
                 )
@@ -313,77 +303,78 @@ class SSAVisualizer:
 
         return fig
 
+    def _create_empty_chart(self) -> go.Figure:
+        """Creates an empty chart with a title when no data is available."""
+        return go.Figure().update_layout(
+            title="Distribuição de SSAs por Tempo no Estado Atual",
+            xaxis_title="",
+            yaxis_title="",
+            annotations=[
+                {
+                    "text": "Nenhum dado disponível para os filtros selecionados",
+                    "xref": "paper",
+                    "yref": "paper",
+                    "showarrow": False,
+                    "font": {"size": 14},
+                    "x": 0.5,
+                    "y": 0.5,
+                }
+            ],
+        )
+
 
 class WeekAnalyzer:
     """Analisa dados de semanas das SSAs."""
 
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, weeks: Optional[SSAWeeks] = None):
+        """
+        Args:
+            df: DataFrame das SSAs
+            weeks: Semanas já convertidas e alinhadas a df (padrão: calculadas)
+        """
         self.df = df
+        self.weeks = weeks if weeks is not None else SSAWeeks.from_frame(df)
         self.current_date = date.today()
-        self.current_year = self.current_date.year
-        self.current_week = self.current_date.isocalendar()[1]
+        self.current_year, self.current_week, _ = self.current_date.isocalendar()
 
     def calculate_weeks_in_state(self) -> pd.Series:
-        """Calcula quantas semanas cada SSA está em seu estado atual."""
-
-        def get_week_number(week_str):
-            if pd.isna(week_str) or not str(week_str).strip():
-                return None
-            try:
-                week_str = str(week_str).replace(".0", "")
-                if len(week_str) != 6:
-                    return None
-                return int(week_str[4:])
-            except ValueError:
-                return None
-
-        weeks_in_state = self.df.iloc[:, SSAColumns.SEMANA_CADASTRO].apply(get_week_number)
-        current_week = int(self.current_date.strftime("%Y%W")[4:])
-
-        # Garante que a diferença seja sempre positiva
-        return weeks_in_state.apply(
-            lambda x: max(0, current_week - x) if x is not None else None
+        """
+        Calcula quantas semanas cada SSA está em seu estado atual.
+
+        A contagem é a distância em semanas ISO da semana de cadastro até a
+        semana atual, correta na virada do ano.
+
+        Returns:
+            Série alinhada a self.df, com NaN nas SSAs sem semana de cadastro
+        """
+        return pd.Series(
+            self.weeks.weeks_since_registration(self.current_date),
+            index=self.df.index,
         )
 
     def analyze_weeks(self, use_programmed: bool = True) -> pd.DataFrame:
         """Analisa distribuição de SSAs por semana com validação melhorada."""
-        week_column = (
-            SSAColumns.SEMANA_PROGRAMADA if use_programmed else SSAColumns.SEMANA_CADASTRO
-        )
-
-        week_data = []
-        for _, row in self.df.iterrows():
-            week_str = str(row.iloc[week_column])
-            if pd.notna(week_str) and week_str != "None" and week_str != "":
-                try:
-                    if len(week_str) == 6:  # Formato correto YYYYWW
-                        year = int(week_str[:4])
-                        week = int(week_str[4:])
-
-                        if 0 < week <= 53 and 2000 <= year <= 2100:  # Validação básica
-                            week_data.append(
-                                {
-                                    "year": year,
-                                    "week": week,
-                                    "year_week": week_str,
-                                    "prioridade": row.iloc[
-                                        SSAColumns.GRAU_PRIORIDADE_EMISSAO
-                                    ],
-                                    "numero_ssa": row.iloc[SSAColumns.NUMERO_SSA],
-                                }
-                            )
-                except (ValueError, TypeError):
-                    continue
-
-        if not week_data:
+        years, weeks = self.weeks.year_week(use_programmed)
+        # Semanas inválidas já vêm com 0; o intervalo de anos é validação básica
+        valid = (weeks > 0) & (years >= 2000) & (years <= 2100)
+        if not valid.any():
             return pd.DataFrame()
 
-        df_weeks = pd.DataFrame(week_data)
+        df_weeks = pd.DataFrame(
+            {
+                "year_week": (years[valid] * 100 + weeks[valid]).astype(str),
+                "prioridade": self.df.iloc[:, SSAColumns.GRAU_PRIORIDADE_EMISSAO]
+                .to_numpy()[valid],
+                "numero_ssa": self.df.iloc[:, SSAColumns.NUMERO_SSA].to_numpy()[valid],
+                "year": years[valid],
+                "week": weeks[valid],
+            }
+        )
 
         # Organizar os dados
         analysis = (
             df_weeks.groupby(["year_week", "prioridade"])
-            .agg({"numero_ssa": lambda x: list(x), "year": "first", "week": "first"})
+            .agg({"numero_ssa": list, "year": "first", "week": "first"})
             .reset_index()
         )
 
@@ -394,23 +385,3 @@ class WeekAnalyzer:
         analysis = analysis.sort_values(["year", "week"])
 
         return analysis
-
-
-    def _create_empty_chart(self) -> go.Figure:
-        """Creates an empty chart with a title when no data is available."""
-        return go.Figure().update_layout(
-            title="Distribuição de SSAs por Tempo no Estado Atual",
-            xaxis_title="",
-            yaxis_title="",
-            annotations=[
-                {
-                    "text": "Nenhum dado disponível para os filtros selecionados",
-                    "xref": "paper",
-                    "yref": "paper",
-                    "showarrow": False,
-                    "font": {"size": 14},
-                    "x": 0.5,
-                    "y": 0.5,
-                }
-            ],
-        )
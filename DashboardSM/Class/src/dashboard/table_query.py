@@ -0,0 +1,186 @@
+# src/dashboard/table_query.py
+import re
+from operator import eq, ge, gt, le, lt, ne
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..data.ssa_columns import SSAColumns
+
+# Coluna da tabela -> coluna do DataFrame
+TABLE_COLUMNS = {
+    "numero": SSAColumns.NUMERO_SSA,
+    "estado": SSAColumns.SITUACAO,
+    "setor_emissor": SSAColumns.SETOR_EMISSOR,
+    "setor_executor": SSAColumns.SETOR_EXECUTOR,
+    "resp_prog": SSAColumns.RESPONSAVEL_PROGRAMACAO,
+    "resp_exec": SSAColumns.RESPONSAVEL_EXECUCAO,
+    "semana_prog": SSAColumns.SEMANA_PROGRAMADA,
+    "prioridade": SSAColumns.GRAU_PRIORIDADE_EMISSAO,
+    "data_emissao": SSAColumns.EMITIDA_EM,
+    "descricao": SSAColumns.DESC_SSA,
+}
+
+TABLE_DATE_FORMAT = "%d/%m/%Y %H:%M"
+
+# Colunas exibidas como data, qualquer que seja o dtype recebido
+DATE_COLUMNS = {"data_emissao"}
+
+# Um termo do filter_query do DataTable, ex.: {estado} icontains "AAD"
+_FILTER_PART = re.compile(
+    r"^\s*\{(?P<column>[^}]+)\}\s*"
+    r"(?P<operator>[is]?(?:eq|ne|lt|le|gt|ge|contains)\b|datestartswith\b"
+    r"|>=|<=|!=|=|<|>)"
+    r"\s*(?P<value>.*?)\s*$"
+)
+
+_SYMBOLS = {"=": "eq", "!=": "ne", "<": "lt", "<=": "le", ">": "gt", ">=": "ge"}
+
+_COMPARISONS = {"eq": eq, "ne": ne, "lt": lt, "le": le, "gt": gt, "ge": ge}
+
+
+def parse_filter_query(filter_query: Optional[str]) -> List[Tuple[str, str, bool, str]]:
+    """
+    Separa o filter_query do DataTable em termos.
+
+    Args:
+        filter_query: Texto gerado pela linha de filtros da tabela
+
+    Returns:
+        Lista de (coluna, operador, ignora maiúsculas, valor); termos fora
+        do formato esperado são ignorados
+    """
+    parts = []
+    for part in (filter_query or "").split(" && "):
+        match = _FILTER_PART.match(part)
+        if not match:
+            continue
+        operator = _SYMBOLS.get(match["operator"], match["operator"])
+        insensitive = operator.startswith("i")
+        if operator[0] in "is":
+            operator = operator[1:]
+        value = match["value"]
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'`":
+            value = value[1:-1].replace("\\" + value[0], value[0])
+        parts.append((match["column"], operator, insensitive, value))
+    return parts
+
+
+def table_column(df: pd.DataFrame, column_id: str) -> pd.Series:
+    """
+    Coluna do DataFrame correspondente a uma coluna da tabela.
+
+    As colunas de data são convertidas para datetime64 mesmo que cheguem
+    como object (Timestamps ou texto), para que filtro e ordenação não
+    dependam do dtype com que o DataFrame foi carregado.
+
+    Args:
+        df: DataFrame de SSAs
+        column_id: Id da coluna na tabela (chave de TABLE_COLUMNS)
+
+    Returns:
+        Series da coluna
+    """
+    series = df.iloc[:, TABLE_COLUMNS[column_id]]
+    if column_id in DATE_COLUMNS and not pd.api.types.is_datetime64_any_dtype(series):
+        series = pd.to_datetime(series, errors="coerce", dayfirst=True)
+    return series
+
+
+def display_text(series: pd.Series) -> pd.Series:
+    """Texto exibido na tabela para uma coluna (vazios viram '')."""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.dt.strftime(TABLE_DATE_FORMAT).fillna("")
+    values = series.astype(object)
+    return values.where(values.notna(), "").astype(str)
+
+
+def _filter_mask(text: pd.Series, operator: str, insensitive: bool, value: str) -> pd.Series:
+    """Máscara de um termo do filtro sobre o texto exibido da coluna."""
+    if insensitive:
+        text = text.str.lower()
+        value = value.lower()
+
+    if operator == "contains":
+        return text.str.contains(value, regex=False)
+    if operator == "datestartswith":
+        return text.str.startswith(value)
+
+    # Comparação numérica quando o valor e a coluna são números
+    numbers = pd.to_numeric(text, errors="coerce")
+    try:
+        number = float(value)
+    except ValueError:
+        number = None
+    if number is not None and numbers.notna().any():
+        left, right = numbers, number
+    else:
+        left, right = text, value
+
+    return _COMPARISONS[operator](left, right)
+
+
+def _sort_key(series: pd.Series) -> np.ndarray:
+    """Valores usados na ordenação (texto para colunas de categorias/objetos)."""
+    if pd.api.types.is_datetime64_any_dtype(series) or pd.api.types.is_numeric_dtype(
+        series
+    ):
+        return series.to_numpy()
+    values = series.astype(object)
+    return values.where(values.isna(), values.astype(str)).to_numpy()
+
+
+def query_table(
+    df: pd.DataFrame,
+    page_current: int = 0,
+    page_size: int = 30,
+    sort_by: Optional[List[Dict]] = None,
+    filter_query: Optional[str] = None,
+) -> Tuple[pd.DataFrame, int]:
+    """
+    Filtra, ordena e pagina a tabela de SSAs no servidor.
+
+    Só as colunas citadas no filtro e na ordenação são lidas; a página
+    pedida é o único trecho do DataFrame que sai daqui.
+
+    Args:
+        df: DataFrame (já filtrado pelos dropdowns)
+        page_current: Página pedida pela tabela (começa em 0)
+        page_size: Linhas por página
+        sort_by: Ordenação do DataTable ([{"column_id", "direction"}])
+        filter_query: Filtro digitado na linha de filtros da tabela
+
+    Returns:
+        Tupla (linhas da página, total de linhas após o filtro)
+    """
+    positions = np.arange(len(df))
+
+    mask = np.ones(len(df), dtype=bool)
+    for column_id, operator, insensitive, value in parse_filter_query(filter_query):
+        if column_id not in TABLE_COLUMNS:
+            continue
+        text = display_text(table_column(df, column_id))
+        mask &= _filter_mask(text, operator, insensitive, value).fillna(False).to_numpy(
+            dtype=bool
+        )
+    positions = positions[mask]
+
+    sort_by = [item for item in (sort_by or []) if item["column_id"] in TABLE_COLUMNS]
+    if sort_by and len(positions):
+        keys = pd.DataFrame(
+            {
+                index: _sort_key(table_column(df, item["column_id"]).iloc[positions])
+                for index, item in enumerate(sort_by)
+            }
+        )
+        order = keys.sort_values(
+            by=list(keys.columns),
+            ascending=[item["direction"] == "asc" for item in sort_by],
+            kind="mergesort",
+            na_position="last",
+        ).index.to_numpy()
+        positions = positions[order]
+
+    start = max(page_current or 0, 0) * page_size
+    return df.take(positions[start : start + page_size]), len(positions)
@@ -0,0 +1,73 @@
+# src/dashboard/week_bins.py
+from typing import Dict, List
+
+import numpy as np
+
+# Acima deste máximo as semanas são agrupadas em faixas de BIN_WIDTH semanas
+MAX_SINGLE_WEEKS = 50
+BIN_WIDTH = 10
+
+
+class WeekBins:
+    """
+    Barras do gráfico de tempo no estado: rótulo, contagem e linhas de cada uma.
+
+    Com até MAX_SINGLE_WEEKS semanas há uma barra por valor presente
+    ("3 semanas"); acima disso, faixas fixas de BIN_WIDTH semanas a partir
+    de 0 ("10-19 semanas"), inclusive as vazias. As barras saem de um único
+    np.digitize (ou np.unique) e de um único argsort/split, sem reprocessar
+    o array por barra, e os rótulos são gerados junto com elas.
+    """
+
+    def __init__(self, weeks_in_state: np.ndarray):
+        """
+        Args:
+            weeks_in_state: Semanas no estado por linha (NaN fica de fora)
+        """
+        weeks = np.asarray(weeks_in_state, dtype=np.float64)
+        rows = np.flatnonzero(~np.isnan(weeks))
+        values = weeks[rows].astype(np.int64)
+
+        if len(values) == 0:
+            self.labels: List[str] = []
+            self.counts = np.empty(0, dtype=np.int64)
+            self.members: List[np.ndarray] = []
+            self._by_label: Dict[str, int] = {}
+            return
+
+        max_weeks = int(values.max())
+        if max_weeks > MAX_SINGLE_WEEKS:
+            # Última faixa sempre contém o máximo (inclusive múltiplos de 10)
+            last_edge = (max_weeks // BIN_WIDTH + 1) * BIN_WIDTH
+            edges = np.arange(0, last_edge + 1, BIN_WIDTH)
+            bins = np.digitize(values, edges) - 1
+            self.labels = [
+                f"{start}-{start + BIN_WIDTH - 1} semanas" for start in edges[:-1]
+            ]
+        else:
+            present, bins = np.unique(values, return_inverse=True)
+            self.labels = [f"{week} semanas" for week in present]
+
+        # Posições de cada barra, em ordem crescente (argsort estável)
+        self.counts = np.bincount(bins, minlength=len(self.labels))
+        order = np.argsort(bins, kind="stable")
+        self.members = np.split(rows[order], np.cumsum(self.counts)[:-1])
+        self._by_label = {label: index for index, label in enumerate(self.labels)}
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def positions(self, label: str) -> np.ndarray:
+        """
+        Posições das linhas de uma barra.
+
+        Args:
+            label: Rótulo gerado para a barra
+
+        Returns:
+            Array de posições (vazio se o rótulo não existir)
+        """
+        index = self._by_label.get(str(label))
+        if index is None:
+            return np.empty(0, dtype=np.intp)
+        return self.members[index]
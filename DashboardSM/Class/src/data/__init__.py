@@ -4,8 +4,13 @@ Módulo de dados do Dashboard SSA.
 """
 
 from .ssa_data import SSAData
+from .ssa_table import SSATable, SSARow
 from .ssa_columns import SSAColumns
 from .data_loader import DataLoader
+from .categories import CategoryRegistry
+from .snapshot_diff import SnapshotDiff
+from .history_store import SnapshotHistoryStore
+from .shared_dataset import SharedDataset
 from ..utils.file_manager import FileManager
 
-__all__ = ["SSAData", "SSAColumns", "DataLoader", "FileManager"]
+__all__ = ["SSAData", "SSATable", "SSARow", "SSAColumns", "DataLoader", "CategoryRegistry", "SnapshotDiff", "SnapshotHistoryStore", "SharedDataset", "FileManager"]
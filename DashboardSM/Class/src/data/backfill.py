@@ -0,0 +1,166 @@
+# src/data/backfill.py
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .data_loader import DataLoader
+from .history_store import SnapshotHistoryStore
+from .snapshot_cache import DEFAULT_CACHE_DIR, SnapshotCache
+from ..utils.file_manager import FileManager
+
+
+def history_db_path(store_dir: str, pattern_key: str) -> str:
+    """Caminho do banco de histórico de um padrão de arquivo."""
+    if pattern_key == "ssa_pendentes":
+        return str(Path(store_dir) / "history.sqlite")
+    return str(Path(store_dir) / f"history_{pattern_key}.sqlite")
+
+
+def _parse_export(
+    file_path: str, cache_dir: Optional[str]
+) -> Tuple[pd.DataFrame, float]:
+    """
+    Lê e normaliza uma exportação em um processo separado.
+
+    O DataLoader também grava o resultado no cache colunar, então o
+    dashboard aproveita o trabalho do backfill.
+
+    Returns:
+        Tupla (DataFrame normalizado, segundos gastos)
+    """
+    logging.disable(logging.INFO)
+    start = time.perf_counter()
+    df = DataLoader(file_path, cache_dir=cache_dir).load_frame()
+    return df, time.perf_counter() - start
+
+
+def find_pending_exports(
+    directories: List[str],
+    store_dir: str = DEFAULT_CACHE_DIR,
+    pattern_keys: Optional[List[str]] = None,
+) -> List[Dict]:
+    """
+    Lista as exportações que ainda não estão no histórico.
+
+    Arquivos são pulados pela data/hora do nome ou pelo hash do conteúdo
+    (cópias do mesmo arquivo em pastas diferentes entram uma só vez).
+
+    Args:
+        directories: Diretórios com os arquivos xlsx
+        store_dir: Diretório dos bancos de histórico
+        pattern_keys: Padrões do FileManager (padrão: todos)
+
+    Returns:
+        Lista de dicts com file_path, pattern_key, taken_at e sha256
+    """
+    pending = []
+    seen_hashes = set()
+    for directory in directories:
+        file_manager = FileManager(directory)
+        keys = pattern_keys or list(file_manager.file_patterns)
+        for pattern_key in keys:
+            store = SnapshotHistoryStore(history_db_path(store_dir, pattern_key))
+            try:
+                files = file_manager.list_files(pattern_key)
+            except FileNotFoundError as e:
+                logging.warning(str(e))
+                continue
+
+            for taken_at, file_path in files:
+                if store.is_ingested(taken_at):
+                    continue
+                sha256 = SnapshotCache.fingerprint(file_path)["sha256"]
+                if sha256 in seen_hashes or store.has_fingerprint(sha256):
+                    continue
+                seen_hashes.add(sha256)
+                pending.append(
+                    {
+                        "file_path": file_path,
+                        "pattern_key": pattern_key,
+                        "taken_at": taken_at,
+                        "sha256": sha256,
+                    }
+                )
+    return pending
+
+
+def backfill_history(
+    directories: List[str],
+    store_dir: str = DEFAULT_CACHE_DIR,
+    cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+    workers: Optional[int] = None,
+    pattern_keys: Optional[List[str]] = None,
+    progress: Optional[Callable[[int, int, Dict], None]] = None,
+) -> Dict:
+    """
+    Ingere em paralelo todas as exportações antigas no histórico.
+
+    Cada workbook é lido por um processo do pool; o processo principal
+    grava os resultados no SQLite à medida que ficam prontos, um snapshot
+    por transação. Se o backfill for interrompido, basta rodar de novo:
+    o que já foi gravado é pulado.
+
+    Args:
+        directories: Diretórios com os arquivos xlsx
+        store_dir: Diretório dos bancos de histórico
+        cache_dir: Diretório do cache colunar (None desativa)
+        workers: Quantidade de processos (padrão: número de CPUs)
+        pattern_keys: Padrões do FileManager (padrão: todos)
+        progress: Callback (concluídos, total, info) chamado a cada arquivo
+
+    Returns:
+        Dict com total, gravados, erros e tempo decorrido
+    """
+    start = time.perf_counter()
+    pending = find_pending_exports(directories, store_dir, pattern_keys)
+    total = len(pending)
+    summary = {"total": total, "ingested": 0, "errors": 0, "elapsed": 0.0}
+    if not pending:
+        logging.info("Backfill: nenhuma exportação nova para ingerir")
+        return summary
+
+    workers = workers or os.cpu_count() or 1
+    logging.info(f"Backfill: {total} exportações com {workers} processos")
+    stores = {}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_parse_export, item["file_path"], cache_dir): item
+            for item in pending
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            item = futures[future]
+            file_name = Path(item["file_path"]).name
+            try:
+                df, seconds = future.result()
+                pattern_key = item["pattern_key"]
+                if pattern_key not in stores:
+                    stores[pattern_key] = SnapshotHistoryStore(
+                        history_db_path(store_dir, pattern_key)
+                    )
+                if stores[pattern_key].ingest_frame(
+                    item["taken_at"], df, file_name, item["sha256"]
+                ):
+                    summary["ingested"] += 1
+                info = {"file": file_name, "seconds": seconds, "error": None}
+            except Exception as e:
+                summary["errors"] += 1
+                info = {"file": file_name, "seconds": None, "error": str(e)}
+                logging.error(f"Backfill: erro em {file_name}: {str(e)}")
+
+            if progress:
+                progress(done, total, info)
+            else:
+                logging.info(f"Backfill [{done}/{total}] {file_name}")
+
+    summary["elapsed"] = time.perf_counter() - start
+    logging.info(
+        f"Backfill concluído: {summary['ingested']} gravados, "
+        f"{summary['errors']} erros em {summary['elapsed']:.1f}s"
+    )
+    return summary
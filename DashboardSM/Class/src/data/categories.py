@@ -0,0 +1,129 @@
+# src/data/categories.py
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from .ssa_columns import SSAColumns
+
+# Colunas de baixa cardinalidade convertidas para Categorical no modo compacto
+COMPACT_COLUMNS = [
+    SSAColumns.SITUACAO,
+    SSAColumns.SETOR_EMISSOR,
+    SSAColumns.SETOR_EXECUTOR,
+    SSAColumns.GRAU_PRIORIDADE_EMISSAO,
+    SSAColumns.RESPONSAVEL_PROGRAMACAO,
+    SSAColumns.RESPONSAVEL_EXECUCAO,
+    SSAColumns.SISTEMA_ORIGEM,
+    SSAColumns.EXECUCAO_SIMPLES,
+]
+
+
+class CategoryRegistry:
+    """
+    Conjunto estável de categorias por coluna, compartilhado entre snapshots.
+
+    Valores novos são sempre adicionados ao final da lista, de modo que o
+    código inteiro de um valor nunca muda de uma exportação para outra.
+    Com path=None o registro vive apenas em memória.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else None
+        self.categories: Dict[str, List[str]] = {}
+        self._load()
+
+    def _load(self):
+        """Carrega o registro do disco, se existir."""
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.categories = json.load(f)
+        except Exception as e:
+            logging.warning(f"Erro ao ler registro de categorias {self.path}: {e}")
+            self.categories = {}
+
+    def _save(self):
+        """Grava o registro em disco de forma atômica."""
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".json.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.categories, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logging.warning(f"Erro ao gravar registro de categorias {self.path}: {e}")
+
+    def update(self, name: str, values: pd.Series) -> List[str]:
+        """
+        Acrescenta ao registro os valores ainda não vistos de uma coluna.
+
+        Args:
+            name: Nome da coluna
+            values: Valores da coluna
+
+        Returns:
+            Lista de categorias da coluna, na ordem estável
+        """
+        known = self.categories.setdefault(name, [])
+        seen = set(known)
+        new_values = sorted(
+            str(value) for value in values.dropna().unique() if str(value) not in seen
+        )
+        if new_values:
+            known.extend(new_values)
+        return known
+
+    def encode(self, df: pd.DataFrame, columns: List[int] = COMPACT_COLUMNS) -> pd.DataFrame:
+        """
+        Converte as colunas indicadas para Categorical com as categorias do registro.
+
+        Args:
+            df: DataFrame normalizado pelo DataLoader
+            columns: Índices das colunas a converter
+
+        Returns:
+            Novo DataFrame com as colunas convertidas
+        """
+        df = df.copy()
+        changed = False
+        for col in columns:
+            name = df.columns[col]
+            before = len(self.categories.get(name, []))
+            categories = self.update(name, df.iloc[:, col])
+            changed |= len(categories) != before
+            df.isetitem(col, pd.Categorical(df.iloc[:, col], categories=categories))
+
+        if changed:
+            self._save()
+        return df
+
+
+def value_counts(series: pd.Series, normalize: bool = False) -> pd.Series:
+    """
+    value_counts que ignora categorias sem ocorrências.
+
+    Em colunas Categorical a contagem é feita sobre os códigos inteiros,
+    mas o pandas inclui todas as categorias do registro, inclusive as que
+    não aparecem no recorte filtrado. O resultado fica igual ao de uma
+    coluna object: só valores presentes, empates na ordem de aparição.
+    Colunas de texto string[pyarrow] também devolvem índice object.
+    """
+    counts = series.value_counts(normalize=normalize)
+    if isinstance(series.dtype, pd.StringDtype):
+        counts.index = counts.index.astype(object)
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Mesma ordem do caso object: empates na ordem de aparição dos valores
+        appearance = series.dropna().unique().astype(object)
+        counts = counts.reindex(appearance).sort_values(
+            ascending=False, kind="stable"
+        )
+        counts.index = counts.index.astype(object)
+        counts.index.name = series.name
+    return counts
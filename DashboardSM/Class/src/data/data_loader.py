@@ -1,4 +1,5 @@
 # src/data/data_loader.py
+import numpy as np
 import pandas as pd
 import logging
 import os
@@ -8,17 +9,55 @@ from datetime import datetime
 from ..utils.date_utils import diagnose_dates
 from ..utils.file_manager import FileManager
 from .ssa_data import SSAData
+from .ssa_table import SSATable
 from .ssa_columns import SSAColumns
+from .categories import CategoryRegistry
+from .snapshot_cache import DEFAULT_CACHE_DIR, SnapshotCache
+from .snapshot_diff import SnapshotDiff, diff_snapshots
+from .xlsx_stream import iter_excel_chunks
 from ..utils.data_validator import SSADataValidator
 
 class DataLoader:
     """Carrega e prepara os dados das SSAs."""
 
-    def __init__(self, excel_path: str):
+    def __init__(
+        self,
+        excel_path: str,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+        streaming: bool = False,
+        chunk_size: int = 5000,
+        compact: bool = False,
+        stream_engine: str = "openpyxl",
+    ):
+        """
+        Args:
+            excel_path: Caminho do arquivo de exportação do SAM
+            cache_dir: Diretório do cache de snapshots (None desativa o cache)
+            streaming: Lê a planilha em blocos (read-only) em vez de pd.read_excel
+            chunk_size: Linhas por bloco no modo streaming
+            compact: Converte colunas de baixa cardinalidade para Categorical
+            stream_engine: Leitor do modo streaming: 'openpyxl' (memória
+                limitada ao bloco) ou 'calamine' (mais rápido, carrega a
+                planilha inteira)
+        """
         self.excel_path = excel_path
+        self.streaming = streaming
+        self.chunk_size = chunk_size
+        self.stream_engine = stream_engine
+        self.compact = compact
+        self.category_registry = (
+            CategoryRegistry(
+                os.path.join(cache_dir, "categories.json") if cache_dir else None
+            )
+            if compact
+            else None
+        )
         self.df = None
-        self.ssa_objects = []
+        self.ssa_objects = SSATable.empty()
         self.validator = SSADataValidator()
+        self.cache = SnapshotCache(cache_dir) if cache_dir else None
+        self.loaded_from_cache = False
+        self.last_diff: Optional[SnapshotDiff] = None
         # self.file_manager = FileManager(os.path.dirname(excel_path)) # Evitar ref circular
 
     def validate_and_fix_date(self, date_str, row_num, logger=None):
@@ -61,17 +100,21 @@ class DataLoader:
     def _convert_dates(self):
         """Converte e valida datas mantendo o tipo apropriado."""
         try:
-            # Se a coluna já for datetime, não precisa converter
-            if pd.api.types.is_datetime64_any_dtype(self.df.iloc[:, SSAColumns.EMITIDA_EM]):
+            dates = self.df.iloc[:, SSAColumns.EMITIDA_EM]
+            if pd.api.types.is_datetime64_any_dtype(dates):
                 logging.info("Coluna já está em formato datetime")
-                return
+            elif dates.map(lambda value: isinstance(value, str)).any():
+                # Texto da exportação: converte usando o formato do SAM
+                dates = pd.to_datetime(
+                    dates, format="%d/%m/%Y %H:%M:%S", errors="coerce"
+                )
+            else:
+                # Células já lidas como data pelo Excel (Timestamps em object)
+                dates = pd.to_datetime(dates, errors="coerce")
 
-            # Converte diretamente para datetime usando o formato correto
-            self.df.iloc[:, SSAColumns.EMITIDA_EM] = pd.to_datetime(
-                self.df.iloc[:, SSAColumns.EMITIDA_EM],
-                format="%d/%m/%Y %H:%M:%S",
-                errors="coerce",
-            )
+            # isetitem troca a coluna inteira: a atribuição via iloc manteria
+            # o dtype object e o cache devolveria datetime64, outro dtype
+            self.df.isetitem(SSAColumns.EMITIDA_EM, dates.astype("datetime64[ns]"))
 
             # Verifica se houve problemas
             invalid_mask = self.df.iloc[:, SSAColumns.EMITIDA_EM].isna()
@@ -88,150 +131,233 @@ class DataLoader:
             logging.error(f"Erro no processamento de datas: {str(e)}")
             raise
 
-    def load_data(self) -> pd.DataFrame:
-        """Carrega dados do Excel com as configurações corretas."""
-        try:
-            # Inicializa validador se ainda não existe
-            if not hasattr(self, "validator"):
-                self.validator = SSADataValidator()
+    def _read_excel(self) -> pd.DataFrame:
+        """Lê o arquivo Excel bruto (cabeçalho na segunda linha)."""
+        logging.info(f"Iniciando carregamento do arquivo: {self.excel_path}")
 
-            logging.info(f"Iniciando carregamento do arquivo: {self.excel_path}")
+        # Carrega o Excel pulando a primeira linha (cabeçalho na segunda linha)
+        df = pd.read_excel(
+            self.excel_path,
+            header=1,  # Cabeçalho na segunda linha
+        )
 
-            # Carrega o Excel pulando a primeira linha (cabeçalho na segunda linha)
-            self.df = pd.read_excel(
-                self.excel_path,
-                header=1,  # Cabeçalho na segunda linha
-            )
+        logging.info(f"Arquivo carregado. Total de linhas: {len(df)}")
+        return df
 
-            logging.info(f"Arquivo carregado. Total de linhas: {len(self.df)}")
-
-            # Diagnóstico inicial de datas
-            date_diagnosis = diagnose_dates(self.df, SSAColumns.EMITIDA_EM)
-            if date_diagnosis["error_count"] > 0:
-                logging.info("=== Diagnóstico de Datas ===")
-                logging.info(f"Total de linhas: {date_diagnosis['total_rows']}")
-                logging.info(f"Problemas encontrados: {date_diagnosis['error_count']}")
-                for prob in date_diagnosis["problematic_rows"]:
-                    logging.info(f"\nLinha {prob['index'] + 1}:")
-                    logging.info(f"  Valor encontrado: {prob['value']}")
-                    logging.info(f"  Motivo: {prob['reason']}")
-                    logging.info("  Dados da linha:")
-                    for key, value in prob["row_data"].items():
-                        logging.info(f"    {key}: {value}")
-
-            # Converte as datas
-            self._convert_dates()
-
-            # Converte colunas string
-            string_columns = [
-                SSAColumns.NUMERO_SSA,
-                SSAColumns.SITUACAO,
-                SSAColumns.SEMANA_CADASTRO,
-                SSAColumns.GRAU_PRIORIDADE_EMISSAO,
-                SSAColumns.SETOR_EXECUTOR,
-                SSAColumns.DERIVADA,
-                SSAColumns.LOCALIZACAO,
-                SSAColumns.DESC_LOCALIZACAO,
-                SSAColumns.EQUIPAMENTO,
-                SSAColumns.DESC_SSA,
-                SSAColumns.SETOR_EMISSOR,
-                SSAColumns.SOLICITANTE,
-                SSAColumns.SERVICO_ORIGEM,
-                SSAColumns.EXECUCAO_SIMPLES,
-                SSAColumns.SISTEMA_ORIGEM,
-                SSAColumns.ANOMALIA,
-            ]
-
-            for col in string_columns:
-                try:
-                    self.df.iloc[:, col] = (
-                        self.df.iloc[:, col].astype(str).str.strip().replace("nan", "")
-                    )
-                except Exception as e:
-                    logging.error(f"Erro ao converter coluna {col}: {str(e)}")
+    def _load_streaming(self) -> pd.DataFrame:
+        """
+        Lê a planilha em blocos e aplica as conversões bloco a bloco.
 
-            # Padroniza prioridades para maiúsculas
-            self.df.iloc[:, SSAColumns.GRAU_PRIORIDADE_EMISSAO] = (
-                self.df.iloc[:, SSAColumns.GRAU_PRIORIDADE_EMISSAO].str.upper().str.strip()
+        Com o leitor openpyxl (padrão) mantém em memória apenas um bloco
+        bruto por vez, além dos blocos já normalizados, o que limita o pico
+        de memória em exportações grandes.
+        """
+        logging.info(f"Iniciando carregamento em streaming: {self.excel_path}")
+        parts = []
+        total_rows = 0
+        for chunk in iter_excel_chunks(
+            self.excel_path,
+            header=1,
+            chunk_size=self.chunk_size,
+            engine=self.stream_engine,
+        ):
+            total_rows += len(chunk)
+            self.df = chunk
+            self._prepare_frame()
+            parts.append(self.df)
+
+        logging.info(f"Arquivo carregado. Total de linhas: {total_rows}")
+        if not parts:
+            raise ValueError(f"Nenhuma linha encontrada em {self.excel_path}")
+        return pd.concat(parts)
+
+    @staticmethod
+    def _as_text(series: pd.Series) -> pd.Series:
+        """
+        Converte uma coluna para str sem o sufixo ".0" que aparece quando o
+        pandas lê números inteiros como float (colunas com células vazias).
+        """
+        if pd.api.types.is_float_dtype(series):
+            integral = series.notna() & (series % 1 == 0)
+            text = series.astype(str)
+            text[integral] = series[integral].astype("int64").astype(str)
+            return text
+        # Células vazias (None) viram "nan", como no caminho do pd.read_excel
+        return series.astype(str).where(series.notna(), "nan")
+
+    def _prepare_frame(self):
+        """Aplica diagnóstico e todas as conversões de tipo em self.df."""
+        # Diagnóstico inicial de datas
+        date_diagnosis = diagnose_dates(self.df, SSAColumns.EMITIDA_EM)
+        if date_diagnosis["error_count"] > 0:
+            logging.info("=== Diagnóstico de Datas ===")
+            logging.info(f"Total de linhas: {date_diagnosis['total_rows']}")
+            logging.info(f"Problemas encontrados: {date_diagnosis['error_count']}")
+            if len(date_diagnosis["problematic_rows"]) < date_diagnosis["error_count"]:
+                logging.info(
+                    f"Detalhando as primeiras "
+                    f"{len(date_diagnosis['problematic_rows'])} ocorrências"
+                )
+            for prob in date_diagnosis["problematic_rows"]:
+                logging.info(f"\nLinha {prob['index'] + 1}:")
+                logging.info(f"  Valor encontrado: {prob['value']}")
+                logging.info(f"  Motivo: {prob['reason']}")
+                logging.info("  Dados da linha:")
+                for key, value in prob["row_data"].items():
+                    logging.info(f"    {key}: {value}")
+
+        # Converte as datas
+        self._convert_dates()
+
+        # Converte colunas string
+        string_columns = [
+            SSAColumns.NUMERO_SSA,
+            SSAColumns.SITUACAO,
+            SSAColumns.SEMANA_CADASTRO,
+            SSAColumns.GRAU_PRIORIDADE_EMISSAO,
+            SSAColumns.SETOR_EXECUTOR,
+            SSAColumns.DERIVADA,
+            SSAColumns.LOCALIZACAO,
+            SSAColumns.DESC_LOCALIZACAO,
+            SSAColumns.EQUIPAMENTO,
+            SSAColumns.DESC_SSA,
+            SSAColumns.SETOR_EMISSOR,
+            SSAColumns.SOLICITANTE,
+            SSAColumns.SERVICO_ORIGEM,
+            SSAColumns.EXECUCAO_SIMPLES,
+            SSAColumns.SISTEMA_ORIGEM,
+            SSAColumns.ANOMALIA,
+        ]
+
+        for col in string_columns:
+            try:
+                self.df.iloc[:, col] = (
+                    self._as_text(self.df.iloc[:, col]).str.strip().replace("nan", "")
+                )
+            except Exception as e:
+                logging.error(f"Erro ao converter coluna {col}: {str(e)}")
+
+        # Padroniza prioridades para maiúsculas
+        self.df.iloc[:, SSAColumns.GRAU_PRIORIDADE_EMISSAO] = (
+            self.df.iloc[:, SSAColumns.GRAU_PRIORIDADE_EMISSAO].str.upper().str.strip()
+        )
+
+        # Converte colunas opcionais
+        optional_string_columns = [
+            SSAColumns.GRAU_PRIORIDADE_PLANEJAMENTO,
+            SSAColumns.RESPONSAVEL_PROGRAMACAO,
+            SSAColumns.SEMANA_PROGRAMADA,
+            SSAColumns.RESPONSAVEL_EXECUCAO,
+            SSAColumns.DESCRICAO_EXECUCAO,
+        ]
+
+        for col in optional_string_columns:
+            try:
+                self.df.iloc[:, col] = (
+                    self._as_text(self.df.iloc[:, col])
+                    .replace("nan", None)
+                    .replace("", None)
+                )
+            except Exception as e:
+                logging.error(f"Erro ao converter coluna opcional {col}: {str(e)}")
+
+        # Remove linhas com número da SSA vazio
+        empty_ssa_count = (
+            self.df.iloc[:, SSAColumns.NUMERO_SSA].str.strip() == ""
+        ).sum()
+        if empty_ssa_count > 0:
+            logging.warning(
+                f"Removendo {empty_ssa_count} linhas com número de SSA vazio"
             )
 
-            # Converte colunas opcionais
-            optional_string_columns = [
-                SSAColumns.GRAU_PRIORIDADE_PLANEJAMENTO,
-                SSAColumns.RESPONSAVEL_PROGRAMACAO,
-                SSAColumns.SEMANA_PROGRAMADA,
-                SSAColumns.RESPONSAVEL_EXECUCAO,
-                SSAColumns.DESCRICAO_EXECUCAO,
-            ]
+        self.df = self.df[self.df.iloc[:, SSAColumns.NUMERO_SSA].str.strip() != ""]
 
-            for col in optional_string_columns:
-                try:
-                    self.df.iloc[:, col] = (
-                        self.df.iloc[:, col]
-                        .astype(str)
-                        .replace("nan", None)
-                        .replace("", None)
-                    )
-                except Exception as e:
-                    logging.error(f"Erro ao converter coluna opcional {col}: {str(e)}")
-
-            # Remove linhas com número da SSA vazio
-            empty_ssa_count = (
-                self.df.iloc[:, SSAColumns.NUMERO_SSA].str.strip() == ""
-            ).sum()
-            if empty_ssa_count > 0:
-                logging.warning(
-                    f"Removendo {empty_ssa_count} linhas com número de SSA vazio"
+        # Trata semana cadastro e programada
+        try:
+            # Trata semana cadastro
+            self.df.iloc[:, SSAColumns.SEMANA_CADASTRO] = (
+                pd.to_numeric(
+                    self.df.iloc[:, SSAColumns.SEMANA_CADASTRO], errors="coerce"
                 )
+                .fillna(0)
+                .astype(int)
+                .astype(str)
+                .str.zfill(6)  # Garante 6 dígitos (AAASS)
+            )
 
-            self.df = self.df[self.df.iloc[:, SSAColumns.NUMERO_SSA].str.strip() != ""]
+            # Trata semana programada
+            self.df.iloc[:, SSAColumns.SEMANA_PROGRAMADA] = (
+                pd.to_numeric(
+                    self.df.iloc[:, SSAColumns.SEMANA_PROGRAMADA], errors="coerce"
+                )
+                .fillna(0)
+                .astype(int)
+                .astype(str)
+                .str.zfill(6)
+            )
+            self.df.iloc[:, SSAColumns.SEMANA_PROGRAMADA] = self.df.iloc[
+                :, SSAColumns.SEMANA_PROGRAMADA
+            ].replace("000000", None)
+
+        except Exception as e:
+            logging.error(f"Erro ao formatar semanas: {str(e)}")
 
-            # Trata semana cadastro e programada
+    def load_frame(self) -> pd.DataFrame:
+        """
+        Carrega o DataFrame normalizado, usando o cache de snapshots quando
+        o arquivo de exportação não mudou desde o último carregamento.
+
+        Returns:
+            DataFrame com todas as conversões aplicadas
+        """
+        fingerprint = None
+        if self.cache is not None:
             try:
-                # Trata semana cadastro
-                self.df.iloc[:, SSAColumns.SEMANA_CADASTRO] = (
-                    pd.to_numeric(
-                        self.df.iloc[:, SSAColumns.SEMANA_CADASTRO], errors="coerce"
-                    )
-                    .fillna(0)
-                    .astype(int)
-                    .astype(str)
-                    .str.zfill(6)  # Garante 6 dígitos (AAASS)
-                )
+                fingerprint = self.cache.fingerprint(self.excel_path)
+                cached_df = self.cache.load(fingerprint)
+                if cached_df is not None:
+                    self.df = cached_df
+                    self.loaded_from_cache = True
+                    return self._apply_compact()
+            except OSError as e:
+                logging.warning(f"Erro ao verificar cache do snapshot: {str(e)}")
+                fingerprint = None
+
+        self.loaded_from_cache = False
+        if self.streaming:
+            self.df = self._load_streaming()
+        else:
+            self.df = self._read_excel()
+            self._prepare_frame()
+
+        if fingerprint is not None:
+            self.cache.store(fingerprint, self.df)
+
+        return self._apply_compact()
+
+    def _apply_compact(self) -> pd.DataFrame:
+        """
+        No modo compacto, converte as colunas de baixa cardinalidade para
+        Categorical. O cache guarda sempre o DataFrame sem essa conversão,
+        para ser compartilhado entre os dois modos.
+        """
+        if self.compact:
+            self.df = self.category_registry.encode(self.df)
+        return self.df
 
-                # Trata semana programada
-                self.df.iloc[:, SSAColumns.SEMANA_PROGRAMADA] = (
-                    pd.to_numeric(
-                        self.df.iloc[:, SSAColumns.SEMANA_PROGRAMADA], errors="coerce"
-                    )
-                    .fillna(0)
-                    .astype(int)
-                    .astype(str)
-                    .str.zfill(6)
-                )
-                self.df.iloc[:, SSAColumns.SEMANA_PROGRAMADA] = self.df.iloc[
-                    :, SSAColumns.SEMANA_PROGRAMADA
-                ].replace("000000", None)
+    def load_data(self) -> pd.DataFrame:
+        """Carrega dados do Excel com as configurações corretas."""
+        try:
+            # Inicializa validador se ainda não existe
+            if not hasattr(self, "validator"):
+                self.validator = SSADataValidator()
 
-            except Exception as e:
-                logging.error(f"Erro ao formatar semanas: {str(e)}")
+            self.load_frame()
 
             # Converte para objetos SSAData
             self._convert_to_objects()
 
-            # NOVO: Validação com o SSADataValidator
-            validation_result = self.validator.validate_data_consistency(self.ssa_objects)
-            if not validation_result.is_valid:
-                logging.warning("=== Problemas de Consistência Encontrados ===")
-                for issue in validation_result.issues:
-                    logging.warning(issue)
-
-            # NOVO: Verifica integridade dos dados
-            integrity_report = self.validator.verify_data_integrity(self.ssa_objects)
-            if integrity_report["warnings"]:
-                logging.warning("=== Avisos de Integridade ===")
-                for warning in integrity_report["warnings"]:
-                    logging.warning(warning)
+            validation_result = self._run_validation(self.ssa_objects)
 
             # Log de estatísticas
             logging.info("=== Estatísticas do Carregamento ===")
@@ -254,6 +380,114 @@ class DataLoader:
             logging.error(traceback.format_exc())
             raise
 
+    def _run_validation(self, ssa_objects: SSATable):
+        """
+        Executa as validações do SSADataValidator e registra os problemas.
+
+        Args:
+            ssa_objects: SSAs a validar
+
+        Returns:
+            ValidationResult da verificação de consistência
+        """
+        # NOVO: Validação com o SSADataValidator
+        validation_result = self.validator.validate_data_consistency(ssa_objects)
+        if not validation_result.is_valid:
+            logging.warning("=== Problemas de Consistência Encontrados ===")
+            for issue in validation_result.issues:
+                logging.warning(issue)
+
+        # NOVO: Verifica integridade dos dados
+        integrity_report = self.validator.verify_data_integrity(ssa_objects)
+        if integrity_report["warnings"]:
+            logging.warning("=== Avisos de Integridade ===")
+            for warning in integrity_report["warnings"]:
+                logging.warning(warning)
+
+        return validation_result
+
+    def reload(self, excel_path: Optional[str] = None) -> Optional[SnapshotDiff]:
+        """
+        Recarrega os dados a partir de uma nova exportação de forma incremental.
+
+        A exportação nova é comparada com a anterior pelo número da SSA e pelo
+        hash do conteúdo de cada linha. Apenas as SSAs novas e alteradas passam
+        pela conversão para o SSATable e pelo SSADataValidator; as demais são
+        reaproveitadas da tabela anterior e as encerradas são descartadas.
+
+        Args:
+            excel_path: Caminho da nova exportação (padrão: o arquivo atual)
+
+        Returns:
+            SnapshotDiff com SSAs novas, encerradas, alteradas e mudanças de
+            estado (também disponível em self.last_diff), ou None se houver
+            números de SSA duplicados e a recarga tiver sido completa
+        """
+        previous_df = self.df
+        previous_table = self.ssa_objects
+        if excel_path is not None:
+            self.excel_path = excel_path
+
+        if previous_df is None:
+            self.load_data()
+            self.last_diff = diff_snapshots(self.df.iloc[0:0], self.df)
+            return self.last_diff
+
+        try:
+            self.load_frame()
+            try:
+                diff = diff_snapshots(previous_df, self.df)
+            except ValueError as e:
+                logging.warning(f"{str(e)} - recarregando tudo")
+                self.ssa_objects = SSATable.empty()
+                self._convert_to_objects()
+                self._run_validation(self.ssa_objects)
+                self._validate_data_quality()
+                self.last_diff = None
+                return None
+
+            logging.info(
+                f"Recarga incremental: {len(diff.added)} novas, "
+                f"{len(diff.removed)} encerradas, {len(diff.changed)} alteradas "
+                f"({len(diff.state_changed)} mudanças de estado)"
+            )
+
+            numeros = self.df.iloc[:, SSAColumns.NUMERO_SSA].astype(str).to_numpy()
+            affected = np.isin(numeros, diff.added + diff.changed)
+
+            # Converte apenas as SSAs novas e alteradas
+            subset = self.df[affected]
+            fresh_table, row_errors = SSATable.from_columns(
+                self._prepare_object_columns(subset), subset.index.to_numpy()
+            )
+            for pos, message in row_errors.items():
+                logging.error(f"Erro ao converter linha {subset.index[pos]}: {message}")
+
+            # Reaproveita as SSAs inalteradas, com o índice da nova exportação
+            kept_table = previous_table.take(
+                np.isin(previous_table.column("numero"), numeros[~affected])
+            )
+            positions = pd.Index(numeros).get_indexer(kept_table.column("numero"))
+            kept_table.index = self.df.index.to_numpy()[positions]
+
+            # Mantém a ordem das linhas da nova exportação
+            table = SSATable.concat([kept_table, fresh_table])
+            self.ssa_objects = table.take(
+                np.argsort(self.df.index.get_indexer(table.index), kind="stable")
+            )
+
+            if len(fresh_table):
+                self._run_validation(fresh_table)
+            self._validate_data_quality()
+
+            self.last_diff = diff
+            return diff
+
+        except Exception as e:
+            logging.error(f"Erro na recarga incremental: {str(e)}")
+            logging.error(traceback.format_exc())
+            raise
+
     def _validate_data_quality(self):
         """Valida a qualidade dos dados após as conversões."""
         issues = []
@@ -284,9 +518,89 @@ class DataLoader:
             logging.warning("Problemas encontrados nos dados: " + "; ".join(issues))
 
 
+    # Mapeamento campo do SSAData -> (coluna, vazio vira None)
+    OBJECT_FIELD_COLUMNS = [
+        ("numero", SSAColumns.NUMERO_SSA, False),
+        ("situacao", SSAColumns.SITUACAO, False),
+        ("derivada", SSAColumns.DERIVADA, True),
+        ("localizacao", SSAColumns.LOCALIZACAO, False),
+        ("desc_localizacao", SSAColumns.DESC_LOCALIZACAO, False),
+        ("equipamento", SSAColumns.EQUIPAMENTO, False),
+        ("semana_cadastro", SSAColumns.SEMANA_CADASTRO, False),
+        ("descricao", SSAColumns.DESC_SSA, False),
+        ("setor_emissor", SSAColumns.SETOR_EMISSOR, False),
+        ("setor_executor", SSAColumns.SETOR_EXECUTOR, False),
+        ("solicitante", SSAColumns.SOLICITANTE, False),
+        ("servico_origem", SSAColumns.SERVICO_ORIGEM, False),
+        ("prioridade_planejamento", SSAColumns.GRAU_PRIORIDADE_PLANEJAMENTO, True),
+        ("execucao_simples", SSAColumns.EXECUCAO_SIMPLES, False),
+        ("semana_programada", SSAColumns.SEMANA_PROGRAMADA, True),
+        ("descricao_execucao", SSAColumns.DESCRICAO_EXECUCAO, True),
+        ("sistema_origem", SSAColumns.SISTEMA_ORIGEM, False),
+        ("anomalia", SSAColumns.ANOMALIA, True),
+    ]
+
+    @staticmethod
+    def _clean_string_column(series: pd.Series, empty_as_none: bool) -> np.ndarray:
+        """Aplica str() e strip() em uma coluna inteira de uma só vez."""
+        cleaned = series.astype(str).str.strip()
+        if empty_as_none:
+            cleaned = cleaned.where(cleaned != "", None)
+        return cleaned.to_numpy(dtype=object)
+
+    @staticmethod
+    def _clean_responsavel_column(series: pd.Series) -> np.ndarray:
+        """Normaliza uma coluna de responsável: strip, maiúsculas e None para vazios."""
+        cleaned = series.astype(str).str.strip()
+        missing = cleaned.str.lower().isin(["nan", "none", ""])
+        return cleaned.str.upper().where(~missing, None).to_numpy(dtype=object)
+
+    def _prepare_object_columns(
+        self, df: Optional[pd.DataFrame] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Limpa coluna a coluna todos os campos usados pelo SSAData.
+
+        Args:
+            df: Recorte do DataFrame a converter (padrão: self.df inteiro)
+
+        Returns:
+            Dicionário campo -> array já normalizado
+        """
+        if df is None:
+            df = self.df
+        columns = {
+            field: self._clean_string_column(df.iloc[:, col], empty_as_none)
+            for field, col, empty_as_none in self.OBJECT_FIELD_COLUMNS
+        }
+        columns["prioridade_emissao"] = (
+            df.iloc[:, SSAColumns.GRAU_PRIORIDADE_EMISSAO]
+            .astype(str)
+            .str.strip()
+            .str.upper()
+            .to_numpy(dtype=object)
+        )
+        columns["responsavel_execucao"] = self._clean_responsavel_column(
+            df.iloc[:, SSAColumns.RESPONSAVEL_EXECUCAO]
+        )
+        columns["responsavel_programacao"] = self._clean_responsavel_column(
+            df.iloc[:, SSAColumns.RESPONSAVEL_PROGRAMACAO]
+        )
+
+        emitida_em = df.iloc[:, SSAColumns.EMITIDA_EM]
+        columns["emitida_em"] = emitida_em.astype(object).where(
+            emitida_em.notna(), None
+        ).to_numpy(dtype=object)
+
+        return columns
+
     def _convert_to_objects(self) -> int:
         """
-        Converte as linhas do DataFrame em objetos SSAData.
+        Converte as linhas do DataFrame em um SSATable.
+
+        A limpeza dos campos é feita por coluna (pandas) e a tabela guarda
+        os arrays resultantes; SSATable[i] devolve uma view com a API do
+        SSAData, sem instanciar um objeto por linha.
 
         Returns:
             int: Número de objetos convertidos com sucesso
@@ -295,83 +609,26 @@ class DataLoader:
             Exception: Se houver erro durante a conversão
         """
         try:
-            self.ssa_objects = []
-            unique_responsaveis = set()
-            unique_responsaveis_prog = set()
+            columns = self._prepare_object_columns()
+
+            resp_exec = columns["responsavel_execucao"]
+            resp_prog = columns["responsavel_programacao"]
+            unique_responsaveis = set(resp_exec[pd.notna(resp_exec)])
+            unique_responsaveis_prog = set(resp_prog[pd.notna(resp_prog)])
             conversions = {
-                "exec": {"total": 0, "errors": 0},
-                "prog": {"total": 0, "errors": 0},
+                "exec": {"total": int(pd.notna(resp_exec).sum()), "errors": 0},
+                "prog": {"total": int(pd.notna(resp_prog).sum()), "errors": 0},
             }
 
-            for idx, row in self.df.iterrows():
-                try:
-                    # Processamento do responsável execução
-                    responsavel = str(row.iloc[SSAColumns.RESPONSAVEL_EXECUCAO]).strip()
-                    if responsavel.lower() in ["nan", "none", ""]:
-                        responsavel = None
-                    elif responsavel:
-                        responsavel = responsavel.upper()
-                        unique_responsaveis.add(responsavel)
-                        conversions["exec"]["total"] += 1
-
-                    # Processamento do responsável programação
-                    resp_prog = str(row.iloc[SSAColumns.RESPONSAVEL_PROGRAMACAO]).strip()
-                    if resp_prog.lower() in ["nan", "none", ""]:
-                        resp_prog = None
-                    elif resp_prog:
-                        resp_prog = resp_prog.upper()
-                        unique_responsaveis_prog.add(resp_prog)
-                        conversions["prog"]["total"] += 1
-
-                    # Criação do objeto SSA
-                    ssa = SSAData(
-                        numero=str(row.iloc[SSAColumns.NUMERO_SSA]).strip(),
-                        situacao=str(row.iloc[SSAColumns.SITUACAO]).strip(),
-                        derivada=str(row.iloc[SSAColumns.DERIVADA]).strip() or None,
-                        localizacao=str(row.iloc[SSAColumns.LOCALIZACAO]).strip(),
-                        desc_localizacao=str(row.iloc[SSAColumns.DESC_LOCALIZACAO]).strip(),
-                        equipamento=str(row.iloc[SSAColumns.EQUIPAMENTO]).strip(),
-                        semana_cadastro=str(row.iloc[SSAColumns.SEMANA_CADASTRO]).strip(),
-                        emitida_em=(
-                            row.iloc[SSAColumns.EMITIDA_EM]
-                            if pd.notna(row.iloc[SSAColumns.EMITIDA_EM])
-                            else None
-                        ),
-                        descricao=str(row.iloc[SSAColumns.DESC_SSA]).strip(),
-                        setor_emissor=str(row.iloc[SSAColumns.SETOR_EMISSOR]).strip(),
-                        setor_executor=str(row.iloc[SSAColumns.SETOR_EXECUTOR]).strip(),
-                        solicitante=str(row.iloc[SSAColumns.SOLICITANTE]).strip(),
-                        servico_origem=str(row.iloc[SSAColumns.SERVICO_ORIGEM]).strip(),
-                        prioridade_emissao=str(row.iloc[SSAColumns.GRAU_PRIORIDADE_EMISSAO])
-                        .strip()
-                        .upper(),
-                        prioridade_planejamento=str(
-                            row.iloc[SSAColumns.GRAU_PRIORIDADE_PLANEJAMENTO]
-                        ).strip()
-                        or None,
-                        execucao_simples=str(row.iloc[SSAColumns.EXECUCAO_SIMPLES]).strip(),
-                        responsavel_programacao=resp_prog,  # Já processado acima
-                        semana_programada=str(
-                            row.iloc[SSAColumns.SEMANA_PROGRAMADA]
-                        ).strip()
-                        or None,
-                        responsavel_execucao=responsavel,  # Já processado acima, não é mais tupla
-                        descricao_execucao=str(
-                            row.iloc[SSAColumns.DESCRICAO_EXECUCAO]
-                        ).strip()
-                        or None,
-                        sistema_origem=str(row.iloc[SSAColumns.SISTEMA_ORIGEM]).strip(),
-                        anomalia=str(row.iloc[SSAColumns.ANOMALIA]).strip() or None,
-                    )
-                    self.ssa_objects.append(ssa)
-
-                except Exception as e:
-                    logging.error(f"Erro ao converter linha {idx}: {str(e)}")
-                    if responsavel:
-                        conversions["exec"]["errors"] += 1
-                    if resp_prog:
-                        conversions["prog"]["errors"] += 1
-                    continue
+            self.ssa_objects, row_errors = SSATable.from_columns(
+                columns, self.df.index.to_numpy()
+            )
+            for pos, message in row_errors.items():
+                logging.error(f"Erro ao converter linha {self.df.index[pos]}: {message}")
+                if resp_exec[pos]:
+                    conversions["exec"]["errors"] += 1
+                if resp_prog[pos]:
+                    conversions["prog"]["errors"] += 1
 
             # Log de estatísticas e validações
             logging.info("=== Estatísticas de Conversão ===")
@@ -409,13 +666,20 @@ class DataLoader:
         self, unique_responsaveis: set, unique_responsaveis_prog: set
     ):
         """Log detalhado dos responsáveis."""
+        # Agrupa as SSAs por responsável em uma única passada
+        por_exec: Dict[str, List[SSAData]] = {}
+        por_prog: Dict[str, List[SSAData]] = {}
+        for ssa in self.ssa_objects:
+            if ssa.responsavel_execucao:
+                por_exec.setdefault(ssa.responsavel_execucao.upper(), []).append(ssa)
+            if ssa.responsavel_programacao:
+                por_prog.setdefault(ssa.responsavel_programacao.upper(), []).append(
+                    ssa
+                )
+
         logging.info("\n=== Validação de Responsáveis Execução ===")
         for resp in sorted(unique_responsaveis):
-            ssas_resp = [
-                ssa
-                for ssa in self.ssa_objects
-                if ssa.responsavel_execucao and ssa.responsavel_execucao.upper() == resp
-            ]
+            ssas_resp = por_exec.get(resp, [])
             logging.info(f"\nResponsável Execução: '{resp}'")
             logging.info(f"Total SSAs: {len(ssas_resp)}")
             logging.info("Números das SSAs:")
@@ -424,12 +688,7 @@ class DataLoader:
 
         logging.info("\n=== Validação de Responsáveis Programação ===")
         for resp in sorted(unique_responsaveis_prog):
-            ssas_resp = [
-                ssa
-                for ssa in self.ssa_objects
-                if ssa.responsavel_programacao
-                and ssa.responsavel_programacao.upper() == resp
-            ]
+            ssas_resp = por_prog.get(resp, [])
             logging.info(f"\nResponsável Programação: '{resp}'")
             logging.info(f"Total SSAs: {len(ssas_resp)}")
             logging.info("Números das SSAs:")
@@ -448,8 +707,8 @@ class DataLoader:
         logging.info(f"Responsável execução: {first_ssa.responsavel_execucao}")
         logging.info(f"Responsável programação: {first_ssa.responsavel_programacao}")
 
-    def get_ssa_objects(self) -> List[SSAData]:
-        """Retorna a lista de objetos SSAData."""
+    def get_ssa_objects(self) -> SSATable:
+        """Retorna a tabela de SSAs (SSATable[i] tem a API do SSAData)."""
         if not self.ssa_objects:
             self._convert_to_objects()
         return self.ssa_objects
@@ -460,10 +719,12 @@ class DataLoader:
         prioridade: Optional[str] = None,
         data_inicio: Optional[datetime] = None,
         data_fim: Optional[datetime] = None,
-    ) -> Tuple[List[SSAData], Optional[Dict]]:
+    ) -> Tuple[SSATable, Optional[Dict]]:
         """
         Filtra SSAs com base nos critérios fornecidos.
 
+        Os filtros são aplicados como máscaras sobre os arrays do SSATable.
+
         Args:
             setor: Setor para filtrar
             prioridade: Prioridade para filtrar
@@ -471,7 +732,7 @@ class DataLoader:
             data_fim: Data final do período
 
         Returns:
-            Tupla contendo (lista de SSAs filtradas, dicionário de diagnóstico)
+            Tupla contendo (SSAs filtradas, dicionário de diagnóstico)
 
         Raises:
             ValueError: Se os tipos de dados fornecidos forem inválidos
@@ -492,48 +753,39 @@ class DataLoader:
             if data_fim is not None and not isinstance(data_fim, datetime):
                 raise ValueError(f"Data fim deve ser datetime, recebido {type(data_fim)}")
 
+            mask = np.ones(len(filtered_ssas), dtype=bool)
+
             # Filtro por setor com validação melhorada
             if setor:
                 setor = setor.strip().upper()
-                filtered_ssas = [
-                    ssa
-                    for ssa in filtered_ssas
-                    if ssa.setor_executor and ssa.setor_executor.strip().upper() == setor
-                ]
-                logging.info(f"Filtro por setor '{setor}': {len(filtered_ssas)} SSAs")
+                mask &= (filtered_ssas.normalized("setor_executor") == setor).to_numpy()
+                logging.info(f"Filtro por setor '{setor}': {int(mask.sum())} SSAs")
 
             # Filtro por prioridade
             if prioridade:
                 prioridade = prioridade.strip().upper()
-                filtered_ssas = [
-                    ssa
-                    for ssa in filtered_ssas
-                    if ssa.prioridade_emissao
-                    and ssa.prioridade_emissao.strip().upper() == prioridade
-                ]
+                mask &= (
+                    filtered_ssas.normalized("prioridade_emissao") == prioridade
+                ).to_numpy()
                 logging.info(
-                    f"Filtro por prioridade '{prioridade}': {len(filtered_ssas)} SSAs"
+                    f"Filtro por prioridade '{prioridade}': {int(mask.sum())} SSAs"
                 )
 
-            # Filtro por data inicial
+            # Filtro por data inicial (NaT nunca satisfaz a comparação)
+            emitida_em = filtered_ssas.column("emitida_em")
             if data_inicio:
-                filtered_ssas = [
-                    ssa
-                    for ssa in filtered_ssas
-                    if ssa.emitida_em and ssa.emitida_em >= data_inicio
-                ]
+                mask &= emitida_em >= np.datetime64(data_inicio)
                 logging.info(
-                    f"Filtro por data início {data_inicio}: {len(filtered_ssas)} SSAs"
+                    f"Filtro por data início {data_inicio}: {int(mask.sum())} SSAs"
                 )
 
             # Filtro por data final
             if data_fim:
-                filtered_ssas = [
-                    ssa
-                    for ssa in filtered_ssas
-                    if ssa.emitida_em and ssa.emitida_em <= data_fim
-                ]
-                logging.info(f"Filtro por data fim {data_fim}: {len(filtered_ssas)} SSAs")
+                mask &= emitida_em <= np.datetime64(data_fim)
+                logging.info(f"Filtro por data fim {data_fim}: {int(mask.sum())} SSAs")
+
+            if not mask.all():
+                filtered_ssas = filtered_ssas.take(mask)
 
             # Diagnóstico após todos os filtros
             if filtered_ssas:
@@ -0,0 +1,283 @@
+# src/data/history_store.py
+import logging
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from .data_loader import DataLoader
+from .snapshot_cache import DEFAULT_CACHE_DIR, SnapshotCache
+from .ssa_columns import SSAColumns
+from ..utils.file_manager import FileManager
+
+# Colunas guardadas no histórico: campo da tabela -> coluna do DataFrame
+HISTORY_COLUMNS = [
+    ("situacao", SSAColumns.SITUACAO),
+    ("prioridade_emissao", SSAColumns.GRAU_PRIORIDADE_EMISSAO),
+    ("setor_emissor", SSAColumns.SETOR_EMISSOR),
+    ("setor_executor", SSAColumns.SETOR_EXECUTOR),
+    ("responsavel_programacao", SSAColumns.RESPONSAVEL_PROGRAMACAO),
+    ("responsavel_execucao", SSAColumns.RESPONSAVEL_EXECUCAO),
+    ("semana_cadastro", SSAColumns.SEMANA_CADASTRO),
+    ("semana_programada", SSAColumns.SEMANA_PROGRAMADA),
+    ("emitida_em", SSAColumns.EMITIDA_EM),
+]
+
+DEFAULT_HISTORY_DB = str(Path(DEFAULT_CACHE_DIR) / "history.sqlite")
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS snapshots (
+    snapshot_id INTEGER PRIMARY KEY,
+    taken_at TEXT NOT NULL UNIQUE,
+    file_name TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    rows INTEGER NOT NULL,
+    ingested_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS ssa_states (
+    numero TEXT NOT NULL,
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots(snapshot_id),
+    {", ".join(f"{name} TEXT" for name, _ in HISTORY_COLUMNS)},
+    PRIMARY KEY (numero, snapshot_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_ssa_states_snapshot ON ssa_states(snapshot_id);
+CREATE INDEX IF NOT EXISTS idx_snapshots_sha256 ON snapshots(sha256);
+"""
+
+
+class SnapshotHistoryStore:
+    """
+    Histórico local (SQLite) de todas as exportações do SAM.
+
+    Cada exportação é ingerida uma única vez, identificada pela data/hora
+    do nome do arquivo (FileManager). A tabela ssa_states é agrupada por
+    número da SSA, então a evolução de uma SSA ao longo do tempo é lida
+    com uma única busca na chave primária, sem reabrir nenhum xlsx.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_HISTORY_DB):
+        """
+        Args:
+            db_path: Caminho do banco SQLite (criado se não existir)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Abre uma conexão nova (uma por operação, seguro entre threads)."""
+        return sqlite3.connect(str(self.db_path), timeout=30)
+
+    @staticmethod
+    def _to_text(series: pd.Series) -> List[Optional[str]]:
+        """Converte uma coluna para texto, com None nos valores vazios."""
+        if pd.api.types.is_datetime64_any_dtype(series):
+            text = series.dt.strftime("%Y-%m-%d %H:%M:%S")
+        else:
+            text = series.astype(object).where(series.notna(), None)
+            text = text.map(lambda value: None if value in (None, "") else str(value))
+        return text.where(text.notna(), None).tolist()
+
+    def is_ingested(self, taken_at: datetime) -> bool:
+        """Indica se o snapshot dessa data/hora já está no histórico."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT 1 FROM snapshots WHERE taken_at = ?", (taken_at.isoformat(),)
+            ).fetchone()
+        return row is not None
+
+    def has_fingerprint(self, sha256: str) -> bool:
+        """Indica se um arquivo com esse hash já foi ingerido."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT 1 FROM snapshots WHERE sha256 = ?", (sha256,)
+            ).fetchone()
+        return row is not None
+
+    def ingest_frame(
+        self, taken_at: datetime, df: pd.DataFrame, file_name: str, sha256: str
+    ) -> bool:
+        """
+        Grava um DataFrame normalizado como snapshot do histórico.
+
+        Args:
+            taken_at: Data/hora do snapshot
+            df: DataFrame normalizado pelo DataLoader
+            file_name: Nome do arquivo de origem
+            sha256: Hash do arquivo de origem
+
+        Returns:
+            True se o snapshot foi gravado, False se já existia
+        """
+        numeros = df.iloc[:, SSAColumns.NUMERO_SSA].astype(str).tolist()
+        values = [self._to_text(df.iloc[:, col]) for _, col in HISTORY_COLUMNS]
+        field_names = ", ".join(name for name, _ in HISTORY_COLUMNS)
+        placeholders = ", ".join("?" for _ in range(len(HISTORY_COLUMNS) + 2))
+
+        with closing(self._connect()) as conn:
+            try:
+                with conn:
+                    cursor = conn.execute(
+                        "INSERT INTO snapshots "
+                        "(taken_at, file_name, sha256, rows, ingested_at) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (
+                            taken_at.isoformat(),
+                            file_name,
+                            sha256,
+                            len(df),
+                            datetime.now().isoformat(),
+                        ),
+                    )
+                    snapshot_id = cursor.lastrowid
+                    # Mantém a primeira ocorrência caso a exportação repita uma SSA
+                    conn.executemany(
+                        f"INSERT OR IGNORE INTO ssa_states "
+                        f"(numero, snapshot_id, {field_names}) "
+                        f"VALUES ({placeholders})",
+                        (
+                            (numero, snapshot_id, *row)
+                            for numero, *row in zip(numeros, *values)
+                        ),
+                    )
+            except sqlite3.IntegrityError:
+                logging.info(f"Snapshot {taken_at:%d/%m/%Y %H:%M} já está no histórico")
+                return False
+
+        logging.info(
+            f"Snapshot {taken_at:%d/%m/%Y %H:%M} gravado no histórico ({len(df)} SSAs)"
+        )
+        return True
+
+    def ingest_file(
+        self, file_path: str, file_manager: Optional[FileManager] = None
+    ) -> bool:
+        """
+        Lê uma exportação do SAM e grava no histórico, se ainda não estiver lá.
+
+        Args:
+            file_path: Caminho do arquivo xlsx
+            file_manager: FileManager usado para extrair a data do nome
+
+        Returns:
+            True se o snapshot foi gravado, False se foi ignorado
+        """
+        file_manager = file_manager or FileManager(str(Path(file_path).parent))
+        taken_at = file_manager.get_file_datetime(file_path)
+        if taken_at is None:
+            logging.warning(f"Nome de arquivo fora do padrão, ignorado: {file_path}")
+            return False
+        if self.is_ingested(taken_at):
+            return False
+
+        try:
+            sha256 = SnapshotCache.fingerprint(file_path)["sha256"]
+            if self.has_fingerprint(sha256):
+                return False
+            df = DataLoader(file_path, cache_dir=None).load_frame()
+            return self.ingest_frame(taken_at, df, Path(file_path).name, sha256)
+        except Exception as e:
+            logging.error(f"Erro ao ingerir {file_path} no histórico: {str(e)}")
+            return False
+
+    def ingest_directory(self, directory: str, pattern_key: str = "ssa_pendentes") -> int:
+        """
+        Ingere todas as exportações de um diretório que ainda não estão no histórico.
+
+        Args:
+            directory: Diretório com os arquivos xlsx
+            pattern_key: Chave do padrão de arquivo do FileManager
+
+        Returns:
+            Quantidade de snapshots gravados
+        """
+        file_manager = FileManager(directory)
+        ingested = 0
+        for _, file_path in file_manager.list_files(pattern_key):
+            if self.ingest_file(file_path, file_manager):
+                ingested += 1
+        return ingested
+
+    def list_snapshots(self) -> pd.DataFrame:
+        """Retorna os snapshots do histórico, do mais antigo para o mais recente."""
+        with closing(self._connect()) as conn:
+            df = pd.read_sql_query(
+                "SELECT snapshot_id, taken_at, file_name, sha256, rows, ingested_at "
+                "FROM snapshots ORDER BY taken_at",
+                conn,
+            )
+        df["taken_at"] = pd.to_datetime(df["taken_at"])
+        return df
+
+    def get_ssa_history(self, numero: str) -> pd.DataFrame:
+        """
+        Retorna a evolução de uma SSA em todos os snapshots em que aparece.
+
+        Args:
+            numero: Número da SSA
+
+        Returns:
+            DataFrame com uma linha por snapshot, ordenado por data
+        """
+        field_names = ", ".join(f"st.{name}" for name, _ in HISTORY_COLUMNS)
+        with closing(self._connect()) as conn:
+            df = pd.read_sql_query(
+                f"SELECT sn.taken_at, {field_names} "
+                f"FROM ssa_states st JOIN snapshots sn USING (snapshot_id) "
+                f"WHERE st.numero = ? ORDER BY sn.taken_at",
+                conn,
+                params=(str(numero),),
+            )
+        df["taken_at"] = pd.to_datetime(df["taken_at"])
+        return df
+
+    def get_snapshot(self, taken_at: datetime) -> pd.DataFrame:
+        """Retorna os estados de todas as SSAs em um snapshot."""
+        field_names = ", ".join(f"st.{name}" for name, _ in HISTORY_COLUMNS)
+        with closing(self._connect()) as conn:
+            return pd.read_sql_query(
+                f"SELECT st.numero, {field_names} "
+                f"FROM ssa_states st JOIN snapshots sn USING (snapshot_id) "
+                f"WHERE sn.taken_at = ? ORDER BY st.numero",
+                conn,
+                params=(taken_at.isoformat(),),
+            )
+
+    def get_counts_over_time(self, field: str = "situacao") -> pd.DataFrame:
+        """
+        Conta as SSAs por valor de um campo em cada snapshot.
+
+        Args:
+            field: Campo do histórico (ex.: 'situacao', 'setor_executor')
+
+        Returns:
+            DataFrame com uma linha por snapshot e uma coluna por valor
+        """
+        allowed: Dict[str, int] = dict(HISTORY_COLUMNS)
+        if field not in allowed:
+            raise ValueError(f"Campo desconhecido no histórico: {field}")
+
+        with closing(self._connect()) as conn:
+            counts = pd.read_sql_query(
+                f"SELECT sn.taken_at, st.{field} AS valor, COUNT(*) AS total "
+                f"FROM ssa_states st JOIN snapshots sn USING (snapshot_id) "
+                f"GROUP BY sn.snapshot_id, st.{field}",
+                conn,
+            )
+        counts["taken_at"] = pd.to_datetime(counts["taken_at"])
+        return (
+            counts.pivot_table(
+                index="taken_at",
+                columns="valor",
+                values="total",
+                aggfunc="sum",
+                fill_value=0,
+            )
+            .astype(int)
+            .sort_index()
+        )
@@ -0,0 +1,157 @@
+# src/data/iso_weeks.py
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .ssa_columns import SSAColumns
+
+# Semana inválida ou ausente nos arrays de ordinais
+MISSING_WEEK = np.iinfo(np.int32).min
+
+
+def parse_year_week(values) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Converte semanas no formato YYYYWW (ex.: "202447", 202447.0) em arrays.
+
+    Valores vazios, fora do formato ou com semana inexistente no ano ISO
+    (ex.: 202353, já que 2023 tem 52 semanas) ficam com ano e semana 0.
+
+    Args:
+        values: Coluna ou sequência de semanas
+
+    Returns:
+        Tupla (anos, semanas) de arrays int32
+    """
+    # Poucas semanas distintas: o texto é tratado só uma vez por valor
+    codes, uniques = pd.factorize(pd.Series(values, copy=False))
+    text = pd.Series(uniques).astype("string").str.strip()
+    text = text.str.replace(r"\.0+$", "", regex=True)
+    valid = text.str.fullmatch(r"\d{6}").fillna(False).to_numpy(dtype=bool)
+    year_week = pd.to_numeric(text.where(valid), errors="coerce")
+    year_week = year_week.fillna(0).to_numpy(dtype=np.int64)
+
+    years = (year_week // 100).astype(np.int32)
+    weeks = (year_week % 100).astype(np.int32)
+    valid &= (weeks >= 1) & (weeks <= weeks_in_year(years))
+    # Código -1 (valor ausente) aponta para a posição extra, inválida
+    years = np.append(np.where(valid, years, 0), np.int32(0))
+    weeks = np.append(np.where(valid, weeks, 0), np.int32(0))
+    return years[codes], weeks[codes]
+
+
+def _first_monday(years: np.ndarray) -> np.ndarray:
+    """Dias desde 1970-01-01 da segunda-feira da semana 1 de cada ano ISO."""
+    # 4 de janeiro está sempre na semana 1; 1970-01-01 foi uma quinta-feira
+    jan4 = (np.asarray(years, dtype=np.int64) - 1970).astype("datetime64[Y]")
+    jan4 = jan4.astype("datetime64[D]").astype(np.int64) + 3
+    return jan4 - (jan4 + 3) % 7
+
+
+def weeks_in_year(years: np.ndarray) -> np.ndarray:
+    """Quantidade de semanas ISO (52 ou 53) de cada ano."""
+    years = np.asarray(years, dtype=np.int64)
+    return ((_first_monday(years + 1) - _first_monday(years)) // 7).astype(np.int32)
+
+
+def week_ordinals(years: np.ndarray, weeks: np.ndarray) -> np.ndarray:
+    """
+    Numera as semanas ISO em sequência contínua (semanas desde 1970).
+
+    A diferença entre dois ordinais é a distância em semanas, inclusive
+    entre anos diferentes e através de anos com 53 semanas.
+
+    Args:
+        years: Anos ISO (0 = semana inválida)
+        weeks: Semanas ISO
+
+    Returns:
+        Array int32 com MISSING_WEEK nas semanas inválidas
+    """
+    years = np.asarray(years)
+    weeks = np.asarray(weeks, dtype=np.int64)
+    ordinals = (_first_monday(years) + 3) // 7 + weeks - 1
+    return np.where(years > 0, ordinals, MISSING_WEEK).astype(np.int32)
+
+
+def current_week_ordinal(today: Optional[date] = None) -> int:
+    """Ordinal da semana ISO de hoje (ou da data informada)."""
+    year, week, _ = (today or date.today()).isocalendar()
+    return int(week_ordinals(np.array([year]), np.array([week]))[0])
+
+
+def week_difference(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """
+    Semanas de start até end, a partir de arrays de ordinais.
+
+    Returns:
+        Array float64 com NaN onde alguma das semanas é inválida
+    """
+    start = np.asarray(start)
+    end = np.asarray(end)
+    valid = (start != MISSING_WEEK) & (end != MISSING_WEEK)
+    return np.where(valid, end.astype(np.float64) - start, np.nan)
+
+
+@dataclass(frozen=True)
+class SSAWeeks:
+    """
+    Semanas ISO de cadastro e programação das SSAs, já convertidas.
+
+    Montado uma vez por versão dos dados (DashboardState) e compartilhado
+    pelos gráficos de semana, pelo tempo no estado e pelos KPIs; as visões
+    filtradas usam take() com as posições das suas linhas. Anos e semanas
+    inválidos ou ausentes ficam com 0 e os ordinais com MISSING_WEEK.
+    """
+
+    cadastro_year: np.ndarray
+    cadastro_week: np.ndarray
+    cadastro: np.ndarray
+    programada_year: np.ndarray
+    programada_week: np.ndarray
+    programada: np.ndarray
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "SSAWeeks":
+        """Converte as colunas SEMANA_CADASTRO e SEMANA_PROGRAMADA do DataFrame."""
+        cadastro_year, cadastro_week = parse_year_week(
+            df.iloc[:, SSAColumns.SEMANA_CADASTRO]
+        )
+        programada_year, programada_week = parse_year_week(
+            df.iloc[:, SSAColumns.SEMANA_PROGRAMADA]
+        )
+        return cls(
+            cadastro_year=cadastro_year,
+            cadastro_week=cadastro_week,
+            cadastro=week_ordinals(cadastro_year, cadastro_week),
+            programada_year=programada_year,
+            programada_week=programada_week,
+            programada=week_ordinals(programada_year, programada_week),
+        )
+
+    def take(self, positions: np.ndarray) -> "SSAWeeks":
+        """Semanas das linhas nas posições informadas (ex.: uma visão filtrada)."""
+        return SSAWeeks(
+            **{
+                name: getattr(self, name)[positions]
+                for name in self.__dataclass_fields__
+            }
+        )
+
+    def year_week(self, use_programmed: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """Anos e semanas da programação (padrão) ou do cadastro."""
+        if use_programmed:
+            return self.programada_year, self.programada_week
+        return self.cadastro_year, self.cadastro_week
+
+    def weeks_since_registration(self, today: Optional[date] = None) -> np.ndarray:
+        """
+        Semanas ISO desde o cadastro até a semana atual.
+
+        Returns:
+            Array float64, nunca negativo, com NaN sem semana de cadastro
+        """
+        current = np.full(len(self.cadastro), current_week_ordinal(today), np.int32)
+        return np.maximum(week_difference(self.cadastro, current), 0)
@@ -0,0 +1,192 @@
+# src/data/shared_dataset.py
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow é opcional: sem ele não há modo multi-worker
+    pa = None
+    feather = None
+
+
+def arrow_string_dtype() -> pd.StringDtype:
+    """
+    dtype de texto apoiado em Arrow, com NaN nos valores vazios.
+
+    Filtros e comparações devolvem arrays bool do numpy, como nas colunas
+    object, então o código do dashboard funciona igual com os dois.
+    """
+    try:
+        return pd.StringDtype("pyarrow", na_value=np.nan)
+    except TypeError:  # pandas < 2.3
+        return pd.StringDtype("pyarrow_numpy")
+
+
+class SharedDataset:
+    """
+    Conjunto de dados compartilhado entre os workers do dashboard.
+
+    Um único processo carregador lê a exportação com o DataLoader e publica
+    o DataFrame normalizado como arquivo Arrow IPC (sem compressão) em
+    shared_dir, junto com um manifesto (current.json) que aponta a versão
+    vigente. Os workers abrem o arquivo via memory-map: as páginas ficam no
+    cache de páginas do sistema operacional, uma vez só para todos os
+    processos, e nenhum worker refaz o parse do xlsx.
+
+    As colunas de texto são gravadas como large_string e lidas como
+    string[pyarrow] (arrow_string_dtype): os buffers apontam para o
+    arquivo mapeado, sem criar um objeto Python por célula. Colunas
+    numéricas e de data também ficam no arquivo e colunas Categorical
+    (modo compact do DataLoader) trazem só os códigos e as categorias.
+    Cada worker ainda monta a sua cópia do que é derivado do DataFrame
+    (FilterIndex, SSACube, SSAWeeks, visualizador e KPIs) a cada versão.
+    """
+
+    MANIFEST_NAME = "current.json"
+
+    def __init__(self, shared_dir: str = "shared", keep: int = 2):
+        """
+        Args:
+            shared_dir: Diretório compartilhado entre carregador e workers
+            keep: Versões mantidas em disco (workers podem estar lendo a anterior)
+        """
+        if feather is None:
+            raise ImportError(
+                "pyarrow é necessário para o modo multi-worker "
+                "(use: pip install pyarrow)"
+            )
+        self.shared_dir = Path(shared_dir)
+        self.keep = keep
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.shared_dir / self.MANIFEST_NAME
+
+    def manifest(self) -> Optional[Dict]:
+        """
+        Lê o manifesto da versão publicada.
+
+        Returns:
+            Dict com version, file, source_path, rows e created, ou None se
+            nada foi publicado ainda
+        """
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def publish(self, df: pd.DataFrame, source_path: Optional[str] = None) -> Dict:
+        """
+        Publica um DataFrame como nova versão.
+
+        O arquivo de dados e o manifesto são gravados em arquivos
+        temporários e renomeados, então um worker nunca lê uma versão pela
+        metade.
+
+        Args:
+            df: DataFrame normalizado pelo DataLoader
+            source_path: Exportação de origem
+
+        Returns:
+            Manifesto da versão publicada
+        """
+        current = self.manifest()
+        version = (current["version"] if current else 0) + 1
+        data_path = self.shared_dir / f"dataset-{version}.arrow"
+
+        self.shared_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = data_path.with_suffix(".arrow.tmp")
+        feather.write_feather(
+            self._to_table(df), str(tmp_path), compression="uncompressed"
+        )
+        os.replace(tmp_path, data_path)
+
+        manifest = {
+            "version": version,
+            "file": data_path.name,
+            "source_path": str(source_path) if source_path else None,
+            "rows": len(df),
+            "created": datetime.now().isoformat(),
+        }
+        tmp_manifest = self.manifest_path.with_suffix(".json.tmp")
+        with open(tmp_manifest, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_manifest, self.manifest_path)
+
+        self._prune(version)
+        logging.info(
+            f"Dataset compartilhado publicado: versão {version} ({len(df)} SSAs)"
+        )
+        return manifest
+
+    def load(self, manifest: Optional[Dict] = None) -> pd.DataFrame:
+        """
+        Abre uma versão publicada via memory-map.
+
+        Args:
+            manifest: Manifesto da versão (padrão: a vigente)
+
+        Returns:
+            DataFrame com as colunas apoiadas no arquivo mapeado sempre que
+            o tipo permite
+        """
+        manifest = manifest or self.manifest()
+        if manifest is None:
+            raise FileNotFoundError(
+                f"Nenhum dataset publicado em {self.shared_dir.resolve()}"
+            )
+        table = feather.read_table(
+            str(self.shared_dir / manifest["file"]), memory_map=True
+        )
+        string_dtype = arrow_string_dtype()
+        # split_blocks evita juntar colunas do mesmo tipo em um bloco copiado
+        return table.to_pandas(
+            split_blocks=True,
+            types_mapper=lambda arrow_type: (
+                string_dtype if pa.types.is_large_string(arrow_type) else None
+            ),
+        )
+
+    @staticmethod
+    def _to_table(df: pd.DataFrame) -> "pa.Table":
+        """
+        Converte o DataFrame para Arrow com as colunas de texto em large_string.
+
+        string[pyarrow] usa offsets de 64 bits; gravando assim, load() não
+        precisa converter (e copiar) as colunas de texto ao abrir o arquivo.
+        """
+        table = pa.Table.from_pandas(df)
+        schema = pa.schema(
+            [
+                field.with_type(pa.large_string())
+                if pa.types.is_string(field.type)
+                else field
+                for field in table.schema
+            ],
+            metadata=table.schema.metadata,
+        )
+        return table.cast(schema)
+
+    def _prune(self, version: int):
+        """Remove versões antigas, mantendo as self.keep mais recentes."""
+        for old_path in self.shared_dir.glob("dataset-*.arrow"):
+            try:
+                old_version = int(old_path.stem.split("-")[1])
+            except ValueError:
+                continue
+            if old_version > version - self.keep:
+                continue
+            try:
+                old_path.unlink()
+            except OSError as e:
+                # No Windows um arquivo ainda mapeado não pode ser removido
+                logging.warning(f"Erro ao remover dataset antigo {old_path.name}: {e}")
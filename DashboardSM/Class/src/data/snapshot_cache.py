@@ -0,0 +1,172 @@
+# src/data/snapshot_cache.py
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow é opcional: sem ele o cache fica desativado
+    feather = None
+
+# Cache padrão em DashboardSM/Class/cache, qualquer que seja o diretório atual
+DEFAULT_CACHE_DIR = str(Path(__file__).resolve().parents[2] / "cache")
+
+
+class SnapshotCache:
+    """
+    Cache colunar (Feather/Arrow IPC) do DataFrame já normalizado.
+
+    Cada exportação do SAM é identificada pelo caminho, tamanho, data de
+    modificação e hash do conteúdo. Enquanto a impressão digital não mudar,
+    o DataFrame é lido direto do cache via memory-map, evitando o parse do
+    xlsx pelo openpyxl e todas as conversões do DataLoader.
+    """
+
+    # Incrementar sempre que a normalização do DataLoader mudar de formato
+    CACHE_VERSION = 3
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.enabled = feather is not None
+        if not self.enabled:
+            logging.warning(
+                "pyarrow não encontrado - cache de snapshots desativado "
+                "(use: pip install pyarrow)"
+            )
+
+    @classmethod
+    def fingerprint(cls, file_path: str) -> Dict:
+        """
+        Calcula a impressão digital de um arquivo de exportação.
+
+        Args:
+            file_path: Caminho do arquivo xlsx
+
+        Returns:
+            Dict com caminho absoluto, tamanho, mtime e hash SHA-256
+        """
+        path = Path(file_path).resolve()
+        stats = path.stat()
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(cls.HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+
+        return {
+            "path": str(path),
+            "size": stats.st_size,
+            "mtime": stats.st_mtime,
+            "sha256": digest.hexdigest(),
+        }
+
+    def _cache_key(self, fingerprint: Dict) -> str:
+        """Gera a chave do cache a partir da impressão digital."""
+        payload = json.dumps(
+            {**fingerprint, "cache_version": self.CACHE_VERSION}, sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def _paths_for(self, fingerprint: Dict):
+        """Retorna os caminhos do arquivo de dados e do arquivo de metadados."""
+        stem = Path(fingerprint["path"]).stem
+        key = self._cache_key(fingerprint)
+        data_path = self.cache_dir / f"{stem}-{key}.feather"
+        meta_path = self.cache_dir / f"{stem}-{key}.json"
+        return data_path, meta_path
+
+    def load(self, fingerprint: Dict) -> Optional[pd.DataFrame]:
+        """
+        Carrega o DataFrame normalizado do cache, se existir.
+
+        Args:
+            fingerprint: Impressão digital retornada por fingerprint()
+
+        Returns:
+            DataFrame do cache ou None se não houver entrada válida
+        """
+        if not self.enabled:
+            return None
+
+        data_path, meta_path = self._paths_for(fingerprint)
+        if not data_path.exists() or not meta_path.exists():
+            return None
+
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("fingerprint") != fingerprint:
+                return None
+
+            table = feather.read_table(str(data_path), memory_map=True)
+            df = table.to_pandas()
+            logging.info(
+                f"Snapshot carregado do cache: {data_path.name} ({len(df)} linhas)"
+            )
+            return df
+
+        except Exception as e:
+            logging.warning(f"Erro ao ler cache {data_path.name}: {str(e)}")
+            return None
+
+    def store(self, fingerprint: Dict, df: pd.DataFrame) -> Optional[Path]:
+        """
+        Grava o DataFrame normalizado no cache e remove entradas antigas
+        do mesmo arquivo de origem.
+
+        Args:
+            fingerprint: Impressão digital retornada por fingerprint()
+            df: DataFrame já normalizado pelo DataLoader
+
+        Returns:
+            Caminho do arquivo gravado ou None em caso de erro
+        """
+        if not self.enabled:
+            return None
+
+        data_path, meta_path = self._paths_for(fingerprint)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+            # Grava em arquivo temporário e renomeia para evitar leituras parciais
+            tmp_path = data_path.with_suffix(".feather.tmp")
+            feather.write_feather(df, str(tmp_path), compression="uncompressed")
+            os.replace(tmp_path, data_path)
+
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "fingerprint": fingerprint,
+                        "cache_version": self.CACHE_VERSION,
+                        "rows": len(df),
+                        "created": datetime.now().isoformat(),
+                    },
+                    f,
+                    indent=2,
+                )
+
+            self._prune(fingerprint, keep=data_path)
+            logging.info(f"Snapshot gravado no cache: {data_path.name}")
+            return data_path
+
+        except Exception as e:
+            logging.warning(f"Erro ao gravar cache {data_path.name}: {str(e)}")
+            return None
+
+    def _prune(self, fingerprint: Dict, keep: Path):
+        """Remove entradas de cache obsoletas do mesmo arquivo de origem."""
+        stem = Path(fingerprint["path"]).stem
+        for old_path in self.cache_dir.glob(f"{stem}-*.feather"):
+            if old_path == keep:
+                continue
+            try:
+                old_path.unlink()
+                old_path.with_suffix(".json").unlink(missing_ok=True)
+            except OSError as e:
+                logging.warning(f"Erro ao remover cache antigo {old_path.name}: {e}")
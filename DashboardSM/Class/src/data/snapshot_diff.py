@@ -0,0 +1,111 @@
+# src/data/snapshot_diff.py
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .ssa_columns import SSAColumns
+
+
+@dataclass
+class SnapshotDiff:
+    """Diferença entre duas exportações do SAM, por número de SSA."""
+
+    added: List[str]
+    removed: List[str]
+    changed: List[str]
+    state_changed: Dict[str, Tuple[str, str]]
+    previous_rows: int
+    current_rows: int
+    timestamp: datetime = field(default_factory=datetime.now)
+
+    @property
+    def is_empty(self) -> bool:
+        """Indica se as duas exportações têm exatamente o mesmo conteúdo."""
+        return not (self.added or self.removed or self.changed)
+
+    def summary(self) -> Dict[str, int]:
+        """Retorna as contagens de cada tipo de mudança."""
+        return {
+            "novas": len(self.added),
+            "encerradas": len(self.removed),
+            "alteradas": len(self.changed),
+            "mudancas_estado": len(self.state_changed),
+            "total_anterior": self.previous_rows,
+            "total_atual": self.current_rows,
+        }
+
+
+def row_hashes(df: pd.DataFrame) -> pd.Series:
+    """
+    Calcula a impressão digital do conteúdo de cada linha.
+
+    Args:
+        df: DataFrame normalizado pelo DataLoader
+
+    Returns:
+        Series uint64 indexada pelo número da SSA
+    """
+    # Datas na mesma resolução, para o hash não depender de como a
+    # exportação foi lida (pd.read_excel, streaming ou cache)
+    datetime_columns = [
+        name for name, dtype in df.dtypes.items()
+        if pd.api.types.is_datetime64_any_dtype(dtype)
+    ]
+    if datetime_columns:
+        df = df.astype({name: "datetime64[ns]" for name in datetime_columns})
+    hashes = pd.util.hash_pandas_object(df, index=False)
+    hashes.index = df.iloc[:, SSAColumns.NUMERO_SSA].astype(str).to_numpy()
+    return hashes
+
+
+def diff_snapshots(previous_df: pd.DataFrame, current_df: pd.DataFrame) -> SnapshotDiff:
+    """
+    Compara duas exportações normalizadas linha a linha pelo número da SSA.
+
+    Args:
+        previous_df: DataFrame da exportação anterior
+        current_df: DataFrame da exportação nova
+
+    Returns:
+        SnapshotDiff com SSAs novas, encerradas, alteradas e mudanças de estado
+
+    Raises:
+        ValueError: Se houver números de SSA duplicados em alguma exportação
+    """
+    previous = row_hashes(previous_df)
+    current = row_hashes(current_df)
+    if not previous.index.is_unique or not current.index.is_unique:
+        raise ValueError("Números de SSA duplicados: diff por SSA indisponível")
+
+    added = current.index.difference(previous.index, sort=False)
+    removed = previous.index.difference(current.index, sort=False)
+    common = current.index.intersection(previous.index, sort=False)
+
+    changed_mask = current[common].to_numpy() != previous[common].to_numpy()
+    changed = common[changed_mask]
+
+    # Mudanças de estado entre as SSAs alteradas
+    situacao_prev = pd.Series(
+        previous_df.iloc[:, SSAColumns.SITUACAO].astype(str).to_numpy(),
+        index=previous.index,
+    )
+    situacao_curr = pd.Series(
+        current_df.iloc[:, SSAColumns.SITUACAO].astype(str).to_numpy(),
+        index=current.index,
+    )
+    old_states = situacao_prev[changed].to_numpy()
+    new_states = situacao_curr[changed].to_numpy()
+    moved = np.flatnonzero(old_states != new_states)
+    state_changed = {changed[i]: (old_states[i], new_states[i]) for i in moved}
+
+    return SnapshotDiff(
+        added=list(added),
+        removed=list(removed),
+        changed=list(changed),
+        state_changed=state_changed,
+        previous_rows=len(previous_df),
+        current_rows=len(current_df),
+    )
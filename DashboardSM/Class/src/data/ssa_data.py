@@ -4,57 +4,13 @@ from datetime import datetime
 from typing import Dict, Optional
 import pandas as pd
 
-@dataclass
-class SSAData:
-    """Estrutura de dados para uma SSA."""
-    numero: str
-    situacao: str
-    derivada: Optional[str]
-    localizacao: str
-    desc_localizacao: str
-    equipamento: str
-    semana_cadastro: str
-    emitida_em: datetime
-    descricao: str
-    setor_emissor: str
-    setor_executor: str
-    solicitante: str
-    servico_origem: str
-    prioridade_emissao: str
-    prioridade_planejamento: Optional[str]
-    execucao_simples: str
-    responsavel_programacao: Optional[str]
-    semana_programada: Optional[str]
-    responsavel_execucao: Optional[str]
-    descricao_execucao: Optional[str]
-    sistema_origem: str
-    anomalia: Optional[str]
-
-    def __post_init__(self):
-        """Validação dos dados após inicialização."""
-        # Garante que strings não sejam None
-        for field in fields(self):
-            if field.type == str and not field.default:
-                value = getattr(self, field.name)
-                if value is None:
-                    setattr(self, field.name, "")
-
-        # Normaliza strings
-        for field in fields(self):
-            if field.type == str:
-                value = getattr(self, field.name)
-                if isinstance(value, str):
-                    setattr(self, field.name, value.strip())
+class SSARecordMixin:
+    """
+    Comportamento comum às representações de uma SSA.
 
-        # Validações específicas
-        if not self.numero:
-            raise ValueError("Número da SSA não pode ser vazio")
-
-        if not self.situacao:
-            raise ValueError("Situação não pode ser vazia")
-
-        if not self.prioridade_emissao:
-            raise ValueError("Prioridade de emissão não pode ser vazia")
+    Usado tanto pelo SSAData quanto pelas views leves do SSATable; as
+    classes concretas só precisam expor os campos como atributos.
+    """
 
     def to_dict(self) -> Dict:
         """Converte o objeto para dicionário."""
@@ -131,3 +87,54 @@ class SSAData:
     def has_responsible(self) -> bool:
         """Verifica se a SSA tem responsável designado."""
         return bool(self.responsavel_programacao or self.responsavel_execucao)
+
+
+@dataclass
+class SSAData(SSARecordMixin):
+    """Estrutura de dados para uma SSA."""
+    numero: str
+    situacao: str
+    derivada: Optional[str]
+    localizacao: str
+    desc_localizacao: str
+    equipamento: str
+    semana_cadastro: str
+    emitida_em: datetime
+    descricao: str
+    setor_emissor: str
+    setor_executor: str
+    solicitante: str
+    servico_origem: str
+    prioridade_emissao: str
+    prioridade_planejamento: Optional[str]
+    execucao_simples: str
+    responsavel_programacao: Optional[str]
+    semana_programada: Optional[str]
+    responsavel_execucao: Optional[str]
+    descricao_execucao: Optional[str]
+    sistema_origem: str
+    anomalia: Optional[str]
+
+    def __post_init__(self):
+        """Validação dos dados após inicialização."""
+        # Garante que strings não sejam None e normaliza espaços
+        for name in _STR_FIELDS:
+            value = getattr(self, name)
+            if value is None:
+                setattr(self, name, "")
+            elif isinstance(value, str):
+                setattr(self, name, value.strip())
+
+        # Validações específicas
+        if not self.numero:
+            raise ValueError("Número da SSA não pode ser vazio")
+
+        if not self.situacao:
+            raise ValueError("Situação não pode ser vazia")
+
+        if not self.prioridade_emissao:
+            raise ValueError("Prioridade de emissão não pode ser vazia")
+
+
+# Campos do tipo str, calculados uma única vez (evita fields() a cada instância)
+_STR_FIELDS = tuple(field.name for field in fields(SSAData) if field.type == str)
@@ -0,0 +1,211 @@
+# src/data/ssa_table.py
+from dataclasses import fields
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .ssa_data import SSAData, SSARecordMixin
+
+# Ordem dos campos igual à do SSAData
+SSA_FIELDS = tuple(field.name for field in fields(SSAData))
+
+# Campos obrigatórios e a mensagem usada pelo SSAData.__post_init__
+REQUIRED_FIELDS = (
+    ("numero", "Número da SSA não pode ser vazio"),
+    ("situacao", "Situação não pode ser vazia"),
+    ("prioridade_emissao", "Prioridade de emissão não pode ser vazia"),
+)
+
+
+class SSARow(SSARecordMixin):
+    """
+    View leve de uma linha do SSATable.
+
+    Não copia dados: cada atributo é lido do array correspondente no
+    momento do acesso. Expõe a mesma API do SSAData.
+    """
+
+    __slots__ = ("_table", "_pos")
+
+    def __init__(self, table: "SSATable", pos: int):
+        self._table = table
+        self._pos = pos
+
+    @property
+    def emitida_em(self) -> Optional[pd.Timestamp]:
+        value = self._table._columns["emitida_em"][self._pos]
+        if np.isnat(value):
+            return None
+        return pd.Timestamp(value)
+
+    @property
+    def index(self):
+        """Índice da linha no DataFrame de origem."""
+        return self._table.index[self._pos]
+
+    def to_ssa_data(self) -> SSAData:
+        """Materializa a view em um objeto SSAData independente."""
+        return SSAData(**{name: getattr(self, name) for name in SSA_FIELDS})
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (SSARow, SSAData)):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SSARow({self})"
+
+
+def _make_field_property(name: str) -> property:
+    def getter(self):
+        return self._table._columns[name][self._pos]
+
+    return property(getter)
+
+
+for _name in SSA_FIELDS:
+    if _name != "emitida_em":
+        setattr(SSARow, _name, _make_field_property(_name))
+
+
+class SSATable:
+    """
+    Contêiner colunar das SSAs.
+
+    Guarda os 22 campos como arrays NumPy (um por campo) em vez de uma
+    lista de objetos SSAData. SSATable[i] devolve uma SSARow que é
+    materializada sob demanda, e os filtros operam direto nos arrays.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], index: Optional[np.ndarray] = None):
+        """
+        Args:
+            columns: Dicionário campo -> array, com todos os campos de SSAData
+            index: Índices das linhas no DataFrame de origem
+        """
+        missing = [name for name in SSA_FIELDS if name not in columns]
+        if missing:
+            raise ValueError(f"Campos ausentes no SSATable: {', '.join(missing)}")
+
+        self._columns = {name: columns[name] for name in SSA_FIELDS}
+        emitida_em = np.asarray(self._columns["emitida_em"])
+        if not np.issubdtype(emitida_em.dtype, np.datetime64):
+            emitida_em = pd.to_datetime(
+                pd.Series(emitida_em, dtype=object), errors="coerce"
+            ).to_numpy(dtype="datetime64[ns]")
+        self._columns["emitida_em"] = emitida_em
+        length = len(self._columns["numero"])
+        self.index = np.arange(length) if index is None else np.asarray(index)
+
+    @classmethod
+    def from_columns(
+        cls, columns: Dict[str, np.ndarray], index: Optional[np.ndarray] = None
+    ) -> Tuple["SSATable", Dict]:
+        """
+        Cria a tabela validando os campos obrigatórios de forma vetorizada.
+
+        Args:
+            columns: Dicionário campo -> array já normalizado
+            index: Índices das linhas no DataFrame de origem
+
+        Returns:
+            Tupla (tabela com as linhas válidas, dicionário posição -> erro)
+        """
+        length = len(columns["numero"])
+        index = np.arange(length) if index is None else np.asarray(index)
+        errors = {}
+
+        invalid = np.zeros(length, dtype=bool)
+        for name, message in REQUIRED_FIELDS:
+            values = pd.Series(columns[name], dtype=object)
+            empty = (values.isna() | (values == "")).to_numpy()
+            for pos in np.flatnonzero(empty & ~invalid):
+                errors[int(pos)] = message
+            invalid |= empty
+
+        if invalid.any():
+            keep = np.flatnonzero(~invalid)
+            columns = {name: np.asarray(arr)[keep] for name, arr in columns.items()}
+            index = index[keep]
+
+        return cls(columns, index), errors
+
+    @classmethod
+    def empty(cls) -> "SSATable":
+        """Cria uma tabela sem linhas."""
+        return cls({name: np.array([], dtype=object) for name in SSA_FIELDS})
+
+    @classmethod
+    def from_objects(cls, ssa_objects: List[SSAData]) -> "SSATable":
+        """Cria a tabela a partir de uma lista de SSAData."""
+        columns = {
+            name: np.array([getattr(ssa, name) for ssa in ssa_objects], dtype=object)
+            for name in SSA_FIELDS
+        }
+        return cls(columns)
+
+    @classmethod
+    def concat(cls, tables: List["SSATable"]) -> "SSATable":
+        """Concatena várias tabelas, na ordem recebida."""
+        if not tables:
+            return cls.empty()
+        columns = {
+            name: np.concatenate([table._columns[name] for table in tables])
+            for name in SSA_FIELDS
+        }
+        index = np.concatenate([table.index for table in tables])
+        return cls(columns, index)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __iter__(self) -> Iterator[SSARow]:
+        for pos in range(len(self)):
+            yield SSARow(self, pos)
+
+    def __getitem__(self, key: Union[int, slice, np.ndarray, List[int]]):
+        if isinstance(key, (int, np.integer)):
+            length = len(self)
+            if key < 0:
+                key += length
+            if not 0 <= key < length:
+                raise IndexError("Índice fora do intervalo do SSATable")
+            return SSARow(self, int(key))
+        if isinstance(key, slice):
+            return self.take(np.arange(len(self))[key])
+        return self.take(key)
+
+    def __repr__(self) -> str:
+        return f"SSATable({len(self)} SSAs)"
+
+    def column(self, name: str) -> np.ndarray:
+        """Retorna o array de um campo (sem cópia)."""
+        return self._columns[name]
+
+    def take(self, positions) -> "SSATable":
+        """
+        Retorna uma nova tabela com as linhas selecionadas.
+
+        Args:
+            positions: Posições inteiras ou máscara booleana
+        """
+        positions = np.asarray(positions)
+        if positions.dtype == bool:
+            positions = np.flatnonzero(positions)
+        return SSATable(
+            {name: arr[positions] for name, arr in self._columns.items()},
+            self.index[positions],
+        )
+
+    def normalized(self, name: str) -> pd.Series:
+        """Retorna o campo como Series com strip() e maiúsculas aplicados."""
+        return pd.Series(self._columns[name], dtype=object).str.strip().str.upper()
+
+    def to_list(self) -> List[SSAData]:
+        """Materializa todas as linhas em objetos SSAData."""
+        return [row.to_ssa_data() for row in self]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Retorna os campos como DataFrame (nomes dos campos do SSAData)."""
+        return pd.DataFrame(self._columns, index=self.index)
@@ -0,0 +1,113 @@
+# src/data/xlsx_stream.py
+import logging
+from itertools import islice
+from typing import Iterable, Iterator, List
+
+import pandas as pd
+
+try:
+    import python_calamine
+except ImportError:  # leitor nativo opcional, só usado com engine="calamine"
+    python_calamine = None
+
+# Leitores do modo streaming; o primeiro é o padrão
+STREAM_ENGINES = ("openpyxl", "calamine")
+
+
+def _iter_rows_calamine(excel_path: str) -> Iterator[list]:
+    """
+    Itera as linhas da primeira planilha com o leitor nativo (calamine).
+
+    O calamine carrega a planilha inteira em get_sheet_by_index(); só a
+    conversão para DataFrame é feita em blocos. É mais rápido que o
+    openpyxl, mas a memória não fica limitada ao tamanho do bloco.
+    """
+    workbook = python_calamine.CalamineWorkbook.from_path(str(excel_path))
+    sheet = workbook.get_sheet_by_index(0)
+    for row in sheet.iter_rows():
+        # calamine devolve "" para células vazias; o pandas trata como NaN
+        yield [None if value == "" else value for value in row]
+
+
+def _iter_rows_openpyxl(excel_path: str) -> Iterator[tuple]:
+    """Itera as linhas da primeira planilha com openpyxl em modo read-only."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(str(excel_path), read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        for row in sheet.iter_rows(values_only=True):
+            yield row
+    finally:
+        workbook.close()
+
+
+def iter_excel_chunks(
+    excel_path: str,
+    header: int = 1,
+    chunk_size: int = 5000,
+    engine: str = "openpyxl",
+) -> Iterator[pd.DataFrame]:
+    """
+    Lê a planilha em blocos.
+
+    Os valores são mantidos como vieram da planilha (sem a inferência
+    numérica do pd.read_excel); as conversões de tipo ficam a cargo do
+    DataLoader, bloco a bloco. O índice de cada bloco continua a
+    numeração global das linhas, igual ao de pd.read_excel.
+
+    Com 'openpyxl' (padrão) o workbook é lido em modo read-only e só um
+    bloco bruto fica em memória. 'calamine' é mais rápido, mas carrega a
+    planilha inteira antes do primeiro bloco: use quando a velocidade
+    importar mais que o pico de memória.
+
+    Args:
+        excel_path: Caminho do arquivo xlsx
+        header: Índice (base 0) da linha de cabeçalho
+        chunk_size: Quantidade de linhas por bloco
+        engine: Leitor, 'openpyxl' ou 'calamine' (ver STREAM_ENGINES)
+
+    Yields:
+        DataFrame com até chunk_size linhas
+    """
+    if engine == "calamine":
+        if python_calamine is None:
+            raise ImportError("python-calamine não está instalado")
+        rows: Iterable = _iter_rows_calamine(excel_path)
+    elif engine == "openpyxl":
+        rows = _iter_rows_openpyxl(excel_path)
+    else:
+        raise ValueError(f"Leitor de xlsx desconhecido: {engine}")
+
+    logging.info(f"Leitura em streaming ({engine}) de {excel_path}")
+    rows = iter(rows)
+
+    # Descarta as linhas antes do cabeçalho
+    for _ in islice(rows, header):
+        pass
+
+    header_row = next(rows, None)
+    if header_row is None:
+        return
+
+    columns: List[str] = list(header_row)
+    # Remove colunas vazias ao final do cabeçalho
+    while columns and columns[-1] is None:
+        columns.pop()
+    width = len(columns)
+
+    offset = 0
+    while True:
+        block = [tuple(row[:width]) for row in islice(rows, chunk_size)]
+        if not block:
+            break
+        # Linhas totalmente vazias são ignoradas, como no pd.read_excel
+        block = [row for row in block if any(value is not None for value in row)]
+        if not block:
+            continue
+        # Completa linhas mais curtas que o cabeçalho
+        block = [row + (None,) * (width - len(row)) for row in block]
+        chunk = pd.DataFrame.from_records(block, columns=columns)
+        chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+        offset += len(chunk)
+        yield chunk
@@ -1,120 +1,167 @@
-from typing import Dict
+from typing import Dict, Optional
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
 
-def diagnose_dates(df: pd.DataFrame, date_column_index: int) -> Dict:
+# Formato de data/hora usado nas exportações do SAM
+SAM_DATE_FORMAT = "%d/%m/%Y %H:%M:%S"
+
+
+def _string_date_error(date_value: str) -> Optional[str]:
+    """Repete a verificação escalar original para uma string de data."""
+    try:
+        pd.to_datetime(date_value, dayfirst=True)
+        pd.to_datetime(date_value)
+    except Exception as e:
+        return f"Erro na conversão: {str(e)}"
+    return None
+
+
+def _range_error(date_value, min_date, max_date) -> Optional[str]:
+    """Verifica o intervalo de uma data individual (usado só no caminho lento)."""
+    try:
+        if not (min_date <= date_value <= max_date):
+            return "Data fora do intervalo esperado"
+    except Exception as e:
+        return f"Erro não esperado: {str(e)}"
+    return None
+
+
+def diagnose_dates(
+    df: pd.DataFrame, date_column_index: int, max_details: Optional[int] = 20
+) -> Dict:
     """
     Diagnostica problemas com datas em um DataFrame.
 
+    A classificação (nulo, conversão, tipo, intervalo) é feita com máscaras
+    sobre a coluna inteira; apenas strings fora do formato do SAM são
+    verificadas individualmente. Os dados da linha são montados somente
+    para os primeiros max_details problemas.
+
     Args:
         df: DataFrame com os dados
         date_column_index: índice da coluna de data
+        max_details: quantidade máxima de linhas detalhadas (None para todas)
 
     Returns:
         Dict com informações de diagnóstico
         {
             'total_rows': número total de linhas,
-            'problematic_rows': lista de dicionários com detalhes dos problemas,
+            'problematic_rows': lista (limitada) com detalhes dos problemas,
             'error_count': número total de erros,
             'error_details': detalhamento dos tipos de erro
         }
     """
-    problematic_rows = []
+    values = df.iloc[:, date_column_index]
+    total_rows = len(values)
+    reasons = np.full(total_rows, None, dtype=object)
 
-    for idx, row in df.iterrows():
-        date_value = row.iloc[date_column_index]
-        try:
-            # Verifica valores nulos
-            if pd.isna(date_value):
-                problematic_rows.append(
-                    {
-                        "index": idx,
-                        "value": date_value,
-                        "reason": "Valor nulo ou NaN",
-                        "row_data": row.to_dict(),
-                    }
-                )
-            # Verifica strings que deveriam ser datas
-            elif isinstance(date_value, str):
-                try:
-                    pd.to_datetime(date_value, dayfirst=True)
-                    pd.to_datetime(date_value)
-                except Exception as e:
-                    problematic_rows.append(
-                        {
-                            "index": idx,
-                            "value": date_value,
-                            "reason": f"Erro na conversão: {str(e)}",
-                            "row_data": row.to_dict(),
-                        }
-                    )
-            # Verifica se é um tipo válido de data
-            elif not isinstance(date_value, (pd.Timestamp, datetime)):
-                problematic_rows.append(
-                    {
-                        "index": idx,
-                        "value": date_value,
-                        "reason": f"Tipo inválido: {type(date_value)}",
-                        "row_data": row.to_dict(),
-                    }
-                )
-            # Verifica se a data está em um intervalo razoável (últimos 30 anos até 1 ano futuro)
-            elif isinstance(date_value, (pd.Timestamp, datetime)):
-                now = pd.Timestamp.now()
-                min_date = now - pd.DateOffset(years=30)
-                max_date = now + pd.DateOffset(years=1)
-
-                if not (min_date <= date_value <= max_date):
-                    problematic_rows.append(
-                        {
-                            "index": idx,
-                            "value": date_value,
-                            "reason": "Data fora do intervalo esperado",
-                            "row_data": row.to_dict(),
-                        }
-                    )
-
-        except Exception as e:
-            problematic_rows.append(
-                {
-                    "index": idx,
-                    "value": date_value,
-                    "reason": f"Erro não esperado: {str(e)}",
-                    "row_data": row.to_dict(),
-                }
+    now = pd.Timestamp.now()
+    min_date = now - pd.DateOffset(years=30)
+    max_date = now + pd.DateOffset(years=1)
+
+    # Verifica valores nulos
+    null_mask = values.isna().to_numpy()
+    reasons[null_mask] = "Valor nulo ou NaN"
+
+    # Classifica o tipo dos valores não nulos
+    if pd.api.types.is_datetime64_any_dtype(values):
+        is_str = np.zeros(total_rows, dtype=bool)
+        is_date = ~null_mask
+    else:
+        kind = pd.api.types.infer_dtype(values, skipna=True)
+        if kind == "string":
+            is_str = ~null_mask
+            is_date = np.zeros(total_rows, dtype=bool)
+        elif kind == "datetime":
+            is_str = np.zeros(total_rows, dtype=bool)
+            is_date = ~null_mask
+        else:
+            objects = values.to_numpy(dtype=object)
+            is_str = ~null_mask & np.fromiter(
+                (isinstance(v, str) for v in objects), bool, total_rows
             )
+            is_date = ~null_mask & np.fromiter(
+                (isinstance(v, (pd.Timestamp, datetime)) for v in objects),
+                bool,
+                total_rows,
+            )
+
+    # Strings: o formato do SAM é validado de uma vez; o restante segue
+    # a verificação escalar original
+    if is_str.any():
+        str_positions = np.flatnonzero(is_str)
+        parsed = pd.to_datetime(
+            values.iloc[str_positions], format=SAM_DATE_FORMAT, errors="coerce"
+        )
+        for pos in str_positions[parsed.isna().to_numpy()]:
+            reasons[pos] = _string_date_error(values.iloc[pos])
+
+    # Tipos inválidos
+    type_positions = np.flatnonzero(~null_mask & ~is_str & ~is_date)
+    if len(type_positions):
+        # Mesmo tipo que o valor teria numa linha do iterrows: escalar NumPy
+        # quando todas as colunas têm o mesmo dtype, objeto Python caso contrário
+        offenders = values.iloc[type_positions]
+        if df.dtypes.nunique() == 1:
+            objects = [offenders.iloc[i] for i in range(len(offenders))]
+        else:
+            objects = offenders.to_numpy(dtype=object)
+        for pos, value in zip(type_positions, objects):
+            reasons[pos] = f"Tipo inválido: {type(value)}"
+
+    # Intervalo razoável (últimos 30 anos até 1 ano futuro)
+    if is_date.any():
+        date_positions = np.flatnonzero(is_date)
+        try:
+            dates = pd.to_datetime(values.iloc[date_positions])
+            out_of_range = ~dates.between(min_date, max_date).to_numpy()
+            reasons[date_positions[out_of_range]] = "Data fora do intervalo esperado"
+        except Exception:
+            # Datas com fuso ou fora dos limites do Timestamp
+            for pos in date_positions:
+                reasons[pos] = _range_error(values.iloc[pos], min_date, max_date)
+
+    problem_positions = np.flatnonzero(pd.notna(reasons))
+    detail_positions = (
+        problem_positions if max_details is None else problem_positions[:max_details]
+    )
+    problematic_rows = [
+        {
+            "index": df.index[pos],
+            "value": values.iloc[pos],
+            "reason": reasons[pos],
+            "row_data": df.iloc[pos].to_dict(),
+        }
+        for pos in detail_positions
+    ]
 
     # Agrupa os erros por tipo
+    lowered = pd.Series(reasons[problem_positions], dtype=object).str.lower()
+    keyword_masks = {
+        keyword: lowered.str.contains(keyword, regex=False).to_numpy()
+        for keyword in ["nulo", "conversão", "tipo", "intervalo"]
+    }
     error_types = {
-        "null_count": sum(
-            1 for row in problematic_rows if "nulo" in row["reason"].lower()
-        ),
-        "format_errors": sum(
-            1 for row in problematic_rows if "conversão" in row["reason"].lower()
-        ),
-        "type_errors": sum(
-            1 for row in problematic_rows if "tipo" in row["reason"].lower()
-        ),
-        "range_errors": sum(
-            1 for row in problematic_rows if "intervalo" in row["reason"].lower()
-        ),
-        "other_errors": sum(
-            1
-            for row in problematic_rows
-            if not any(
-                x in row["reason"].lower()
-                for x in ["nulo", "conversão", "tipo", "intervalo"]
-            )
+        "null_count": int(keyword_masks["nulo"].sum()),
+        "format_errors": int(keyword_masks["conversão"].sum()),
+        "type_errors": int(keyword_masks["tipo"].sum()),
+        "range_errors": int(keyword_masks["intervalo"].sum()),
+        "other_errors": int(
+            (~np.logical_or.reduce(list(keyword_masks.values()))).sum()
+            if len(problem_positions)
+            else 0
         ),
     }
 
+    error_count = len(problem_positions)
     return {
-        "total_rows": len(df),
+        "total_rows": total_rows,
         "problematic_rows": problematic_rows,
-        "error_count": len(problematic_rows),
+        "error_count": error_count,
         "error_details": error_types,
-        "error_rate": (len(problematic_rows) / len(df) * 100) if len(df) > 0 else 0,
+        "error_rate": (error_count / total_rows * 100) if total_rows > 0 else 0,
     }
 
 
@@ -3,7 +3,7 @@ import os
 import re
 import logging
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 from pathlib import Path
 
 class FileManager:
@@ -112,6 +112,49 @@ class FileManager:
             logging.error(f"Erro ao buscar arquivo mais recente: {str(e)}")
             raise
 
+    def get_file_datetime(self, file_path: str,
+                          pattern_key: str = 'ssa_pendentes') -> Optional[datetime]:
+        """
+        Extrai a data/hora do snapshot a partir do nome do arquivo.
+        
+        Args:
+            file_path (str): Caminho do arquivo
+            pattern_key (str): Chave do padrão de arquivo
+            
+        Returns:
+            datetime do nome do arquivo ou None se o nome não casar com o padrão
+        """
+        pattern = self.file_patterns.get(pattern_key)
+        if not pattern:
+            raise KeyError(f"Padrão '{pattern_key}' não encontrado")
+        match = pattern.match(Path(file_path).name)
+        return self._convert_to_datetime(match) if match else None
+
+    def list_files(self, pattern_key: str,
+                   subdirectory: Optional[str] = None) -> List[Tuple[datetime, str]]:
+        """
+        Lista todos os arquivos do padrão, do mais antigo para o mais recente.
+        
+        Args:
+            pattern_key (str): Chave do padrão de arquivo ('ssa_pendentes', etc)
+            subdirectory (str, optional): Subdiretório opcional para buscar
+            
+        Returns:
+            Lista de tuplas (data/hora do snapshot, caminho do arquivo)
+        """
+        search_dir = self.base_directory
+        if subdirectory:
+            search_dir = search_dir / subdirectory
+        if not search_dir.exists():
+            raise FileNotFoundError(f"Diretório '{search_dir}' não encontrado")
+
+        files = []
+        for file_path in search_dir.glob("*.xlsx"):
+            file_datetime = self.get_file_datetime(str(file_path), pattern_key)
+            if file_datetime is not None:
+                files.append((file_datetime, str(file_path)))
+        return sorted(files)
+
     def register_pattern(self, key: str, pattern: str):
         """
         Registra um novo padrão de arquivo.
@@ -0,0 +1,297 @@
+# src/utils/metrics.py
+import bisect
+import contextvars
+import functools
+import math
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Limites superiores (le) dos buckets de cada tipo de medida
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+ROWS_BUCKETS = (0, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+BYTES_BUCKETS = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """
+    Histograma de buckets fixos, no formato do Prometheus.
+
+    Guarda só a contagem de cada bucket, a soma e o total de observações,
+    então a memória não cresce com o número de requisições.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = tuple(buckets)
+        # Último bucket: acima do maior limite (+Inf)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Estima um quantil pelo limite superior do bucket que o contém.
+
+        Returns:
+            Limite do bucket (inf se cair acima do maior), ou 0 sem observações
+        """
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.buckets + (math.inf,), self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return bound
+        return math.inf
+
+    def copy(self) -> "Histogram":
+        other = Histogram(self.buckets)
+        other.counts = list(self.counts)
+        other.sum = self.sum
+        other.count = self.count
+        return other
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    items = list(labels) + ([extra] if extra else [])
+    if not items:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in items) + "}"
+
+
+class MetricsRegistry:
+    """
+    Registro de métricas do dashboard (histogramas e contadores).
+
+    As métricas são declaradas uma vez com histogram()/counter() e
+    observadas por rótulos (ex.: callback="update_table"). render() gera o
+    formato texto do Prometheus para a rota /metrics.
+
+    O registro é do processo: com vários workers cada um tem o seu, e
+    const_labels (ex.: pid) identifica de qual worker veio cada série.
+    """
+
+    def __init__(self, const_labels: Optional[Dict[str, object]] = None):
+        """
+        Args:
+            const_labels: Rótulos acrescentados a todas as séries em render()
+        """
+        self.const_labels = self._labels(const_labels or {})
+        self._lock = threading.Lock()
+        self._meta: Dict[str, Tuple[str, str, Optional[Tuple[float, ...]]]] = {}
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+
+    def histogram(
+        self, name: str, help_text: str, buckets: Tuple[float, ...]
+    ) -> None:
+        """Declara um histograma com os buckets informados."""
+        with self._lock:
+            self._meta[name] = ("histogram", help_text, tuple(buckets))
+            self._histograms.setdefault(name, {})
+
+    def counter(self, name: str, help_text: str) -> None:
+        """Declara um contador."""
+        with self._lock:
+            self._meta[name] = ("counter", help_text, None)
+            self._counters.setdefault(name, {})
+
+    @staticmethod
+    def _labels(labels: Dict[str, object]) -> Labels:
+        return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """Registra uma observação em um histograma declarado."""
+        key = self._labels(labels)
+        with self._lock:
+            series = self._histograms[name]
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(self._meta[name][2])
+            histogram.observe(value)
+
+    def inc(self, name: str, amount: float = 1, **labels) -> None:
+        """Incrementa um contador declarado."""
+        key = self._labels(labels)
+        with self._lock:
+            series = self._counters[name]
+            series[key] = series.get(key, 0) + amount
+
+    def histograms(self, name: str) -> Dict[Labels, Histogram]:
+        """Cópia das séries de um histograma (rótulos -> Histogram)."""
+        with self._lock:
+            return {
+                key: histogram.copy()
+                for key, histogram in self._histograms.get(name, {}).items()
+            }
+
+    def counters(self, name: str) -> Dict[Labels, float]:
+        """Cópia das séries de um contador (rótulos -> valor)."""
+        with self._lock:
+            return dict(self._counters.get(name, {}))
+
+    def render(self) -> str:
+        """
+        Gera as métricas no formato texto do Prometheus (versão 0.0.4).
+
+        Returns:
+            Texto com HELP, TYPE e uma linha por série/bucket
+        """
+        lines: List[str] = []
+        with self._lock:
+            for name, (kind, help_text, _) in sorted(self._meta.items()):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                if kind == "counter":
+                    for labels, value in sorted(self._counters[name].items()):
+                        labels = self.const_labels + labels
+                        lines.append(
+                            f"{name}{_format_labels(labels)} {_format_value(value)}"
+                        )
+                    continue
+
+                for labels, histogram in sorted(self._histograms[name].items()):
+                    labels = self.const_labels + labels
+                    cumulative = 0
+                    for bound, count in zip(
+                        histogram.buckets + (math.inf,), histogram.counts
+                    ):
+                        cumulative += count
+                        le = ("le", _format_value(bound))
+                        lines.append(
+                            f"{name}_bucket{_format_labels(labels, le)} {cumulative}"
+                        )
+                    series = _format_labels(labels)
+                    lines.append(f"{name}_sum{series} {_format_value(histogram.sum)}")
+                    lines.append(f"{name}_count{series} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+# Medidas do callback em execução (linhas lidas e acessos ao cache),
+# alimentadas pelo código do dashboard durante a chamada
+_current_call: contextvars.ContextVar = contextvars.ContextVar(
+    "callback_metrics", default=None
+)
+
+
+def record_rows(rows: int) -> None:
+    """Soma linhas lidas ao callback em execução (sem efeito fora dele)."""
+    call = _current_call.get()
+    if call is not None:
+        call["rows"] += rows
+
+
+def record_cache(hit: bool) -> None:
+    """Registra um acerto ou falta de cache no callback em execução."""
+    call = _current_call.get()
+    if call is not None:
+        call["hits" if hit else "misses"] += 1
+
+
+def instrument_callback(
+    func: Callable, name: str, registry: MetricsRegistry
+) -> Callable:
+    """
+    Envolve a função de um callback para medir tempo, linhas, bytes e cache.
+
+    A função envolvida é a registrada pelo Dash, que devolve a resposta já
+    serializada; o tamanho dessa string é o payload enviado ao navegador.
+
+    Args:
+        func: Função do callback
+        name: Nome do callback nos rótulos das métricas
+        registry: Registro com as métricas de register_dashboard_metrics()
+
+    Returns:
+        Função com a mesma assinatura
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        call = {"rows": 0, "hits": 0, "misses": 0}
+        token = _current_call.set(call)
+        start = time.perf_counter()
+        status = "ok"
+        result = None
+        try:
+            result = func(*args, **kwargs)
+            return result
+        except Exception as e:
+            # PreventUpdate é o jeito normal de um callback não responder
+            prevented = type(e).__name__ == "PreventUpdate"
+            status = "prevented" if prevented else "error"
+            raise
+        finally:
+            _current_call.reset(token)
+            elapsed = time.perf_counter() - start
+            registry.observe("dashboard_callback_seconds", elapsed, callback=name)
+            registry.inc(
+                "dashboard_callback_calls_total", callback=name, status=status
+            )
+            registry.observe("dashboard_callback_rows", call["rows"], callback=name)
+            if isinstance(result, (str, bytes)):
+                registry.observe(
+                    "dashboard_callback_response_bytes", len(result), callback=name
+                )
+            for field, result_label in (("hits", "hit"), ("misses", "miss")):
+                if call[field]:
+                    registry.inc(
+                        "dashboard_cache_lookups_total",
+                        call[field],
+                        callback=name,
+                        result=result_label,
+                    )
+
+    return wrapper
+
+
+def register_dashboard_metrics(registry: MetricsRegistry) -> MetricsRegistry:
+    """Declara as métricas usadas pelos callbacks e rotas do dashboard."""
+    registry.histogram(
+        "dashboard_callback_seconds", "Tempo de execução do callback", LATENCY_BUCKETS
+    )
+    registry.histogram(
+        "dashboard_callback_rows", "Linhas lidas pelo callback", ROWS_BUCKETS
+    )
+    registry.histogram(
+        "dashboard_callback_response_bytes",
+        "Tamanho da resposta serializada do callback",
+        BYTES_BUCKETS,
+    )
+    registry.counter(
+        "dashboard_callback_calls_total", "Chamadas de callback por resultado"
+    )
+    registry.counter(
+        "dashboard_cache_lookups_total", "Consultas ao cache de resultados"
+    )
+    registry.histogram(
+        "dashboard_http_request_seconds",
+        "Tempo das requisições HTTP por rota",
+        LATENCY_BUCKETS,
+    )
+    registry.histogram(
+        "dashboard_http_response_bytes",
+        "Tamanho das respostas HTTP por rota",
+        BYTES_BUCKETS,
+    )
+    return registry
@@ -0,0 +1,219 @@
+# src/utils/profiler.py
+import contextvars
+import cProfile
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+try:
+    from pyinstrument import Profiler as PyinstrumentProfiler
+    from pyinstrument.renderers import SpeedscopeRenderer
+except ImportError:  # pyinstrument é opcional: sem ele só há saída pstats
+    PyinstrumentProfiler = None
+    SpeedscopeRenderer = None
+
+FORMATS = ("pstats", "speedscope")
+
+# Limite de chamadas por pedido e de perfis mantidos em log_dir
+MAX_PROFILE_CALLS = 20
+MAX_PROFILE_FILES = 100
+
+# Indica que o callback em execução está sendo perfilado
+_profiling: contextvars.ContextVar = contextvars.ContextVar("profiling", default=False)
+
+
+def is_profiling() -> bool:
+    """Indica se o callback em execução está sendo perfilado."""
+    return _profiling.get()
+
+
+class CallbackProfiler:
+    """
+    Perfila as próximas N chamadas de callbacks escolhidos pelo nome.
+
+    Os pedidos vêm da variável de ambiente SSA_PROFILE_CALLBACKS
+    (ex.: "update_table:5,toggle_modal:2", formato em SSA_PROFILE_FORMAT)
+    ou da página /admin. Cada chamada perfilada gera em log_dir o perfil
+    (.prof do cProfile ou .speedscope.json do pyinstrument) e um .json com
+    o callback, as entradas recebidas, a versão dos dados e o tempo total.
+    Cada pedido vale no máximo MAX_PROFILE_CALLS chamadas e só os max_files
+    perfis mais recentes são mantidos.
+    """
+
+    def __init__(
+        self, log_dir: str = "logs/profiles", max_files: int = MAX_PROFILE_FILES
+    ):
+        self.log_dir = Path(log_dir)
+        self.max_files = max_files
+        self._lock = threading.Lock()
+        # Callback -> [chamadas restantes, formato]
+        self._pending: Dict[str, List] = {}
+
+    @classmethod
+    def from_env(cls, log_dir: str = "logs/profiles") -> "CallbackProfiler":
+        """Cria o profiler já armado com os pedidos das variáveis de ambiente."""
+        profiler = cls(log_dir)
+        fmt = os.environ.get("SSA_PROFILE_FORMAT", "pstats")
+        for item in os.environ.get("SSA_PROFILE_CALLBACKS", "").split(","):
+            name, _, count = item.strip().partition(":")
+            if name:
+                profiler.arm(name, int(count or 1), fmt)
+        return profiler
+
+    def arm(self, name: str, count: int = 1, fmt: str = "pstats") -> None:
+        """
+        Pede o perfil das próximas chamadas de um callback.
+
+        Args:
+            name: Nome do callback (ex.: update_table)
+            count: Quantidade de chamadas perfiladas (até MAX_PROFILE_CALLS)
+            fmt: "pstats" (cProfile) ou "speedscope" (requer pyinstrument)
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Formato de perfil desconhecido: {fmt}")
+        if fmt == "speedscope" and PyinstrumentProfiler is None:
+            logging.warning(
+                "pyinstrument não encontrado - perfil em pstats "
+                "(use: pip install pyinstrument)"
+            )
+            fmt = "pstats"
+        limited = min(max(count, 1), MAX_PROFILE_CALLS)
+        if limited != count:
+            logging.warning(
+                f"Profiling de {name}: {count} chamada(s) fora do limite, "
+                f"usando {limited}"
+            )
+            count = limited
+        with self._lock:
+            self._pending[name] = [count, fmt]
+        logging.info(f"Profiling de {name} armado para {count} chamada(s) ({fmt})")
+
+    def pending(self) -> Dict[str, List]:
+        """Pedidos em aberto: callback -> [chamadas restantes, formato]."""
+        with self._lock:
+            return {name: list(request) for name, request in self._pending.items()}
+
+    def _take(self, name: str) -> Optional[str]:
+        """Consome uma chamada do pedido do callback e retorna o formato."""
+        with self._lock:
+            request = self._pending.get(name)
+            if request is None:
+                return None
+            request[0] -= 1
+            if request[0] <= 0:
+                del self._pending[name]
+            return request[1]
+
+    def recent(self, limit: int = 20) -> List[Path]:
+        """Metadados dos perfis mais recentes."""
+        if not self.log_dir.exists():
+            return []
+        files = sorted(self.log_dir.glob("*.meta.json"), reverse=True)
+        return files[:limit]
+
+    def wrap(self, func: Callable, name: str, version: Callable[[], int]) -> Callable:
+        """
+        Envolve a função de um callback com o profiler.
+
+        Sem pedido em aberto para o callback o custo é uma consulta ao dict.
+        Durante o perfil, is_profiling() fica verdadeiro para que o trabalho
+        normalmente enviado ao pool de threads rode na thread perfilada.
+
+        Args:
+            func: Função do callback
+            name: Nome do callback nos pedidos
+            version: Função que retorna a versão dos dados vigente
+
+        Returns:
+            Função com a mesma assinatura
+        """
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            fmt = self._take(name)
+            if fmt is None:
+                return func(*args, **kwargs)
+
+            data_version = version()
+            # O Dash passa os ids e valores das entradas no callback_context
+            context = kwargs.get("callback_context") or {}
+            specs = list(context.get("inputs_list") or [])
+            specs += list(context.get("states_list") or [])
+            inputs = specs or list(args)
+            token = _profiling.set(True)
+            if fmt == "speedscope":
+                profiler = PyinstrumentProfiler()
+                profiler.start()
+            else:
+                profiler = cProfile.Profile()
+                profiler.enable()
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                if fmt == "speedscope":
+                    profiler.stop()
+                else:
+                    profiler.disable()
+                _profiling.reset(token)
+                self._dump(profiler, fmt, name, inputs, data_version, elapsed)
+
+        return wrapper
+
+    def _dump(self, profiler, fmt, name, inputs, data_version, elapsed) -> None:
+        """Grava o perfil e os metadados da chamada."""
+        try:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            stem = f"{datetime.now():%Y%m%d_%H%M%S_%f}_{name}_v{data_version}"
+            if fmt == "speedscope":
+                profile_path = self.log_dir / f"{stem}.speedscope.json"
+                profile_path.write_text(
+                    profiler.output(renderer=SpeedscopeRenderer()), encoding="utf-8"
+                )
+            else:
+                profile_path = self.log_dir / f"{stem}.prof"
+                profiler.dump_stats(str(profile_path))
+
+            meta = {
+                "callback": name,
+                "inputs": inputs,
+                "data_version": data_version,
+                "seconds": elapsed,
+                "format": fmt,
+                "profile": profile_path.name,
+                "created": datetime.now().isoformat(),
+            }
+            with open(self.log_dir / f"{stem}.meta.json", "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False, indent=2, default=str)
+            logging.info(f"Perfil de {name} gravado em {profile_path} ({elapsed:.3f}s)")
+            self._prune()
+
+        except Exception as e:
+            logging.error(f"Erro ao gravar perfil de {name}: {str(e)}")
+
+    def _prune(self) -> None:
+        """Remove os perfis mais antigos além de max_files (perfil e metadados)."""
+        # Os nomes começam pelo horário da gravação: ordem de nome = cronológica
+        stems = sorted(
+            path.name[: -len(".meta.json")]
+            for path in self.log_dir.glob("*.meta.json")
+        )
+        expired = set(stems[: max(len(stems) - self.max_files, 0)])
+        if not expired:
+            return
+        for path in self.log_dir.iterdir():
+            if any(path.name.startswith(f"{stem}.") for stem in expired):
+                try:
+                    path.unlink()
+                except OSError as e:
+                    logging.warning(f"Erro ao remover perfil antigo {path}: {str(e)}")
+        logging.info(
+            f"{len(expired)} perfil(is) antigo(s) removido(s) de {self.log_dir}"
+        )
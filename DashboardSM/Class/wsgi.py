@@ -0,0 +1,119 @@
+# wsgi.py
+"""
+Execução do dashboard com vários workers (ex.: gunicorn).
+
+Um processo carregador lê as exportações do SAM e publica o dataset
+normalizado no diretório compartilhado (Arrow IPC):
+
+    python wsgi.py
+
+Os workers só mapeiam a versão publicada e acompanham as próximas:
+
+    gunicorn -w 4 -b 0.0.0.0:8080 "wsgi:create_app()"
+
+As colunas de texto ficam no arquivo mapeado (string[pyarrow]),
+compartilhadas entre os workers; cada worker só monta os próprios
+índices, cubo e semanas (ver SharedDataset).
+
+Não use --preload: as threads de recarga de cada worker são criadas em
+create_app() e não sobrevivem ao fork.
+
+/metrics e /admin mostram só o worker que atendeu a requisição: cada um
+tem o seu registro de métricas, com o rótulo pid nas séries. Some por
+rota/callback no Prometheus (ex.: sum without (pid) (...)).
+
+Variáveis de ambiente:
+    SSA_SHARED_DIR: Diretório compartilhado (padrão: shared)
+    SSA_DOWNLOADS_DIR: Pasta das exportações (carregador; padrão: downloads)
+    SSA_RELOAD_INTERVAL: Segundos entre verificações de nova versão (padrão: 30)
+    SSA_ADMIN_TOKEN: Token de acesso remoto a /admin, /metrics e /cache-stats
+        (header X-Admin-Token ou ?token=); sem ele, essas rotas só respondem
+        a 127.0.0.1
+"""
+import logging
+import os
+import sys
+from pathlib import Path
+
+current_dir = Path(__file__).resolve().parent
+sys.path.append(str(current_dir))
+
+from src.dashboard.dashboard_state import DatasetWatcher
+from src.dashboard.ssa_dashboard import SSADashboard
+from src.data.data_loader import DataLoader
+from src.data.shared_dataset import SharedDataset
+from src.utils.file_manager import FileManager
+
+SHARED_DIR = os.environ.get("SSA_SHARED_DIR", "shared")
+DOWNLOADS_DIR = os.environ.get("SSA_DOWNLOADS_DIR", "downloads")
+RELOAD_INTERVAL = float(os.environ.get("SSA_RELOAD_INTERVAL", "30"))
+
+
+def create_app(shared_dir: str = SHARED_DIR):
+    """
+    Cria o dashboard de um worker a partir do dataset compartilhado.
+
+    Args:
+        shared_dir: Diretório onde o carregador publica o dataset
+
+    Returns:
+        Servidor Flask (aplicação WSGI) do dashboard
+    """
+    shared = SharedDataset(shared_dir)
+    manifest = shared.manifest()
+    if manifest is None:
+        raise RuntimeError(
+            f"Nenhum dataset publicado em {shared_dir}; inicie o carregador "
+            "(python wsgi.py) antes dos workers"
+        )
+
+    df = shared.load(manifest)
+    # /metrics é por processo: o pid separa as séries de cada worker
+    dashboard = SSADashboard(
+        df,
+        source_path=manifest["source_path"],
+        version=manifest["version"],
+        metrics_labels={"pid": os.getpid()},
+    )
+    dashboard.start_shared_watcher(shared, interval=RELOAD_INTERVAL)
+    logging.info(
+        f"Worker {os.getpid()} servindo a versão {manifest['version']} "
+        f"({len(df)} SSAs)"
+    )
+    return dashboard.app.server
+
+
+def run_loader(shared_dir: str = SHARED_DIR, downloads_dir: str = DOWNLOADS_DIR):
+    """
+    Processo carregador: publica a exportação mais recente e as seguintes.
+
+    As colunas de baixa cardinalidade vão como Categorical (modo compact),
+    para que os workers compartilhem só códigos inteiros mapeados.
+
+    Args:
+        shared_dir: Diretório compartilhado com os workers
+        downloads_dir: Pasta das exportações do SAM
+    """
+    shared = SharedDataset(shared_dir)
+    file_manager = FileManager(downloads_dir)
+
+    latest_file = file_manager.get_latest_file("ssa_pendentes")
+    loader = DataLoader(latest_file, compact=True)
+    shared.publish(loader.load_data(), latest_file)
+
+    watcher = DatasetWatcher(
+        file_manager,
+        on_load=lambda df, path, diff: shared.publish(df, path),
+        interval=RELOAD_INTERVAL,
+        loader=loader,
+    )
+    watcher.start()
+    watcher.join()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    run_loader()
@@ -0,0 +1,2 @@
+# tests/dashboard_sm/__init__.py
+"""Tests for the DashboardSM/Class dashboard (src.data, src.dashboard, src.utils)."""
@@ -0,0 +1,77 @@
+# tests/dashboard_sm/conftest.py
+"""Fixtures for the DashboardSM/Class tests."""
+
+import logging
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DASHBOARD_ROOT = REPO_ROOT / "DashboardSM" / "Class"
+
+# The dashboard package is also named "src", like the scrapers package at the
+# repo root; importing it here binds "src" to the dashboard before pytest puts
+# the repo root in front of sys.path
+sys.path.insert(0, str(DASHBOARD_ROOT))
+import src  # noqa: E402,F401
+
+SAMPLE_EXPORT = REPO_ROOT / "downloads" / "SSAs Pendentes Geral - 03-12-2024_0344PM.xlsx"
+PREVIOUS_EXPORT = (
+    REPO_ROOT / "downloads" / "SSAs Pendentes Geral - 22-11-2024_0328PM.xlsx"
+)
+
+
+@pytest.fixture
+def sample_export():
+    """Path of a real SAM export committed under downloads/."""
+    if not SAMPLE_EXPORT.exists():
+        pytest.skip("sample export not available")
+    return SAMPLE_EXPORT
+
+
+@pytest.fixture
+def previous_export():
+    """Earlier export: sample_export adds, closes and changes SSAs over it."""
+    if not PREVIOUS_EXPORT.exists():
+        pytest.skip("previous export not available")
+    return PREVIOUS_EXPORT
+
+
+@pytest.fixture(scope="session")
+def sample_frame():
+    """sample_export loaded once, without cache, for tests that only read it."""
+    if not SAMPLE_EXPORT.exists():
+        pytest.skip("sample export not available")
+    from src.data.data_loader import DataLoader
+
+    return DataLoader(str(SAMPLE_EXPORT), cache_dir=None).load_data()
+
+
+@pytest.fixture
+def exports_dir(tmp_path, previous_export, sample_export):
+    """Directory with copies of previous_export and sample_export."""
+    directory = tmp_path / "exports"
+    directory.mkdir()
+    for export in (previous_export, sample_export):
+        shutil.copy(export, directory / export.name)
+    return directory
+
+
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """
+    Runs each test from tmp_path.
+
+    SSADashboard's LogManager appends to ./dashboard_activity.log and adds a
+    handler to the shared "DashboardLogger" on every instance; relative
+    cache/ and logs/ directories land in the working directory too.
+    """
+    monkeypatch.chdir(tmp_path)
+    logger = logging.getLogger("DashboardLogger")
+    handlers = set(logger.handlers)
+    yield
+    for handler in set(logger.handlers) - handlers:
+        logger.removeHandler(handler)
+        handler.close()
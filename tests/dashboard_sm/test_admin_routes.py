@@ -0,0 +1,65 @@
+# tests/dashboard_sm/test_admin_routes.py
+"""Tests for the access restriction of the diagnostic routes."""
+
+import pytest
+
+from src.dashboard.ssa_dashboard import ADMIN_ROUTES, SSADashboard
+
+REMOTE = {"REMOTE_ADDR": "10.0.0.5"}
+
+
+def client(df, token=None):
+    return SSADashboard(df, admin_token=token).app.server.test_client()
+
+
+class TestAdminRoutes:
+    """/cache-stats, /metrics and /admin are loopback-only without a token."""
+
+    @pytest.mark.parametrize("path", ADMIN_ROUTES)
+    def test_loopback_allowed(self, sample_frame, path):
+        assert client(sample_frame).get(path).status_code == 200
+
+    @pytest.mark.parametrize("path", ADMIN_ROUTES)
+    def test_remote_denied_without_token(self, sample_frame, path):
+        assert client(sample_frame).get(path, environ_base=REMOTE).status_code == 403
+
+    def test_proxied_request_is_not_local(self, sample_frame):
+        response = client(sample_frame).get(
+            "/metrics", headers={"X-Forwarded-For": "10.0.0.5"}
+        )
+        assert response.status_code == 403
+
+    def test_remote_with_token(self, sample_frame):
+        app = client(sample_frame, token="s3cret")
+        assert app.get("/admin?token=s3cret", environ_base=REMOTE).status_code == 200
+        assert (
+            app.get(
+                "/metrics", headers={"X-Admin-Token": "s3cret"}, environ_base=REMOTE
+            ).status_code
+            == 200
+        )
+        assert app.get("/admin?token=wrong", environ_base=REMOTE).status_code == 403
+
+    def test_remote_cannot_arm_profiler(self, sample_frame):
+        dashboard = SSADashboard(sample_frame)
+        response = dashboard.app.server.test_client().post(
+            "/admin/profile",
+            data={"callback": "update_table", "count": "5"},
+            environ_base=REMOTE,
+        )
+        assert response.status_code == 403
+        assert dashboard.profiler.pending() == {}
+
+    def test_profile_form_keeps_token(self, sample_frame):
+        dashboard = SSADashboard(sample_frame, admin_token="s3cret")
+        response = dashboard.app.server.test_client().post(
+            "/admin/profile?token=s3cret",
+            data={"callback": "update_table", "count": "5"},
+            environ_base=REMOTE,
+        )
+        assert response.status_code == 302
+        assert response.headers["Location"].endswith("/admin?token=s3cret")
+        assert dashboard.profiler.pending() == {"update_table": [5, "pstats"]}
+
+    def test_dashboard_stays_public(self, sample_frame):
+        assert client(sample_frame).get("/", environ_base=REMOTE).status_code == 200
@@ -0,0 +1,64 @@
+# tests/dashboard_sm/test_backfill.py
+"""Tests for the parallel backfill of old exports into the history."""
+
+import shutil
+from pathlib import Path
+
+from src.data.backfill import backfill_history, find_pending_exports, history_db_path
+from src.data.history_store import SnapshotHistoryStore
+
+# Same content as sample_export under another snapshot date/time
+DUPLICATE_NAME = "SSAs Pendentes Geral - 04-12-2024_0900AM.xlsx"
+
+
+def directories(exports_dir, sample_export, tmp_path):
+    """exports_dir plus a second folder holding a renamed copy of sample_export."""
+    copies = tmp_path / "copias"
+    copies.mkdir()
+    shutil.copy(sample_export, copies / DUPLICATE_NAME)
+    return [str(exports_dir), str(copies)]
+
+
+class TestBackfill:
+    """Backfill skips what is already stored and duplicated content."""
+
+    def test_duplicate_across_directories_is_pending_once(
+        self, exports_dir, sample_export, tmp_path
+    ):
+        dirs = directories(exports_dir, sample_export, tmp_path)
+        pending = find_pending_exports(dirs, str(tmp_path / "store"), ["ssa_pendentes"])
+        names = [Path(item["file_path"]).name for item in pending]
+        assert len(pending) == 2
+        assert DUPLICATE_NAME not in names
+
+    def test_second_run_ingests_nothing(self, exports_dir, sample_export, tmp_path):
+        dirs = directories(exports_dir, sample_export, tmp_path)
+        store_dir = str(tmp_path / "store")
+
+        first = backfill_history(dirs, store_dir=store_dir, cache_dir=None, workers=2)
+        assert first["total"] == first["ingested"] == 2
+        assert first["errors"] == 0
+
+        second = backfill_history(dirs, store_dir=store_dir, cache_dir=None, workers=2)
+        assert second["total"] == 0
+        assert second["ingested"] == 0
+
+        store = SnapshotHistoryStore(history_db_path(store_dir, "ssa_pendentes"))
+        assert len(store.list_snapshots()) == 2
+
+    def test_resumes_after_partial_run(
+        self, exports_dir, previous_export, sample_export, tmp_path
+    ):
+        store_dir = str(tmp_path / "store")
+        # An interrupted run that only stored the older export
+        store = SnapshotHistoryStore(history_db_path(store_dir, "ssa_pendentes"))
+        store.ingest_file(str(exports_dir / previous_export.name))
+
+        summary = backfill_history(
+            [str(exports_dir)], store_dir=store_dir, cache_dir=None, workers=2
+        )
+        assert summary["total"] == summary["ingested"] == 1
+        assert list(store.list_snapshots()["file_name"]) == [
+            previous_export.name,
+            sample_export.name,
+        ]
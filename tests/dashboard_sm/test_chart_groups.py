@@ -0,0 +1,36 @@
+# tests/dashboard_sm/test_chart_groups.py
+"""Tests for the SSAs grouped per chart bar."""
+
+import pytest
+
+from src.dashboard.chart_groups import CHART_COLUMNS, ChartGroups
+from src.data.ssa_columns import SSAColumns
+
+
+class TestChartGroups:
+    """The hover preview agrees with the full SSA list of each bar."""
+
+    @pytest.mark.parametrize("chart_type", sorted(CHART_COLUMNS))
+    def test_preview_matches_ssas(self, sample_frame, chart_type):
+        groups = ChartGroups(sample_frame)
+        categories = sample_frame.iloc[:, CHART_COLUMNS[chart_type]].dropna().unique()
+        assert len(categories) > 0
+        for category in categories:
+            ssas = groups.ssas(chart_type, category)
+            assert groups.preview(chart_type, category) == (len(ssas), ssas[:5])
+
+    def test_preview_by_week_and_priority(self, sample_frame):
+        groups = ChartGroups(sample_frame)
+        week = sample_frame.iloc[0, SSAColumns.SEMANA_CADASTRO]
+        priority = sample_frame.iloc[0, SSAColumns.GRAU_PRIORIDADE_EMISSAO]
+        ssas = groups.ssas("week_registration", week, priority)
+        assert ssas
+        assert groups.preview("week_registration", week, priority, size=2) == (
+            len(ssas),
+            ssas[:2],
+        )
+
+    def test_unknown_category_and_chart(self, sample_frame):
+        groups = ChartGroups(sample_frame)
+        assert groups.preview("state", "NAO_EXISTE") == (0, [])
+        assert groups.preview("week_detail", "202401") is None
@@ -0,0 +1,78 @@
+# tests/dashboard_sm/test_dashboard_outputs.py
+"""Tests for the computed and cached outputs of the dashboard callbacks."""
+
+import pytest
+
+from src.dashboard.ssa_dashboard import SSADashboard
+
+NO_FILTERS = (None, None, None, None)
+
+
+@pytest.fixture
+def dashboard(sample_frame):
+    return SSADashboard(sample_frame)
+
+
+class TestGetOutput:
+    """Outputs come from the result cache or are computed once per view."""
+
+    @pytest.mark.parametrize("name", ["cards", "resp_prog"])
+    def test_miss_and_hit_return_the_same_value(self, dashboard, name):
+        computed = dashboard._get_output(name, dashboard.state, NO_FILTERS)
+        assert dashboard.result_cache.stats()["hits"] == 0
+
+        cached = dashboard._get_output(name, dashboard.state, NO_FILTERS)
+        assert dashboard.result_cache.stats()["hits"] == 1
+        assert type(computed) is type(cached) is dict
+        assert computed == cached
+
+    def test_finished_outputs_leave_the_view(self, dashboard):
+        for name in dashboard.output_names:
+            dashboard._get_output(name, dashboard.state, NO_FILTERS)
+        assert dashboard.state.filtered_view(*NO_FILTERS).outputs == {}
+
+    def test_transient_failure_is_recomputed(self, dashboard, monkeypatch):
+        expected = dashboard._get_output("resp_prog", dashboard.state, NO_FILTERS)
+        dashboard.result_cache.clear()
+
+        build_chart = dashboard._build_chart
+        calls = []
+
+        def flaky_build_chart(chart_type, view, state):
+            if chart_type == "resp_prog":
+                calls.append(chart_type)
+                if len(calls) == 1:
+                    raise RuntimeError("transient")
+            return build_chart(chart_type, view, state)
+
+        monkeypatch.setattr(dashboard, "_build_chart", flaky_build_chart)
+        key = ("resp_prog", *NO_FILTERS, dashboard.state.version)
+
+        failed = dashboard._get_output("resp_prog", dashboard.state, NO_FILTERS)
+        assert failed != expected
+        assert key not in dashboard.result_cache
+
+        retried = dashboard._get_output("resp_prog", dashboard.state, NO_FILTERS)
+        assert len(calls) == 2
+        assert retried == expected
+        assert key in dashboard.result_cache
+
+
+class TestBarKeys:
+    """Bars carry compact keys that resolve to as many SSAs as the bar shows."""
+
+    @pytest.mark.parametrize("chart_type", ["resp_prog", "state", "week_programmed"])
+    def test_keys_resolve_to_bar_counts(self, dashboard, chart_type):
+        state = dashboard.state
+        fig = dashboard._build_chart(
+            chart_type, state.filtered_view(*NO_FILTERS), state
+        )
+        filters = dict.fromkeys(
+            ("resp_prog", "resp_exec", "setor_emissor", "setor_executor")
+        )
+        bars = [trace for trace in fig.data if trace.customdata is not None]
+        assert bars
+        for trace in bars:
+            for key, count in zip(trace.customdata, trace.y):
+                assert list(key[::3]) == [chart_type, state.version]
+                assert len(dashboard._resolve_bar_ssas(list(key), filters)) == count
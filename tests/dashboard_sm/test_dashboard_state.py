@@ -0,0 +1,20 @@
+# tests/dashboard_sm/test_dashboard_state.py
+"""Tests for helpers of the dashboard data versions."""
+
+from src.dashboard.dashboard_state import is_reloader_parent
+
+
+class TestReloaderParent:
+    """The dataset watcher must start once under the Werkzeug reloader."""
+
+    def test_without_debug(self, monkeypatch):
+        monkeypatch.delenv("WERKZEUG_RUN_MAIN", raising=False)
+        assert not is_reloader_parent(False)
+
+    def test_debug_parent(self, monkeypatch):
+        monkeypatch.delenv("WERKZEUG_RUN_MAIN", raising=False)
+        assert is_reloader_parent(True)
+
+    def test_debug_child(self, monkeypatch):
+        monkeypatch.setenv("WERKZEUG_RUN_MAIN", "true")
+        assert not is_reloader_parent(True)
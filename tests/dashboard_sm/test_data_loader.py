@@ -0,0 +1,110 @@
+# tests/dashboard_sm/test_data_loader.py
+"""Tests for DataLoader and its snapshot cache."""
+
+from pathlib import Path
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from src.data import xlsx_stream
+from src.data.data_loader import DataLoader
+from src.data.ssa_columns import SSAColumns
+from src.data.xlsx_stream import STREAM_ENGINES
+
+from .conftest import DASHBOARD_ROOT
+
+
+class TestSnapshotCache:
+    """The cache must be transparent: same frame with or without a hit."""
+
+    def test_cache_hit_returns_same_dtypes(self, sample_export, temp_dir):
+        fresh_loader = DataLoader(str(sample_export), cache_dir=str(temp_dir))
+        fresh = fresh_loader.load_frame()
+        cached_loader = DataLoader(str(sample_export), cache_dir=str(temp_dir))
+        cached = cached_loader.load_frame()
+
+        assert not fresh_loader.loaded_from_cache
+        assert cached_loader.loaded_from_cache
+        assert list(fresh.dtypes) == list(cached.dtypes)
+        pd.testing.assert_frame_equal(fresh, cached)
+
+    def test_emitida_em_is_datetime(self, sample_export):
+        df = DataLoader(str(sample_export), cache_dir=None).load_frame()
+        assert pd.api.types.is_datetime64_any_dtype(
+            df.iloc[:, SSAColumns.EMITIDA_EM]
+        )
+
+    @pytest.mark.parametrize("engine", STREAM_ENGINES)
+    def test_streaming_matches_full_read(self, sample_export, engine):
+        if engine == "calamine" and xlsx_stream.python_calamine is None:
+            pytest.skip("python-calamine not installed")
+        full = DataLoader(str(sample_export), cache_dir=None).load_frame()
+        streamed = DataLoader(
+            str(sample_export),
+            cache_dir=None,
+            streaming=True,
+            chunk_size=50,
+            stream_engine=engine,
+        ).load_frame()
+        assert list(full.dtypes) == list(streamed.dtypes)
+        assert list(streamed.index) == list(range(len(full)))
+
+    def test_default_cache_dir_is_anchored_to_package(self, sample_export, tmp_path):
+        loader = DataLoader(str(sample_export))
+        # The tests run from tmp_path (isolated_cwd): nothing relative to it
+        assert loader.cache.cache_dir == DASHBOARD_ROOT / "cache"
+        assert Path(loader.cache.cache_dir).is_absolute()
+        assert not (tmp_path / "cache").exists()
+
+
+def with_duplicated_ssa(source, target):
+    """Copies an export appending a second row with the first SSA's number."""
+    workbook = openpyxl.load_workbook(source)
+    sheet = workbook.active
+    sheet.append([cell.value for cell in sheet[3]])
+    workbook.save(target)
+    return target
+
+
+class TestReload:
+    """Incremental reload gives the same result as loading from scratch."""
+
+    def test_reload_matches_full_load(self, previous_export, sample_export):
+        loader = DataLoader(str(previous_export), cache_dir=None)
+        loader.load_data()
+        diff = loader.reload(str(sample_export))
+
+        full = DataLoader(str(sample_export), cache_dir=None)
+        full.load_data()
+
+        assert diff is not None and not diff.is_empty
+        assert diff.added and diff.removed and diff.changed
+        pd.testing.assert_frame_equal(loader.df, full.df)
+        assert list(loader.ssa_objects.index) == list(full.ssa_objects.index)
+        assert loader.ssa_objects.to_list() == full.ssa_objects.to_list()
+
+    def test_reload_same_export_is_empty_diff(self, sample_export):
+        loader = DataLoader(str(sample_export), cache_dir=None)
+        loader.load_data()
+        previous = loader.ssa_objects.to_list()
+        diff = loader.reload()
+        assert diff.is_empty
+        assert loader.ssa_objects.to_list() == previous
+
+    def test_duplicated_numbers_fall_back_to_full_reload(
+        self, previous_export, sample_export, tmp_path
+    ):
+        duplicated = with_duplicated_ssa(sample_export, tmp_path / "dup.xlsx")
+        loader = DataLoader(str(previous_export), cache_dir=None)
+        loader.load_data()
+        diff = loader.reload(str(duplicated))
+
+        full = DataLoader(str(duplicated), cache_dir=None)
+        full.load_data()
+
+        assert full.df.iloc[:, SSAColumns.NUMERO_SSA].duplicated().sum() == 1
+        assert diff is None
+        assert loader.last_diff is None
+        assert len(loader.ssa_objects) == len(full.ssa_objects)
+        assert loader.ssa_objects.to_list() == full.ssa_objects.to_list()
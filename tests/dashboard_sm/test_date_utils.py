@@ -0,0 +1,141 @@
+# tests/dashboard_sm/test_date_utils.py
+"""Tests for the vectorized diagnose_dates."""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.date_utils import diagnose_dates
+
+KEYWORDS = {
+    "null_count": "nulo",
+    "format_errors": "conversão",
+    "type_errors": "tipo",
+    "range_errors": "intervalo",
+}
+
+
+def reference_reasons(df, column):
+    """Row-by-row classification of the original iterrows implementation."""
+    reasons = []
+    now = pd.Timestamp.now()
+    min_date = now - pd.DateOffset(years=30)
+    max_date = now + pd.DateOffset(years=1)
+    for idx, row in df.iterrows():
+        value = row.iloc[column]
+        try:
+            if pd.isna(value):
+                reasons.append((idx, "Valor nulo ou NaN"))
+            elif isinstance(value, str):
+                try:
+                    pd.to_datetime(value, dayfirst=True)
+                    pd.to_datetime(value)
+                except Exception as e:
+                    reasons.append((idx, f"Erro na conversão: {str(e)}"))
+            elif not isinstance(value, (pd.Timestamp, datetime)):
+                reasons.append((idx, f"Tipo inválido: {type(value)}"))
+            elif not (min_date <= value <= max_date):
+                reasons.append((idx, "Data fora do intervalo esperado"))
+        except Exception as e:
+            reasons.append((idx, f"Erro não esperado: {str(e)}"))
+    return reasons
+
+
+def reference_details(reasons):
+    lowered = [reason.lower() for _, reason in reasons]
+    details = {
+        key: sum(keyword in reason for reason in lowered)
+        for key, keyword in KEYWORDS.items()
+    }
+    details["other_errors"] = sum(
+        not any(keyword in reason for keyword in KEYWORDS.values())
+        for reason in lowered
+    )
+    return details
+
+
+def frame(dates):
+    """Date column next to a text column, like the SAM export."""
+    numbers = [f"2024{i:05d}" for i in range(len(dates))]
+    return pd.DataFrame({"numero": numbers, "emitida_em": dates})
+
+
+aware = pd.Timestamp("2024-03-01 10:00", tz="America/Sao_Paulo")
+
+CASES = {
+    "sam_strings": ["01/03/2024 10:00:00", "15/11/2024 08:30:00"],
+    "nulls": [None, np.nan, "01/03/2024 10:00:00", pd.NaT],
+    "bad_format": ["32/13/2024 10:00:00", "ontem", "01/03/2024 10:00:00", ""],
+    "wrong_type": [12345, 3.5, ["01/03/2024"], "01/03/2024 10:00:00"],
+    "out_of_range": [
+        pd.Timestamp("1900-01-01"),
+        pd.Timestamp("2150-01-01"),
+        pd.Timestamp("2024-03-01"),
+    ],
+    "tz_mixed": [aware, pd.Timestamp("2024-03-01"), aware, None],
+    "tz_aware": [aware, aware],
+    "mixed": [
+        None,
+        "ontem",
+        7,
+        pd.Timestamp("1800-01-01"),
+        aware,
+        "01/03/2024 10:00:00",
+        datetime(2024, 3, 1),
+    ],
+}
+
+
+class TestDiagnoseDates:
+    """Same reasons and error_details as the original row-by-row loop."""
+
+    @pytest.mark.parametrize("case", sorted(CASES))
+    def test_matches_row_by_row(self, case):
+        df = frame(pd.Series(CASES[case], dtype=object))
+        expected = reference_reasons(df, 1)
+
+        result = diagnose_dates(df, 1, max_details=None)
+
+        reasons = [(row["index"], row["reason"]) for row in result["problematic_rows"]]
+        assert reasons == expected
+        assert result["error_count"] == len(expected)
+        assert result["error_details"] == reference_details(expected)
+
+    def test_datetime64_column(self):
+        dates = pd.to_datetime(["2024-03-01", None, "1901-01-01"])
+        df = frame(dates)
+        expected = reference_reasons(df, 1)
+        result = diagnose_dates(df, 1, max_details=None)
+        assert result["error_details"] == reference_details(expected)
+        assert result["error_details"]["null_count"] == 1
+        assert result["error_details"]["range_errors"] == 1
+
+    def test_single_dtype_frame_reports_numpy_type(self):
+        # With one dtype, iterrows yields NumPy scalars instead of Python ints
+        df = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+        result = diagnose_dates(df, 1, max_details=None)
+        assert [row["reason"] for row in result["problematic_rows"]] == [
+            reason for _, reason in reference_reasons(df, 1)
+        ]
+
+    def test_max_details_caps_rows_not_counts(self):
+        df = frame(pd.Series([None] * 30 + ["ontem"] * 5, dtype=object))
+        result = diagnose_dates(df, 1, max_details=10)
+
+        assert len(result["problematic_rows"]) == 10
+        assert result["error_count"] == 35
+        assert result["error_details"]["null_count"] == 30
+        assert result["error_details"]["format_errors"] == 5
+        assert result["problematic_rows"][0]["row_data"]["numero"] == "202400000"
+
+    def test_default_cap_and_no_cap(self):
+        df = frame(pd.Series([None] * 25, dtype=object))
+        assert len(diagnose_dates(df, 1)["problematic_rows"]) == 20
+        assert len(diagnose_dates(df, 1, max_details=None)["problematic_rows"]) == 25
+
+    def test_empty_frame(self):
+        result = diagnose_dates(frame(pd.Series([], dtype=object)), 1)
+        assert result["error_count"] == 0
+        assert result["error_rate"] == 0
@@ -0,0 +1,70 @@
+# tests/dashboard_sm/test_history_store.py
+"""Tests for the SQLite history of SAM exports."""
+
+import shutil
+
+import pytest
+
+from src.data.data_loader import DataLoader
+from src.data.history_store import SnapshotHistoryStore
+from src.data.snapshot_cache import SnapshotCache
+from src.data.snapshot_diff import diff_snapshots
+
+# Same content as sample_export under another snapshot date/time
+RENAMED_COPY = "SSAs Pendentes Geral - 04-12-2024_0900AM.xlsx"
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotHistoryStore(str(tmp_path / "history.sqlite"))
+
+
+class TestSnapshotHistoryStore:
+    """Each export is ingested once and read back per SSA or per snapshot."""
+
+    def test_ingest_directory_twice(self, store, exports_dir):
+        assert store.ingest_directory(str(exports_dir)) == 2
+        assert store.ingest_directory(str(exports_dir)) == 0
+
+        snapshots = store.list_snapshots()
+        assert len(snapshots) == 2
+        assert snapshots["taken_at"].is_monotonic_increasing
+        assert list(snapshots["rows"]) == [190, 190]
+
+    def test_same_content_is_skipped_by_sha256(self, store, exports_dir, sample_export):
+        assert store.ingest_file(str(exports_dir / sample_export.name))
+        copy = shutil.copy(sample_export, exports_dir / RENAMED_COPY)
+
+        assert store.has_fingerprint(SnapshotCache.fingerprint(copy)["sha256"])
+        assert not store.ingest_file(str(copy))
+        assert len(store.list_snapshots()) == 1
+
+    def test_ssa_history_is_ordered_by_snapshot(
+        self, store, exports_dir, previous_export, sample_export
+    ):
+        # Newest first: the order of ingestion must not matter
+        store.ingest_file(str(exports_dir / sample_export.name))
+        store.ingest_file(str(exports_dir / previous_export.name))
+
+        diff = diff_snapshots(
+            DataLoader(str(previous_export), cache_dir=None).load_frame(),
+            DataLoader(str(sample_export), cache_dir=None).load_frame(),
+        )
+        numero, (old_state, new_state) = next(iter(diff.state_changed.items()))
+
+        history = store.get_ssa_history(numero)
+        assert history["taken_at"].is_monotonic_increasing
+        assert list(history["situacao"]) == [old_state, new_state]
+
+        assert len(store.get_ssa_history(diff.added[0])) == 1
+        assert len(store.get_ssa_history("nao-existe")) == 0
+
+    def test_counts_over_time(self, store, exports_dir):
+        store.ingest_directory(str(exports_dir))
+        counts = store.get_counts_over_time("situacao")
+        assert counts.index.is_monotonic_increasing
+        assert list(counts.sum(axis=1)) == [190, 190]
+
+    def test_counts_over_time_rejects_unknown_field(self, store):
+        with pytest.raises(ValueError):
+            store.get_counts_over_time("numero; DROP TABLE snapshots")
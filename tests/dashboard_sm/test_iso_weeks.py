@@ -0,0 +1,90 @@
+# tests/dashboard_sm/test_iso_weeks.py
+"""Tests for the ISO week helpers used by the week charts and KPIs."""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from src.data.iso_weeks import (
+    MISSING_WEEK,
+    current_week_ordinal,
+    parse_year_week,
+    week_difference,
+    week_ordinals,
+    weeks_in_year,
+)
+
+
+def ordinal(year, week):
+    return int(week_ordinals(np.array([year]), np.array([week]))[0])
+
+
+class TestWeeksInYear:
+    """ISO years have 52 or 53 weeks."""
+
+    def test_long_years(self):
+        years = np.array([2015, 2020, 2026, 2032])
+        assert list(weeks_in_year(years)) == [53, 53, 53, 53]
+
+    def test_short_years(self):
+        years = np.array([2019, 2021, 2023, 2024, 2025])
+        assert list(weeks_in_year(years)) == [52, 52, 52, 52, 52]
+
+    def test_matches_calendar(self):
+        years = np.arange(1990, 2040)
+        # 28 December is always in the last ISO week of its year
+        expected = [date(int(year), 12, 28).isocalendar()[1] for year in years]
+        assert list(weeks_in_year(years)) == expected
+
+
+class TestWeekOrdinals:
+    """Ordinal differences are week distances, across year boundaries."""
+
+    def test_across_53_week_year(self):
+        # 2020 has week 53: 2020-W52 -> 2020-W53 -> 2021-W01
+        assert ordinal(2020, 53) - ordinal(2020, 52) == 1
+        assert ordinal(2021, 1) - ordinal(2020, 53) == 1
+        assert ordinal(2021, 1) - ordinal(2020, 1) == 53
+
+    def test_across_52_week_year(self):
+        assert ordinal(2024, 1) - ordinal(2023, 52) == 1
+        assert ordinal(2025, 1) - ordinal(2024, 1) == 52
+
+    def test_matches_calendar(self):
+        start = date(2014, 12, 29)
+        mondays = [start + timedelta(weeks=offset) for offset in range(600)]
+        years, weeks = zip(*(monday.isocalendar()[:2] for monday in mondays))
+        ordinals = week_ordinals(np.array(years), np.array(weeks))
+        assert list(np.diff(ordinals)) == [1] * (len(mondays) - 1)
+
+    def test_invalid_year_is_missing(self):
+        assert ordinal(0, 0) == MISSING_WEEK
+
+    def test_current_week(self):
+        today = date(2021, 1, 3)  # Sunday of 2020-W53
+        assert current_week_ordinal(today) == ordinal(2020, 53)
+
+
+class TestParseYearWeek:
+    """YYYYWW values from the export, as text or floats."""
+
+    def test_formats(self):
+        years, weeks = parse_year_week(
+            pd.Series(["202447", 202001.0, " 202053 ", None, "", "abc"])
+        )
+        assert list(years) == [2024, 2020, 2020, 0, 0, 0]
+        assert list(weeks) == [47, 1, 53, 0, 0, 0]
+
+    def test_week_53_only_in_long_years(self):
+        years, weeks = parse_year_week(pd.Series(["202353", "202653", "202400"]))
+        assert list(years) == [0, 2026, 0]
+        assert list(weeks) == [0, 53, 0]
+
+    def test_week_difference(self):
+        years, weeks = parse_year_week(pd.Series(["202052", "202101", None]))
+        ordinals = week_ordinals(years, weeks)
+        end = np.full(3, ordinal(2021, 2), dtype=np.int32)
+        result = week_difference(ordinals, end)
+        assert list(result[:2]) == [3.0, 1.0]
+        assert np.isnan(result[2])
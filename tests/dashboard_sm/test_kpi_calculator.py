@@ -0,0 +1,49 @@
+# tests/dashboard_sm/test_kpi_calculator.py
+"""Tests for the KPI calculations of the dashboard."""
+
+import pandas as pd
+import pytest
+
+from src.dashboard.kpi_calculator import KPICalculator
+from src.data.data_loader import DataLoader
+
+from .conftest import SAMPLE_EXPORT
+
+
+@pytest.fixture(scope="module")
+def calculators():
+    """KPICalculator over the sample export, loaded plain and compact."""
+    if not SAMPLE_EXPORT.exists():
+        pytest.skip("sample export not available")
+    plain = DataLoader(str(SAMPLE_EXPORT), cache_dir=None).load_data()
+    compact = DataLoader(str(SAMPLE_EXPORT), cache_dir=None, compact=True).load_data()
+    return KPICalculator(plain), KPICalculator(compact)
+
+
+class TestCompactMode:
+    """KPI outputs must not depend on how the frame was loaded."""
+
+    @pytest.mark.parametrize(
+        "method", ["calculate_sector_performance", "calculate_weekly_trends"]
+    )
+    def test_frames_match(self, calculators, method):
+        plain, compact = (getattr(calc, method)() for calc in calculators)
+        assert not plain.empty
+        pd.testing.assert_frame_equal(plain, compact)
+
+    def test_group_keys_are_not_categorical(self, calculators):
+        _, compact = calculators
+        sectors = compact.calculate_sector_performance()["setor"]
+        assert not isinstance(sectors.dtype, pd.CategoricalDtype)
+
+    @pytest.mark.parametrize(
+        "method",
+        [
+            "calculate_response_times",
+            "calculate_efficiency_metrics",
+            "get_key_metrics_summary",
+        ],
+    )
+    def test_dicts_match(self, calculators, method):
+        plain, compact = (getattr(calc, method)() for calc in calculators)
+        assert plain == compact
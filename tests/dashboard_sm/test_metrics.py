@@ -0,0 +1,37 @@
+# tests/dashboard_sm/test_metrics.py
+"""Tests for the Prometheus text rendering of the dashboard metrics."""
+
+from src.utils.metrics import MetricsRegistry
+
+
+def registry(**kwargs):
+    metrics = MetricsRegistry(**kwargs)
+    metrics.histogram("latency_seconds", "Latency", (0.1, 1.0))
+    metrics.counter("calls_total", "Calls")
+    metrics.observe("latency_seconds", 0.05, callback="update_table")
+    metrics.observe("latency_seconds", 2.0, callback="update_table")
+    metrics.inc("calls_total", callback="update_table", status="ok")
+    return metrics
+
+
+class TestMetricsRegistry:
+    """render() output, with and without per-process labels."""
+
+    def test_render(self):
+        lines = registry().render().splitlines()
+        assert "# TYPE latency_seconds histogram" in lines
+        assert 'latency_seconds_bucket{callback="update_table",le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{callback="update_table",le="+Inf"} 2' in lines
+        assert 'latency_seconds_count{callback="update_table"} 2' in lines
+        assert 'calls_total{callback="update_table",status="ok"} 1' in lines
+
+    def test_const_labels_on_every_series(self):
+        text = registry(const_labels={"pid": 1234}).render()
+        samples = [line for line in text.splitlines() if not line.startswith("#")]
+        assert samples
+        assert all(line.split("{", 1)[1].startswith('pid="1234",') for line in samples)
+        assert 'calls_total{pid="1234",callback="update_table",status="ok"} 1' in text
+
+    def test_const_labels_do_not_split_series(self):
+        metrics = registry(const_labels={"pid": 1})
+        assert len(metrics.histograms("latency_seconds")) == 1
@@ -0,0 +1,48 @@
+# tests/dashboard_sm/test_profiler.py
+"""Tests for the on-demand callback profiler."""
+
+from src.utils.profiler import MAX_PROFILE_CALLS, CallbackProfiler
+
+
+def _profiled(profiler, calls):
+    func = profiler.wrap(lambda x: x * 2, "update_table", lambda: 1)
+    return [func(i) for i in range(calls)]
+
+
+class TestCallbackProfiler:
+    """Requests are bounded in calls and in files kept on disk."""
+
+    def test_count_is_capped(self, temp_dir):
+        profiler = CallbackProfiler(str(temp_dir))
+        profiler.arm("update_table", 10_000)
+        assert profiler.pending() == {"update_table": [MAX_PROFILE_CALLS, "pstats"]}
+
+    def test_count_below_one_profiles_once(self, temp_dir):
+        profiler = CallbackProfiler(str(temp_dir))
+        profiler.arm("update_table", 0)
+        assert profiler.pending()["update_table"][0] == 1
+
+    def test_from_env_is_capped(self, temp_dir, monkeypatch):
+        monkeypatch.setenv("SSA_PROFILE_CALLBACKS", "update_table:999")
+        profiler = CallbackProfiler.from_env(str(temp_dir))
+        assert profiler.pending()["update_table"][0] == MAX_PROFILE_CALLS
+
+    def test_profiled_calls_write_profile_and_meta(self, temp_dir):
+        profiler = CallbackProfiler(str(temp_dir))
+        profiler.arm("update_table", 2)
+        assert _profiled(profiler, 3) == [0, 2, 4]
+        assert len(list(temp_dir.glob("*.prof"))) == 2
+        assert len(profiler.recent()) == 2
+        assert profiler.pending() == {}
+
+    def test_old_profiles_are_pruned(self, temp_dir):
+        profiler = CallbackProfiler(str(temp_dir), max_files=3)
+        profiler.arm("update_table", 5)
+        _profiled(profiler, 5)
+        metas = sorted(temp_dir.glob("*.meta.json"))
+        profiles = sorted(temp_dir.glob("*.prof"))
+        assert len(metas) == len(profiles) == 3
+        # The newest ones are kept, each profile with its metadata
+        assert [p.name[: -len(".prof")] for p in profiles] == [
+            m.name[: -len(".meta.json")] for m in metas
+        ]
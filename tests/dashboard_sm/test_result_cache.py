@@ -0,0 +1,48 @@
+# tests/dashboard_sm/test_result_cache.py
+"""Tests for the LRU cache of serialized callback outputs."""
+
+from src.dashboard.result_cache import ResultCache
+
+
+class TestResultCache:
+    """Sizes are UTF-8 bytes and the LRU order is respected."""
+
+    def test_size_counts_bytes(self):
+        cache = ResultCache()
+        cache.put("key", {"estado": "Programação"})
+        # '{"estado":"Programação"}': 24 characters, 26 bytes in UTF-8
+        assert cache.stats()["bytes"] == 26
+
+    def test_round_trip(self):
+        cache = ResultCache()
+        value = {"data": [{"x": ["Execução"], "y": [3]}]}
+        cache.put(("filtros", 1), value)
+        assert cache.get(("filtros", 1)) == value
+        assert cache.get(("filtros", 2)) is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = ResultCache(max_bytes=60)
+        cache.put("a", {"v": "ç" * 10})
+        cache.put("b", {"v": "ç" * 10})
+        cache.get("a")
+        cache.put("c", {"v": "ç" * 10})
+        assert "a" in cache
+        assert "b" not in cache
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] <= 60
+
+    def test_oversized_entry_is_not_stored(self):
+        # 13 characters but 18 bytes
+        cache = ResultCache(max_bytes=15)
+        cache.put("key", {"v": "ç" * 5})
+        assert "key" not in cache
+
+    def test_put_payload_stores_encoded_value(self):
+        cache = ResultCache()
+        value = {"estado": "Programação"}
+        payload = ResultCache.encode(value)
+        cache.put_payload("key", payload)
+        assert cache.get("key") == value
+        assert cache.stats()["bytes"] == len(payload) == 26
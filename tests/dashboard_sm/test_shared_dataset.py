@@ -0,0 +1,99 @@
+# tests/dashboard_sm/test_shared_dataset.py
+"""Tests for the Arrow dataset shared between the dashboard workers."""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.dashboard.kpi_calculator import KPICalculator
+from src.dashboard.ssa_cube import CUBE_DIMENSIONS, SSACube
+from src.dashboard.ssa_dashboard import SSADashboard
+from src.data.categories import value_counts
+from src.data.data_loader import DataLoader
+from src.data.shared_dataset import SharedDataset, arrow_string_dtype
+from src.data.ssa_columns import SSAColumns
+
+NO_FILTERS = (None, None, None, None)
+
+
+def mapped_ranges(path):
+    """Address ranges of this process mapped from the given file."""
+    ranges = []
+    with open("/proc/self/maps", encoding="utf-8") as maps:
+        for line in maps:
+            fields = line.split(maxsplit=5)
+            if len(fields) == 6 and fields[5].strip() == str(path):
+                start, end = (int(value, 16) for value in fields[0].split("-"))
+                ranges.append((start, end))
+    return ranges
+
+
+@pytest.fixture(params=[False, True], ids=["plain", "compact"])
+def frames(request, sample_export, tmp_path):
+    """(frame as loaded by the DataLoader, same frame published and loaded)."""
+    df = DataLoader(
+        str(sample_export), cache_dir=None, compact=request.param
+    ).load_data()
+    shared = SharedDataset(str(tmp_path / "shared"))
+    shared.publish(df, str(sample_export))
+    return df, shared.load()
+
+
+class TestSharedDataset:
+    """Text stays in the mapped file and the dashboard reads it unchanged."""
+
+    @pytest.mark.skipif(
+        not sys.platform.startswith("linux"), reason="reads /proc/self/maps"
+    )
+    def test_text_buffers_point_into_mapped_file(self, sample_frame, tmp_path):
+        shared = SharedDataset(str(tmp_path / "shared"))
+        manifest = shared.publish(sample_frame)
+        loaded = shared.load(manifest)
+
+        ranges = mapped_ranges(Path(shared.shared_dir / manifest["file"]).resolve())
+        assert ranges
+        text = loaded.iloc[:, SSAColumns.DESC_SSA]
+        assert text.dtype == arrow_string_dtype()
+        for chunk in text.array.__arrow_array__().chunks:
+            offsets, data = chunk.buffers()[1:3]
+            for buffer in (offsets, data):
+                assert any(
+                    start <= buffer.address < end for start, end in ranges
+                )
+
+    def test_round_trip(self, frames):
+        df, loaded = frames
+        assert list(loaded.columns) == list(df.columns)
+        pd.testing.assert_frame_equal(
+            loaded.astype(object).where(loaded.notna(), None),
+            df.astype(object).where(df.notna(), None),
+        )
+
+    def test_cube_and_kpis_match(self, frames):
+        df, loaded = frames
+        cube = SSACube(loaded)
+        for dim, column in CUBE_DIMENSIONS.items():
+            expected = value_counts(df.iloc[:, column])
+            pd.testing.assert_series_equal(cube.counts(dim), expected)
+            pd.testing.assert_series_equal(
+                value_counts(loaded.iloc[:, column]), expected
+            )
+        for method in ("calculate_sector_performance", "calculate_weekly_trends"):
+            pd.testing.assert_frame_equal(
+                getattr(KPICalculator(loaded), method)(),
+                getattr(KPICalculator(df), method)(),
+            )
+
+    def test_dashboard_outputs_match(self, frames):
+        df, loaded = frames
+        dashboards = SSADashboard(df), SSADashboard(loaded)
+        sector = df.iloc[:, SSAColumns.SETOR_EXECUTOR].dropna().iloc[0]
+        for filters in (NO_FILTERS, (None, None, None, sector)):
+            for name in dashboards[0].output_names:
+                expected, actual = (
+                    dashboard._get_output(name, dashboard.state, filters)
+                    for dashboard in dashboards
+                )
+                assert actual == expected, name
@@ -0,0 +1,68 @@
+# tests/dashboard_sm/test_ssa_cube.py
+"""Tests for the count cube and its incremental update."""
+
+import pandas as pd
+import pytest
+
+from src.dashboard.ssa_cube import CUBE_DIMENSIONS, SSACube
+from src.data.categories import value_counts
+from src.data.data_loader import DataLoader
+from src.data.snapshot_diff import diff_snapshots
+from src.data.ssa_columns import SSAColumns
+
+
+def assert_same_cube(updated, rebuilt, df):
+    """Compares every query the dashboard makes on the cube."""
+    assert updated.total == rebuilt.total == len(df)
+    for dim in CUBE_DIMENSIONS:
+        pd.testing.assert_series_equal(updated.counts(dim), rebuilt.counts(dim))
+    for state in df.iloc[:, SSAColumns.SITUACAO].dropna().unique():
+        where = {"situacao": state}
+        assert updated.count(where) == rebuilt.count(where)
+        assert updated.ssas(where) == rebuilt.ssas(where)
+        for dim in ("setor_executor", "resp_prog"):
+            pd.testing.assert_series_equal(
+                updated.counts(dim, where), rebuilt.counts(dim, where)
+            )
+
+
+@pytest.fixture
+def exports(previous_export, sample_export):
+    previous = DataLoader(str(previous_export), cache_dir=None).load_frame()
+    current = DataLoader(str(sample_export), cache_dir=None).load_frame()
+    return previous, current
+
+
+class TestSSACube:
+    """Cube counts match the DataFrame they were built from."""
+
+    def test_counts_match_value_counts(self, sample_frame):
+        cube = SSACube(sample_frame)
+        for dim, column in CUBE_DIMENSIONS.items():
+            pd.testing.assert_series_equal(
+                cube.counts(dim), value_counts(sample_frame.iloc[:, column])
+            )
+
+    def test_updated_matches_rebuild_between_exports(self, exports):
+        previous, current = exports
+        diff = diff_snapshots(previous, current)
+        assert not diff.is_empty
+
+        updated = SSACube(previous).updated(current, diff)
+        assert_same_cube(updated, SSACube(current), current)
+
+    def test_updated_matches_rebuild_with_edits(self, sample_frame):
+        previous = sample_frame
+        # One SSA closed, one changes state, one new SSA with a new sector
+        current = previous.iloc[1:].copy()
+        current.iloc[0, SSAColumns.SITUACAO] = "STE"
+        new = previous.iloc[[2]].copy()
+        new.iloc[0, SSAColumns.NUMERO_SSA] = "2099000001"
+        new.iloc[0, SSAColumns.SETOR_EXECUTOR] = "SETOR NOVO"
+        current = pd.concat([current, new], ignore_index=True)
+        diff = diff_snapshots(previous, current)
+        assert diff.added and diff.removed and diff.changed
+
+        updated = SSACube(previous).updated(current, diff)
+        assert_same_cube(updated, SSACube(current), current)
+        assert updated.count({"setor_executor": "SETOR NOVO"}) == 1
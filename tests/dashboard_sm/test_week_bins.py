@@ -0,0 +1,53 @@
+# tests/dashboard_sm/test_week_bins.py
+"""Tests for the bars of the weeks-in-state chart."""
+
+import numpy as np
+
+from src.dashboard.week_bins import BIN_WIDTH, MAX_SINGLE_WEEKS, WeekBins
+
+
+class TestWeekBins:
+    """One bar per week up to MAX_SINGLE_WEEKS, fixed-width bins above it."""
+
+    def test_single_weeks(self):
+        bins = WeekBins(np.array([3, 1, 3, np.nan, 0]))
+        assert bins.labels == ["0 semanas", "1 semanas", "3 semanas"]
+        assert list(bins.counts) == [1, 1, 2]
+        assert list(bins.positions("3 semanas")) == [0, 2]
+
+    def test_max_multiple_of_ten_is_in_last_bin(self):
+        weeks = np.array([5, 59, 60, 12])
+        bins = WeekBins(weeks)
+        assert bins.labels[-1] == "60-69 semanas"
+        assert list(bins.positions("60-69 semanas")) == [2]
+        assert int(bins.counts.sum()) == len(weeks)
+
+    def test_bins_include_empty_ranges(self):
+        bins = WeekBins(np.array([1, 75]))
+        assert len(bins) == 8
+        assert bins.labels[0] == f"0-{BIN_WIDTH - 1} semanas"
+        assert list(bins.counts) == [1, 0, 0, 0, 0, 0, 0, 1]
+
+    def test_every_row_in_exactly_one_bar(self):
+        rng = np.random.default_rng(0)
+        weeks = rng.integers(0, 200, 1000).astype(float)
+        weeks[::17] = np.nan
+        bins = WeekBins(weeks)
+        members = np.concatenate(bins.members)
+        assert sorted(members) == list(np.flatnonzero(~np.isnan(weeks)))
+        for label, rows in zip(bins.labels, bins.members):
+            start = int(label.split("-")[0])
+            assert ((weeks[rows] >= start) & (weeks[rows] < start + BIN_WIDTH)).all()
+
+    def test_threshold(self):
+        assert WeekBins(np.array([MAX_SINGLE_WEEKS])).labels == [
+            f"{MAX_SINGLE_WEEKS} semanas"
+        ]
+
+    def test_empty(self):
+        bins = WeekBins(np.array([np.nan]))
+        assert len(bins) == 0
+        assert len(bins.positions("0 semanas")) == 0
+
+    def test_unknown_label(self):
+        assert len(WeekBins(np.array([1.0])).positions("99 semanas")) == 0
@@ -0,0 +1,66 @@
+# tests/dashboard_sm/test_xlsx_stream.py
+"""Tests for the chunked xlsx reader used by the streaming load."""
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from src.data import xlsx_stream
+from src.data.xlsx_stream import STREAM_ENGINES, iter_excel_chunks
+
+
+@pytest.fixture(params=STREAM_ENGINES)
+def engine(request):
+    if request.param == "calamine" and xlsx_stream.python_calamine is None:
+        pytest.skip("python-calamine not installed")
+    return request.param
+
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    """Title row, header row and 7 data rows, two of them blank."""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(["Relatório"])
+    sheet.append(["numero", "texto", "valor"])
+    for i in range(7):
+        if i in (2, 3):
+            sheet.append([])
+        else:
+            sheet.append([i, f"x{i}", None if i == 4 else i * 1.5])
+    sheet.append([None, None, None])
+    sheet.append([99, "fim"])
+    path = tmp_path / "export.xlsx"
+    workbook.save(path)
+    return path
+
+
+class TestIterExcelChunks:
+    """Every engine yields the same rows with a continuous index."""
+
+    def test_openpyxl_is_the_default(self, workbook_path, caplog):
+        with caplog.at_level("INFO"):
+            list(iter_excel_chunks(str(workbook_path)))
+        assert "(openpyxl)" in caplog.text
+
+    def test_chunk_index_is_continuous(self, workbook_path, engine):
+        chunks = list(
+            iter_excel_chunks(str(workbook_path), chunk_size=3, engine=engine)
+        )
+        assert len(chunks) > 1
+        index = [position for chunk in chunks for position in chunk.index]
+        assert index == list(range(len(index)))
+
+    def test_blank_rows_are_skipped(self, workbook_path, engine):
+        chunks = list(
+            iter_excel_chunks(str(workbook_path), chunk_size=3, engine=engine)
+        )
+        df = pd.concat(chunks)
+        assert list(df.columns) == ["numero", "texto", "valor"]
+        assert df["texto"].tolist() == ["x0", "x1", "x4", "x5", "x6", "fim"]
+        # Short rows are padded and empty cells come back as missing values
+        assert df["valor"].isna().tolist() == [False, False, True, False, False, True]
+
+    def test_unknown_engine(self, workbook_path):
+        with pytest.raises(ValueError):
+            list(iter_excel_chunks(str(workbook_path), engine="xlrd"))